@@ -16,6 +16,7 @@ from mops.utils.internal_utils import WAIT_EL, WAIT_UNIT
 if TYPE_CHECKING:
     from mops.base.driver_wrapper import DriverWrapper, DriverWrapperSessions
     from mops.base.element import Element
+    from mops.utils.wait_scheduler import WaitScheduler
 
 
 class DriverWrapperABC(ABC):
@@ -46,6 +47,10 @@ class DriverWrapperABC(ABC):
     is_real_device: bool = False
 
     browser_name: Union[str, None] = None
+    wait_scheduler: Union[WaitScheduler, None] = None
+
+    _inner_window_size: Union[Size, None] = None
+    _device_pixel_ratio: Union[float, None] = None
 
     @cached_property
     def is_safari(self) -> bool:
@@ -74,6 +79,17 @@ class DriverWrapperABC(ABC):
         """
         raise NotImplementedError()
 
+    @property
+    def device_pixel_ratio(self) -> float:
+        """
+        Returns the device pixel ratio of the browser: ratio of screenshot pixels to the page pixels.
+        Selenium/Appium: The value is cached until the window size or frame is changed,
+        or until the screenshot size doesn't match it (e.g. after the page zoom).
+
+        :return: :class:`float` - device pixel ratio ~ 1 or 2
+        """
+        raise NotImplementedError()
+
     def quit(self, silent: bool = False, trace_path: str = 'trace.zip'):
         """
         Quit the driver instance.
@@ -248,6 +264,20 @@ class DriverWrapperABC(ABC):
         """
         raise NotImplementedError()
 
+    def execute_async_script(self, script: str, *args) -> Any:
+        """
+        Asynchronously executes JavaScript in the current window or frame and waits for its callback.
+        Compatible with Selenium's `execute_async_script` method: the callback is passed as the last argument
+        and can be reached via ``arguments[arguments.length - 1]``.
+
+        :param script: The JavaScript code to execute.
+        :type script: str
+        :param args: Any arguments to pass to the JavaScript (e.g., Element object or list of Element objects).
+        :type args: list
+        :return: :obj:`typing.Any` - The value passed to the callback.
+        """
+        raise NotImplementedError()
+
     def evaluate(self, expression: str, arg: Any = None) -> Any:
         """
         Playwright only: Synchronously executes JavaScript in the current window or frame.
@@ -311,6 +341,8 @@ class DriverWrapperABC(ABC):
             remove: Union[Any, List[Any]] = None,
             cut_box: CutBox = None,
             hide: Union[Any, List[Any]] = None,
+            ignore: Union[Any, List[Any]] = None,
+            full_page: bool = False,
     ) -> None:
         """
         Asserts that the given screenshot matches the currently taken screenshot.
@@ -339,6 +371,52 @@ class DriverWrapperABC(ABC):
         :param hide: :class:`Element` to hide in the screenshot.
           Can be a single element or a list of elements.
         :type hide: typing.Optional[Element or typing.List[Element]]
+        :param ignore: Regions to be ignored in the comparison, without changes of the page:
+          :class:`Element`, :class:`Box` in pixels of the screenshot or :class:`CutBox` margins of the screenshot.
+          Can be a single region or a list of regions.
+        :type ignore: typing.Optional[Element or Box or CutBox or typing.List[Element or Box or CutBox]]
+        :param full_page: Whether to compare the whole page instead of the viewport.
+          Selenium/Appium: the page is scrolled through and screenshots are stitched together.
+        :type full_page: bool
+        :return: :obj:`None`
+        """
+        raise NotImplementedError()
+
+    def assert_screenshots(
+            self,
+            elements: List[Any],
+            test_name: str = '',
+            name_suffix: str = '',
+            threshold: Union[int, float] = None,
+            delay: Union[int, float] = None,
+            remove: Union[Any, List[Any]] = None,
+            hide: Union[Any, List[Any]] = None,
+    ) -> None:
+        """
+        Asserts screenshots of given elements, cropped from the single screenshot of the viewport.
+        Each :class:`Element` is compared against its own reference,
+        named the same as in :meth:`Element.assert_screenshot`.
+        All mismatches are reported within the single :class:`AssertionError`.
+
+        :param elements: :class:`Element` list to compare. Each element should be visible within the viewport.
+        :type elements: typing.List[Element]
+        :param test_name: The custom test name for generated filenames.
+          If empty - it will be determined automatically.
+        :type test_name: str
+        :param name_suffix: A suffix to add to the filenames.
+        :type name_suffix: str
+        :param threshold: The acceptable threshold for comparing screenshots.
+          If :obj:`None` - takes default threshold or calculate its automatically based on screenshot size.
+        :type threshold: typing.Optional[int or float]
+        :param delay: The delay in seconds before taking the screenshot.
+          If :obj:`None` - takes default delay.
+        :type delay: typing.Optional[int or float]
+        :param remove: :class:`Element` to remove from the screenshot.
+          Can be a single element or a list of elements.
+        :type remove: typing.Optional[Element or typing.List[Element]]
+        :param hide: :class:`Element` to hide in the screenshot.
+          Can be a single element or a list of elements.
+        :type hide: typing.Optional[Element or typing.List[Element]]
         :return: :obj:`None`
         """
         raise NotImplementedError()
@@ -353,6 +431,8 @@ class DriverWrapperABC(ABC):
             remove: Union[Any, List[Any]] = None,
             cut_box: CutBox = None,
             hide: Union[Any, List[Any]] = None,
+            ignore: Union[Any, List[Any]] = None,
+            full_page: bool = False,
     ) -> Tuple[bool, str]:
         """
         Compares the currently taken screenshot to the expected screenshot and returns a result.
@@ -379,6 +459,13 @@ class DriverWrapperABC(ABC):
         :type cut_box: typing.Optional[CutBox]
         :param hide: :class:`Element` to hide in the screenshot.
           Can be a single element or a list of elements.
+        :param ignore: Regions to be ignored in the comparison, without changes of the page:
+          :class:`Element`, :class:`Box` in pixels of the screenshot or :class:`CutBox` margins of the screenshot.
+          Can be a single region or a list of regions.
+        :type ignore: typing.Optional[Element or Box or CutBox or typing.List[Element or Box or CutBox]]
+        :param full_page: Whether to compare the whole page instead of the viewport.
+          Selenium/Appium: the page is scrolled through and screenshots are stitched together.
+        :type full_page: bool
         :return: :class:`typing.Tuple` (:class:`bool`, :class:`str`) - result state and result message
         """
         raise NotImplementedError()
@@ -395,6 +482,16 @@ class DriverWrapperABC(ABC):
         """
         raise NotImplementedError()
 
+    def full_page_screenshot_image(self) -> Image:
+        """
+        Returns a :class:`PIL.Image.Image` object representing the screenshot of the whole web page.
+        Selenium/Appium: The page is scrolled through and viewport screenshots are stitched together,
+        keeping sticky header and footer only at the top and at the bottom of the page.
+
+        :return: :class:`PIL.Image.Image`
+        """
+        raise NotImplementedError()
+
     @property
     def screenshot_base(self) -> bytes:
         """
@@ -623,4 +720,12 @@ class DriverWrapperABC(ABC):
         """
         raise NotImplementedError()
 
+    def _reset_viewport_cache(self) -> None:
+        """
+        Reset cached viewport values: inner window size and device pixel ratio.
+        Called by each method, that may change the viewport: navigation, tabs, frames, contexts and resize
 
+        :return: None
+        """
+        self._inner_window_size = None
+        self._device_pixel_ratio = None
@@ -5,6 +5,7 @@ from typing import Union, Any, List, Tuple, Optional, TYPE_CHECKING
 
 from PIL.Image import Image
 from appium.webdriver.extensions.location import Location
+from mops.mixins.objects.box import Box
 from mops.mixins.objects.cut_box import CutBox
 from mops.mixins.objects.scrolls import ScrollTo, ScrollTypes
 from selenium.webdriver.remote.webelement import WebElement as SeleniumWebElement
@@ -15,6 +16,7 @@ from mops.abstraction.mixin_abc import MixinABC
 from mops.keyboard_keys import KeyboardKeys
 from mops.mixins.objects.size import Size
 from mops.utils.internal_utils import WAIT_EL, QUARTER_WAIT_EL
+from mops.utils.wait_scheduler import WaitScheduler
 
 if TYPE_CHECKING:
     from mops.base.element import Element
@@ -142,14 +144,21 @@ class ElementABC(MixinABC, ABC):
         """
         raise NotImplementedError()
 
-    def wait_visibility(self, *, timeout: int = WAIT_EL, silent: bool = False) -> Element:
+    def wait_visibility(
+            self,
+            *,
+            timeout: int = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> Element:
         """
         Waits until the element becomes visible.
         **Note:** The method requires the use of named arguments.
 
         **Selenium:**
 
-        - Applied :func:`wait_condition` decorator integrates a 0.1 seconds delay for each iteration
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
           during the waiting process.
 
         **Appium:**
@@ -162,18 +171,29 @@ class ElementABC(MixinABC, ABC):
         :type timeout: int
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
         :return: :class:`Element`
         """
         raise NotImplementedError()
 
-    def wait_hidden(self, *, timeout: int = WAIT_EL, silent: bool = False) -> Element:
+    def wait_hidden(
+            self,
+            *,
+            timeout: int = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> Element:
         """
         Waits until the element becomes hidden.
         **Note:** The method requires the use of named arguments.
 
         **Selenium:**
 
-        - Applied :func:`wait_condition` decorator integrates a 0.1 seconds delay for each iteration
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
           during the waiting process.
 
         **Appium:**
@@ -186,18 +206,29 @@ class ElementABC(MixinABC, ABC):
         :type timeout: int
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
         :return: :class:`Element`
         """
         raise NotImplementedError()
 
-    def wait_availability(self, *, timeout: int = WAIT_EL, silent: bool = False) -> Element:
+    def wait_availability(
+            self,
+            *,
+            timeout: int = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> Element:
         """
         Waits until the element becomes available in DOM tree. \n
         **Note:** The method requires the use of named arguments.
 
         **Selenium:**
 
-        - Applied :func:`wait_condition` decorator integrates a 0.1 seconds delay for each iteration
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
           during the waiting process.
 
         **Appium:**
@@ -210,6 +241,10 @@ class ElementABC(MixinABC, ABC):
         :type timeout: int
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
         :return: :class:`Element`
         """
         raise NotImplementedError()
@@ -475,16 +510,18 @@ class ElementABC(MixinABC, ABC):
             expected_count: int,
             *,
             timeout: Union[int, float] = WAIT_EL,
-            silent: bool = False
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
     ) -> Element:
         """
         Wait until the number of matching elements equals the expected count.
 
         **Note:** The method requires the use of named arguments except ``expected_count``.
 
-        **Selenium & Playwright:**
+        **Selenium:**
 
-        - Applied :func:`wait_condition` decorator integrates a 0.1 seconds delay for each iteration
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
           during the waiting process.
 
         **Appium:**
@@ -493,12 +530,20 @@ class ElementABC(MixinABC, ABC):
           (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
           with each iteration during the waiting process.
 
+        **Playwright:**
+
+        - The condition is polled by Playwright auto-waiting, without delays between requests.
+
         :param expected_count: The expected number of elements.
         :type expected_count: int
         :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
         :type timeout: typing.Union[int, float]
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
         :return: :class:`Element`
         """
         raise NotImplementedError()
@@ -508,16 +553,18 @@ class ElementABC(MixinABC, ABC):
             expected_text: Optional[str] = None,
             *,
             timeout: Union[int, float] = WAIT_EL,
-            silent: bool = False
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
     ) -> Element:
         """
         Wait for the presence of a specific text in the current element, or for any non-empty text.
 
         **Note:** The method requires the use of named arguments except ``expected_text``.
 
-        **Selenium & Playwright:**
+        **Selenium:**
 
-        - Applied :func:`wait_condition` decorator integrates a 0.1 seconds delay for each iteration
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
           during the waiting process.
 
         **Appium:**
@@ -526,12 +573,20 @@ class ElementABC(MixinABC, ABC):
           (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
           with each iteration during the waiting process.
 
+        **Playwright:**
+
+        - The condition is polled by Playwright auto-waiting, without delays between requests.
+
         :param expected_text: The text to wait for. :obj:`None` - any text; :class:`str` - expected text.
         :type expected_text: typing.Optional[str]
         :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
         :type timeout: int or float
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
         :return: :class:`Element`
         """
         raise NotImplementedError()
@@ -541,16 +596,18 @@ class ElementABC(MixinABC, ABC):
             expected_value: Optional[str] = None,
             *,
             timeout: Union[int, float] = WAIT_EL,
-            silent: bool = False
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
     ) -> Element:
         """
         Wait for a specific value in the current element, or for any non-empty value.
 
         **Note:** The method requires the use of named arguments except ``expected_value``.
 
-        **Selenium & Playwright:**
+        **Selenium:**
 
-        - Applied :func:`wait_condition` decorator integrates a 0.1 seconds delay for each iteration
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
           during the waiting process.
 
         **Appium:**
@@ -559,12 +616,20 @@ class ElementABC(MixinABC, ABC):
           (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
           with each iteration during the waiting process.
 
+        **Playwright:**
+
+        - The condition is polled by Playwright auto-waiting, without delays between requests.
+
         :param expected_value: The value to waiting for. :obj:`None` - any value; :class:`str` - expected value.
         :type expected_value: typing.Optional[str]
         :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
         :type timeout: int or float
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
         :return: :class:`Element`
         """
         raise NotImplementedError()
@@ -629,15 +694,22 @@ class ElementABC(MixinABC, ABC):
         """
         raise NotImplementedError()
 
-    def wait_enabled(self, *, timeout: Union[int, float] = WAIT_EL, silent: bool = False) -> Element:
+    def wait_enabled(
+            self,
+            *,
+            timeout: Union[int, float] = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> Element:
         """
         Wait for the element to become enabled and/or clickable.
 
         **Note:** The method requires the use of named arguments.
 
-        **Selenium & Playwright:**
+        **Selenium:**
 
-        - Applied :func:`wait_condition` decorator integrates a 0.1 seconds delay for each iteration
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
           during the waiting process.
 
         **Appium:**
@@ -646,23 +718,38 @@ class ElementABC(MixinABC, ABC):
           (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
           with each iteration during the waiting process.
 
+        **Playwright:**
+
+        - The condition is polled by Playwright auto-waiting, without delays between requests.
+
         :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
         :type timeout: int or float
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
         :return: :class:`Element`
         """
         raise NotImplementedError()
 
-    def wait_disabled(self, *, timeout: Union[int, float] = WAIT_EL, silent: bool = False) -> Element:
+    def wait_disabled(
+            self,
+            *,
+            timeout: Union[int, float] = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> Element:
         """
         Wait for the element to become disabled.
 
         **Note:** The method requires the use of named arguments.
 
-        **Selenium & Playwright:**
+        **Selenium:**
 
-        - Applied :func:`wait_condition` decorator integrates a 0.1 seconds delay for each iteration
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
           during the waiting process.
 
         **Appium:**
@@ -671,10 +758,18 @@ class ElementABC(MixinABC, ABC):
           (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
           with each iteration during the waiting process.
 
+        **Playwright:**
+
+        - The condition is polled by Playwright auto-waiting, without delays between requests.
+
         :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
         :type timeout: [int, float]
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
         :return: :class:`Element`
         """
         raise NotImplementedError()
@@ -684,16 +779,18 @@ class ElementABC(MixinABC, ABC):
             expected_size: Size,
             *,
             timeout: Union[int, float] = WAIT_EL,
-            silent: bool = False
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
     ) -> Element:
         """
         Wait until element size will be equal to given :class:`Size` object
 
         **Note:** The method requires the use of named arguments except ``expected_size``.
 
-        **Selenium & Playwright:**
+        **Selenium:**
 
-        - Applied :func:`wait_condition` decorator integrates a 0.1 seconds delay for each iteration
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
           during the waiting process.
 
         **Appium:**
@@ -702,12 +799,20 @@ class ElementABC(MixinABC, ABC):
           (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
           with each iteration during the waiting process.
 
+        **Playwright:**
+
+        - The condition is polled by Playwright auto-waiting, without delays between requests.
+
         :param expected_size: expected element size
         :type expected_size: :class:`Size`
         :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
         :type timeout: int or float
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
         :return: :class:`Element`
         """
         raise NotImplementedError()
@@ -772,6 +877,7 @@ class ElementABC(MixinABC, ABC):
             fill_background: Union[str, bool] = False,
             cut_box: CutBox = None,
             hide: Union[Element, List[Element]] = None,
+            ignore: Union[Element, Box, CutBox, List[Union[Element, Box, CutBox]]] = None,
     ) -> None:
         """
         Asserts that the given screenshot matches the currently taken screenshot.
@@ -805,6 +911,10 @@ class ElementABC(MixinABC, ABC):
         :param hide: :class:`Element` to hide in the screenshot.
           Can be a single element or a list of elements.
         :type hide: typing.Optional[Element or typing.List[Element]]
+        :param ignore: Regions to be ignored in the comparison, without changes of the page:
+          :class:`Element`, :class:`Box` in pixels of the screenshot or :class:`CutBox` margins of the screenshot.
+          Can be a single region or a list of regions.
+        :type ignore: typing.Optional[Element or Box or CutBox or typing.List[Element or Box or CutBox]]
         :return: :obj:`None`
         """
         raise NotImplementedError()
@@ -821,6 +931,7 @@ class ElementABC(MixinABC, ABC):
             fill_background: Union[str, bool] = False,
             cut_box: CutBox = None,
             hide: Union[Element, List[Element]] = None,
+            ignore: Union[Element, Box, CutBox, List[Union[Element, Box, CutBox]]] = None,
     ) -> Tuple[bool, str]:
         """
         Compares the currently taken screenshot to the expected screenshot and returns a result.
@@ -852,6 +963,10 @@ class ElementABC(MixinABC, ABC):
         :type cut_box: typing.Optional[CutBox]
         :param hide: :class:`Element` to hide in the screenshot.
           Can be a single element or a list of elements.
+        :param ignore: Regions to be ignored in the comparison, without changes of the page:
+          :class:`Element`, :class:`Box` in pixels of the screenshot or :class:`CutBox` margins of the screenshot.
+          Can be a single region or a list of regions.
+        :type ignore: typing.Optional[Element or Box or CutBox or typing.List[Element or Box or CutBox]]
         :return: :class:`typing.Tuple` (:class:`bool`, :class:`str`) - result state and result message
         """
         raise NotImplementedError()
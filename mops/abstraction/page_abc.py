@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import Union, TYPE_CHECKING
+from typing import Union, Optional, TYPE_CHECKING
 
 from mops.abstraction.mixin_abc import MixinABC
 from mops.base.element import Element
 from mops.utils.internal_utils import WAIT_PAGE
+from mops.utils.wait_scheduler import WaitScheduler
 
 if TYPE_CHECKING:
     from mops.base.page import Page
@@ -36,17 +37,28 @@ class PageABC(MixinABC, ABC):
         """
         raise NotImplementedError()
 
-    def wait_page_loaded(self, silent: bool = False, timeout: Union[int, float] = WAIT_PAGE) -> Page:
+    def wait_page_loaded(
+            self,
+            silent: bool = False,
+            timeout: Union[int, float] = WAIT_PAGE,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> Page:
         """
         Wait until the page is fully loaded by checking the visibility of the anchor element and other page elements.
 
         Waits for the anchor element to become visible, and depending on the configuration of each page element,
         it waits for either their visibility or to be hidden.
+        All elements are checked together on each iteration under one shared timeout, and all not ready elements
+        are listed in the exception.
+
+        Visibility of all elements is checked within a single script call, by the rules of :meth:`Element.is_displayed`.
 
         :param silent: If :obj:`True`, suppresses logging during the waiting process. Defaults to :obj:`False`.
         :type silent: bool
         :param timeout: The maximum time (in seconds) to wait for the page or elements to load. Defaults to `WAIT_PAGE`.
         :type timeout: Union[int, float]
+        :param scheduler: :class:`WaitScheduler` of this wait. Default: scheduler of the driver wrapper.
+        :type scheduler: typing.Optional[WaitScheduler]
         :return: :obj:`Page` - The current instance of the page object.
         """
         raise NotImplementedError()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from functools import cached_property
 from typing import Union, Type, List, Tuple, Any, TYPE_CHECKING
 
@@ -17,10 +18,11 @@ from mops.playwright.play_driver import PlayDriver
 from mops.selenium.driver.mobile_driver import MobileDriver
 from mops.selenium.driver.web_driver import WebDriver
 from mops.exceptions import DriverWrapperException
-from mops.js_scripts import get_inner_height_js, get_inner_width_js
+from mops.js_scripts import get_inner_window_size_js
 from mops.mixins.internal_mixin import InternalMixin
 from mops.utils.internal_utils import get_attributes_from_object, get_child_elements_with_names
 from mops.utils.logs import Logging, LogLevel
+from mops.utils.wait_scheduler import WaitScheduler
 
 
 if TYPE_CHECKING:
@@ -112,6 +114,7 @@ class DriverWrapper(InternalMixin, Logging, DriverWrapperABC):
     is_real_device: bool = False
 
     browser_name: Union[str, None] = None
+    wait_scheduler: Union[WaitScheduler, None] = None
 
     def __new__(cls, *args, **kwargs):
         if cls.session.sessions_count() == 0:
@@ -181,10 +184,11 @@ class DriverWrapper(InternalMixin, Logging, DriverWrapperABC):
 
         :return: :class:`Size` - An object representing the window's dimensions.
         """
-        return Size(
-            height=self.execute_script(get_inner_height_js),
-            width=self.execute_script(get_inner_width_js)
-        )
+        # Viewport of mobile browsers changes with the address bar, so it is cached for desktop only
+        if self._inner_window_size is None or not self.is_desktop:
+            self._inner_window_size = Size(**self.execute_script(get_inner_window_size_js))
+
+        return replace(self._inner_window_size)
 
     def save_screenshot(
             self,
@@ -226,6 +230,8 @@ class DriverWrapper(InternalMixin, Logging, DriverWrapperABC):
             remove: Union[Any, List[Any]] = None,
             cut_box: CutBox = None,
             hide: Union[Any, List[Any]] = None,
+            ignore: Union[Any, List[Any]] = None,
+            full_page: bool = False,
     ) -> None:
         """
         Asserts that the given screenshot matches the currently taken screenshot.
@@ -254,10 +260,18 @@ class DriverWrapper(InternalMixin, Logging, DriverWrapperABC):
         :param hide: :class:`Element` to hide in the screenshot.
           Can be a single element or a list of elements.
         :type hide: typing.Optional[Element or typing.List[Element]]
+        :param ignore: Regions to be ignored in the comparison, without changes of the page:
+          :class:`Element`, :class:`Box` in pixels of the screenshot or :class:`CutBox` margins of the screenshot.
+          Can be a single region or a list of regions.
+        :type ignore: typing.Optional[Element or Box or CutBox or typing.List[Element or Box or CutBox]]
+        :param full_page: Whether to compare the whole page instead of the viewport.
+          Selenium/Appium: the page is scrolled through and screenshots are stitched together.
+        :type full_page: bool
         :return: :obj:`None`
         """
         delay = delay or VisualComparison.default_delay
         remove = [remove] if type(remove) is not list and remove else remove
+        ignore = [ignore] if type(ignore) is not list and ignore else ignore
 
         if hide:
             if not isinstance(hide, list):
@@ -267,7 +281,59 @@ class DriverWrapper(InternalMixin, Logging, DriverWrapperABC):
 
         VisualComparison(self).assert_screenshot(
             filename=filename, test_name=test_name, name_suffix=name_suffix, threshold=threshold, delay=delay,
-            scroll=False, remove=remove, fill_background=False, cut_box=cut_box
+            scroll=False, remove=remove, fill_background=False, cut_box=cut_box, ignore=ignore,
+            full_page=full_page,
+        )
+
+    def assert_screenshots(
+            self,
+            elements: List[Any],
+            test_name: str = '',
+            name_suffix: str = '',
+            threshold: Union[int, float] = None,
+            delay: Union[int, float] = None,
+            remove: Union[Any, List[Any]] = None,
+            hide: Union[Any, List[Any]] = None,
+    ) -> None:
+        """
+        Asserts screenshots of given elements, cropped from the single screenshot of the viewport.
+        Each :class:`Element` is compared against its own reference,
+        named the same as in :meth:`Element.assert_screenshot`.
+        All mismatches are reported within the single :class:`AssertionError`.
+
+        :param elements: :class:`Element` list to compare. Each element should be visible within the viewport.
+        :type elements: typing.List[Element]
+        :param test_name: The custom test name for generated filenames.
+          If empty - it will be determined automatically.
+        :type test_name: str
+        :param name_suffix: A suffix to add to the filenames.
+        :type name_suffix: str
+        :param threshold: The acceptable threshold for comparing screenshots.
+          If :obj:`None` - takes default threshold or calculate its automatically based on screenshot size.
+        :type threshold: typing.Optional[int or float]
+        :param delay: The delay in seconds before taking the screenshot.
+          If :obj:`None` - takes default delay.
+        :type delay: typing.Optional[int or float]
+        :param remove: :class:`Element` to remove from the screenshot.
+          Can be a single element or a list of elements.
+        :type remove: typing.Optional[Element or typing.List[Element]]
+        :param hide: :class:`Element` to hide in the screenshot.
+          Can be a single element or a list of elements.
+        :type hide: typing.Optional[Element or typing.List[Element]]
+        :return: :obj:`None`
+        """
+        delay = delay or VisualComparison.default_delay
+        remove = [remove] if type(remove) is not list and remove else remove
+
+        if hide:
+            if not isinstance(hide, list):
+                hide = [hide]
+            for object_to_hide in hide:
+                object_to_hide.hide()
+
+        VisualComparison(self).assert_screenshots(
+            elements=elements, test_name=test_name, name_suffix=name_suffix, threshold=threshold, delay=delay,
+            remove=remove
         )
 
     def soft_assert_screenshot(
@@ -280,6 +346,8 @@ class DriverWrapper(InternalMixin, Logging, DriverWrapperABC):
             remove: Union[Any, List[Any]] = None,
             cut_box: CutBox = None,
             hide: Union[Any, List[Any]] = None,
+            ignore: Union[Any, List[Any]] = None,
+            full_page: bool = False,
     ) -> Tuple[bool, str]:
         """
         Compares the currently taken screenshot to the expected screenshot and returns a result.
@@ -306,10 +374,19 @@ class DriverWrapper(InternalMixin, Logging, DriverWrapperABC):
         :type cut_box: typing.Optional[CutBox]
         :param hide: :class:`Element` to hide in the screenshot.
           Can be a single element or a list of elements.
+        :param ignore: Regions to be ignored in the comparison, without changes of the page:
+          :class:`Element`, :class:`Box` in pixels of the screenshot or :class:`CutBox` margins of the screenshot.
+          Can be a single region or a list of regions.
+        :type ignore: typing.Optional[Element or Box or CutBox or typing.List[Element or Box or CutBox]]
+        :param full_page: Whether to compare the whole page instead of the viewport.
+          Selenium/Appium: the page is scrolled through and screenshots are stitched together.
+        :type full_page: bool
         :return: :class:`typing.Tuple` (:class:`bool`, :class:`str`) - result state and result message
         """
         try:
-            self.assert_screenshot(filename, test_name, name_suffix, threshold, delay, remove, cut_box, hide)
+            self.assert_screenshot(
+                filename, test_name, name_suffix, threshold, delay, remove, cut_box, hide, ignore, full_page
+            )
         except AssertionError as exc:
             exc = str(exc)
             self.log(exc, level=LogLevel.ERROR)
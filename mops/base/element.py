@@ -4,7 +4,6 @@ from copy import copy
 from typing import Union, List, Type, Tuple, Optional
 
 from PIL.Image import Image
-from mops.mixins.objects.wait_result import Result
 from playwright.sync_api import Page as PlaywrightDriver
 from appium.webdriver.webdriver import WebDriver as AppiumDriver
 from selenium.common import WebDriverException
@@ -18,9 +17,9 @@ from mops.selenium.elements.mobile_element import MobileElement
 from mops.selenium.elements.web_element import WebElement
 from mops.mixins.driver_mixin import get_driver_wrapper_from_object, DriverMixin
 from mops.mixins.internal_mixin import InternalMixin, get_element_info
+from mops.mixins.objects.box import Box
 from mops.mixins.objects.cut_box import CutBox
 from mops.mixins.objects.locator import Locator
-from mops.mixins.objects.size import Size
 from mops.utils.logs import Logging, LogLevel
 from mops.utils.previous_object_driver import PreviousObjectDriver, set_instance_frame
 from mops.visual_comparison import VisualComparison
@@ -34,7 +33,6 @@ from mops.utils.internal_utils import (
     set_parent_for_attr,
     is_page,
     QUARTER_WAIT_EL,
-    wait_condition,
 )
 
 
@@ -242,238 +240,6 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
                 self.log(f'Ignored exception: "{exception.msg}"')
         return self
 
-    @wait_condition
-    def wait_for_text(
-            self,
-            expected_text: Optional[str] = None,
-            *,
-            timeout: Union[int, float] = WAIT_EL,
-            silent: bool = False
-    ) -> Element:
-        """
-        Wait for the presence of a specific text in the current element, or for any non-empty text.
-
-        **Note:** The method requires the use of named arguments except ``expected_text``.
-
-        **Selenium & Playwright:**
-
-        - Applied :func:`wait_condition` decorator integrates a 0.1 seconds delay for each iteration
-          during the waiting process.
-
-        **Appium:**
-
-        - Applied :func:`wait_condition` decorator integrates an exponential delay
-          (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
-          with each iteration during the waiting process.
-
-        :param expected_text: The text to wait for. :obj:`None` - any text; :class:`str` - expected text.
-        :type expected_text: typing.Optional[str]
-        :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
-        :type timeout: int or float
-        :param silent: If :obj:`True`, suppresses logging.
-        :type silent: bool
-        :return: :class:`Element`
-        """
-        actual_text = self.text
-
-        if expected_text:
-            result = actual_text == expected_text
-            error = f'Not expected text for "{self.name}"'
-            log_msg = f'Wait until text of "{self.name}" will be equal to "{expected_text}"'
-        else:
-            result = actual_text
-            error = f'Text of "{self.name}" is empty'
-            log_msg = f'Wait for any text of "{self.name}"'
-
-        return Result(result, log_msg, UnexpectedTextException(error, actual_text, expected_text))  # noqa
-
-    @wait_condition
-    def wait_for_value(
-            self,
-            expected_value: Optional[str] = None,
-            *,
-            timeout: Union[int, float] = WAIT_EL,
-            silent: bool = False
-    ) -> Element:
-        """
-        Wait for a specific value in the current element, or for any non-empty value.
-
-        **Note:** The method requires the use of named arguments except ``expected_value``.
-
-        **Selenium & Playwright:**
-
-        - Applied :func:`wait_condition` decorator integrates a 0.1 seconds delay for each iteration
-          during the waiting process.
-
-        **Appium:**
-
-        - Applied :func:`wait_condition` decorator integrates an exponential delay
-          (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
-          with each iteration during the waiting process.
-
-        :param expected_value: The value to waiting for. :obj:`None` - any value; :class:`str` - expected value.
-        :type expected_value: typing.Optional[str]
-        :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
-        :type timeout: int or float
-        :param silent: If :obj:`True`, suppresses logging.
-        :type silent: bool
-        :return: :class:`Element`
-        """
-        actual_value = self.value
-
-        if expected_value:
-            result = actual_value == expected_value
-            error = f'Not expected value for "{self.name}"'
-            log_msg = f'Wait until value of "{self.name}" will be equal to "{expected_value}"'
-        else:
-            result = actual_value
-            error = f'Value of "{self.name}" is empty'
-            log_msg = f'Wait for any value inside "{self.name}"'
-
-        return Result(result, log_msg, UnexpectedValueException(error, actual_value, expected_value))  # noqa
-
-    @wait_condition
-    def wait_enabled(self, *, timeout: Union[int, float] = WAIT_EL, silent: bool = False) -> Element:
-        """
-        Wait for the element to become enabled and/or clickable.
-
-        **Note:** The method requires the use of named arguments.
-
-        **Selenium & Playwright:**
-
-        - Applied :func:`wait_condition` decorator integrates a 0.1 seconds delay for each iteration
-          during the waiting process.
-
-        **Appium:**
-
-        - Applied :func:`wait_condition` decorator integrates an exponential delay
-          (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
-          with each iteration during the waiting process.
-
-        :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
-        :type timeout: int or float
-        :param silent: If :obj:`True`, suppresses logging.
-        :type silent: bool
-        :return: :class:`Element`
-        """
-        return Result(  # noqa
-            execution_result=self.is_enabled(silent=True),
-            log=f'Wait until "{self.name}" becomes enabled',
-            exc=TimeoutException(f'"{self.name}" is not enabled', info=self),
-        )
-
-    @wait_condition
-    def wait_disabled(self, *, timeout: Union[int, float] = WAIT_EL, silent: bool = False) -> Element:
-        """
-        Wait for the element to become disabled.
-
-        **Note:** The method requires the use of named arguments.
-
-        **Selenium & Playwright:**
-
-        - Applied :func:`wait_condition` decorator integrates a 0.1 seconds delay for each iteration
-          during the waiting process.
-
-        **Appium:**
-
-        - Applied :func:`wait_condition` decorator integrates an exponential delay
-          (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
-          with each iteration during the waiting process.
-
-        :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
-        :type timeout: [int, float]
-        :param silent: If :obj:`True`, suppresses logging.
-        :type silent: bool
-        :return: :class:`Element`
-        """
-        return Result(  # noqa
-            execution_result=not self.is_enabled(silent=True),
-            log=f'Wait until "{self.name}" becomes disabled',
-            exc=TimeoutException(f'"{self.name}" is not disabled', info=self),
-        )
-
-    @wait_condition
-    def wait_for_size(
-            self,
-            expected_size: Size,
-            *,
-            timeout: Union[int, float] = WAIT_EL,
-            silent: bool = False
-    ) -> Element:
-        """
-        Wait until element size will be equal to given :class:`Size` object
-
-        **Note:** The method requires the use of named arguments except ``expected_size``.
-
-        **Selenium & Playwright:**
-
-        - Applied :func:`wait_condition` decorator integrates a 0.1 seconds delay for each iteration
-          during the waiting process.
-
-        **Appium:**
-
-        - Applied :func:`wait_condition` decorator integrates an exponential delay
-          (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
-          with each iteration during the waiting process.
-
-        :param expected_size: expected element size
-        :type expected_size: :class:`Size`
-        :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
-        :type timeout: int or float
-        :param silent: If :obj:`True`, suppresses logging.
-        :type silent: bool
-        :return: :class:`Element`
-        """
-        actual = self.size
-        is_height_equal = actual.height == expected_size.height if expected_size.height is not None else True
-        is_width_equal = actual.width == expected_size.width if expected_size.width is not None else True
-        return Result(  # noqa
-            execution_result=is_height_equal and is_width_equal,
-            log=f'Wait until "{self.name}" size will be equal to {expected_size}',
-            exc=UnexpectedElementSizeException(f'Unexpected size for "{self.name}"', actual, expected_size),
-        )
-
-    @wait_condition
-    def wait_elements_count(
-            self,
-            expected_count: int,
-            *,
-            timeout: Union[int, float] = WAIT_EL,
-            silent: bool = False
-    ) -> Element:
-        """
-        Wait until the number of matching elements equals the expected count.
-
-        **Note:** The method requires the use of named arguments except ``expected_count``.
-
-        **Selenium & Playwright:**
-
-        - Applied :func:`wait_condition` decorator integrates a 0.1 seconds delay for each iteration
-          during the waiting process.
-
-        **Appium:**
-
-        - Applied :func:`wait_condition` decorator integrates an exponential delay
-          (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
-          with each iteration during the waiting process.
-
-        :param expected_count: The expected number of elements.
-        :type expected_count: int
-        :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
-        :type timeout: typing.Union[int, float]
-        :param silent: If :obj:`True`, suppresses logging.
-        :type silent: bool
-        :return: :class:`Element`
-        """
-        actual_count = self.get_elements_count(silent=True)
-        error_msg = f'Unexpected elements count of "{self.name}"'
-        return Result(  # noqa
-            execution_result=actual_count == expected_count,
-            log=f'Wait until elements count of "{self.name}" will be equal to "{expected_count}"',
-            exc=UnexpectedElementsCountException(error_msg, actual_count, expected_count),
-        )
-
-
     @property
     def all_elements(self) -> List[Element]:
         """
@@ -605,6 +371,7 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
             fill_background: Union[str, bool] = False,
             cut_box: CutBox = None,
             hide: Union[Element, List[Element]] = None,
+            ignore: Union[Element, Box, CutBox, List[Union[Element, Box, CutBox]]] = None,
     ) -> None:
         """
         Asserts that the given screenshot matches the currently taken screenshot.
@@ -638,10 +405,15 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
         :param hide: :class:`Element` to hide in the screenshot.
           Can be a single element or a list of elements.
         :type hide: typing.Optional[Element or typing.List[Element]]
+        :param ignore: Regions to be ignored in the comparison, without changes of the page:
+          :class:`Element`, :class:`Box` in pixels of the screenshot or :class:`CutBox` margins of the screenshot.
+          Can be a single region or a list of regions.
+        :type ignore: typing.Optional[Element or Box or CutBox or typing.List[Element or Box or CutBox]]
         :return: :obj:`None`
         """
         delay = delay or VisualComparison.default_delay
         remove = [remove] if type(remove) is not list and remove else remove
+        ignore = [ignore] if type(ignore) is not list and ignore else ignore
 
         if hide:
             if not isinstance(hide, list):
@@ -651,7 +423,7 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
 
         VisualComparison(self.driver_wrapper, self).assert_screenshot(
             filename=filename, test_name=test_name, name_suffix=name_suffix, threshold=threshold, delay=delay,
-            scroll=scroll, remove=remove, fill_background=fill_background, cut_box=cut_box
+            scroll=scroll, remove=remove, fill_background=fill_background, cut_box=cut_box, ignore=ignore
         )
 
     def soft_assert_screenshot(
@@ -666,6 +438,7 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
             fill_background: Union[str, bool] = False,
             cut_box: CutBox = None,
             hide: Union[Element, List[Element]] = None,
+            ignore: Union[Element, Box, CutBox, List[Union[Element, Box, CutBox]]] = None,
     ) -> Tuple[bool, str]:
         """
         Compares the currently taken screenshot to the expected screenshot and returns a result.
@@ -697,11 +470,16 @@ class Element(DriverMixin, InternalMixin, Logging, ElementABC):
         :type cut_box: typing.Optional[CutBox]
         :param hide: :class:`Element` to hide in the screenshot.
           Can be a single element or a list of elements.
+        :param ignore: Regions to be ignored in the comparison, without changes of the page:
+          :class:`Element`, :class:`Box` in pixels of the screenshot or :class:`CutBox` margins of the screenshot.
+          Can be a single region or a list of regions.
+        :type ignore: typing.Optional[Element or Box or CutBox or typing.List[Element or Box or CutBox]]
         :return: :class:`typing.Tuple` (:class:`bool`, :class:`str`) - result state and result message
         """
         try:
             self.assert_screenshot(
-                filename, test_name, name_suffix, threshold, delay, scroll, remove, fill_background, cut_box, hide
+                filename, test_name, name_suffix, threshold, delay, scroll, remove, fill_background, cut_box, hide,
+                ignore,
             )
         except AssertionError as exc:
             exc = str(exc)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Union, Any, List, Type
+from typing import Union, Any, List, Optional, Type
 
 from playwright.sync_api import Page as PlaywrightDriver
 from appium.webdriver.webdriver import WebDriver as AppiumDriver
@@ -10,16 +10,20 @@ from mops.abstraction.page_abc import PageABC
 from mops.base.driver_wrapper import DriverWrapper
 from mops.base.element import Element
 from mops.playwright.play_page import PlayPage
+from mops.playwright.play_utils import get_elements_visibility as get_play_elements_visibility
+from mops.selenium.sel_utils import get_elements_visibility
 from mops.selenium.pages.mobile_page import MobilePage
 from mops.selenium.pages.web_page import WebPage
-from mops.exceptions import DriverWrapperException
+from mops.exceptions import DriverWrapperException, TimeoutException
 from mops.mixins.driver_mixin import get_driver_wrapper_from_object, DriverMixin
 from mops.mixins.internal_mixin import InternalMixin
 from mops.mixins.objects.locator import Locator
 from mops.utils.logs import Logging
 from mops.utils.previous_object_driver import PreviousObjectDriver, set_instance_frame
+from mops.utils.wait_scheduler import WaitScheduler, get_wait_scheduler
 from mops.utils.internal_utils import (
     WAIT_PAGE,
+    validate_timeout,
     initialize_objects,
     get_child_elements_with_names,
     get_child_elements,
@@ -131,29 +135,61 @@ class Page(DriverMixin, InternalMixin, Logging, PageABC):
         self.wait_page_loaded()
         return self
 
-    def wait_page_loaded(self, silent: bool = False, timeout: Union[int, float] = WAIT_PAGE) -> Page:
+    def wait_page_loaded(
+            self,
+            silent: bool = False,
+            timeout: Union[int, float] = WAIT_PAGE,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> Page:
         """
         Wait until the page is fully loaded by checking the visibility of the anchor element and other page elements.
 
         Waits for the anchor element to become visible, and depending on the configuration of each page element,
         it waits for either their visibility or to be hidden.
+        All elements are checked together on each iteration under one shared timeout, and all not ready elements
+        are listed in the exception.
+
+        Visibility of all elements is checked within a single script call, by the rules of :meth:`Element.is_displayed`.
 
         :param silent: If :obj:`True`, suppresses logging during the waiting process. Defaults to :obj:`False`.
         :type silent: bool
         :param timeout: The maximum time (in seconds) to wait for the page or elements to load. Defaults to `WAIT_PAGE`.
         :type timeout: Union[int, float]
+        :param scheduler: :class:`WaitScheduler` of this wait. Default: scheduler of the driver wrapper.
+        :type scheduler: typing.Optional[WaitScheduler]
         :return: :obj:`Page` - The current instance of the page object.
         """
         if not silent:
             self.log(f'Wait until page "{self.name}" loaded')
 
-        self.anchor.wait_visibility(timeout=timeout, silent=True)
+        validate_timeout(timeout)
+
+        waited_elements = [element for element in self.page_elements if getattr(element, 'wait') in (True, False)]
+        elements = [self.anchor, *waited_elements]
+        expected_states = [True, *(element.wait is True for element in waited_elements)]
+
+        not_ready = []
+
+        def update_not_ready(states: List[bool]) -> None:
+            not_ready[:] = [
+                (element, is_visible)
+                for element, is_visible, state in zip(elements, expected_states, states)
+                if state != is_visible
+            ]
+
+        def check() -> bool:
+            update_not_ready(self._get_elements_visibility(elements))
+            return not not_ready
+
+        get_wait_scheduler(self.driver_wrapper, scheduler).run(check, timeout)
+
+        if not_ready:
+            details = ', '.join(
+                f'"{element.name}" ({"not visible" if is_visible else "still visible"})'
+                for element, is_visible in not_ready
+            )
+            raise TimeoutException(f'Page "{self.name}" is not loaded. Not ready elements: {details}', timeout=timeout)
 
-        for element in self.page_elements:
-            if getattr(element, 'wait') is False:
-                element.wait_hidden(timeout=timeout, silent=True)
-            elif getattr(element, 'wait') is True:
-                element.wait_visibility(timeout=timeout, silent=True)
         return self
 
     def is_page_opened(self, with_elements: bool = False, with_url: bool = False) -> bool:
@@ -166,22 +202,42 @@ class Page(DriverMixin, InternalMixin, Logging, PageABC):
         :type with_url: bool
         :return: :obj:`bool` - `True` if the page is opened, otherwise `False`.
         """
-        result = True
-
         if with_elements:
-            for element in self.page_elements:
-                if getattr(element, 'wait'):
-                    result &= element.is_displayed(silent=True)
-                    if not result:
-                        self.log(f'Element "{element.name}" is not displayed', level='debug')
+            elements = [element for element in self.page_elements if getattr(element, 'wait')]
+            states = self._get_elements_visibility([*elements, self.anchor])
 
-        result &= self.anchor.is_displayed()
+            for element, is_displayed in zip(elements, states):
+                if not is_displayed:
+                    self.log(f'Element "{element.name}" is not displayed', level='debug')
+
+            result = all(states)
+        else:
+            result = self.anchor.is_displayed()
 
         if self.url and with_url:
             result &= self.driver_wrapper.current_url == self.url
 
         return result
 
+    def _get_elements_visibility(self, elements: List[Element]) -> List[bool]:
+        """
+        Get visibility of given elements within a single script call,
+        if all element locators are supported by the browser.
+        Browser side check follows the rules of :meth:`Element.is_displayed` of the current driver
+
+        :param elements: elements to be checked
+        :return: list of visibility states
+        """
+        if self.driver_wrapper.is_playwright:
+            states = get_play_elements_visibility(self.driver_wrapper, elements)
+        else:
+            states = get_elements_visibility(self.driver_wrapper, elements)
+
+        if states is not None:
+            return states
+
+        return [element.is_displayed(silent=True) for element in elements]
+
     def _modify_children(self):
         """
         Initializing of attributes with type == Element.
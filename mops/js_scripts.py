@@ -1,5 +1,6 @@
 get_inner_height_js = 'return window.innerHeight'
 get_inner_width_js = 'return window.innerWidth'
+get_inner_window_size_js = 'return ({height: window.innerHeight, width: window.innerWidth})'
 js_click = 'arguments[0].click();'
 
 get_element_position_on_screen_js = """
@@ -32,34 +33,325 @@ function getSize(elem) {
 return getSize(arguments[0])
 """
 
-delete_element_over_js = """
-const elements = document.getElementsByClassName("driver-wrapper-visual-comparison-support-element");
+get_element_geometry_js = """
+const box = arguments[0].getBoundingClientRect();
+return {
+  x: Math.round(box.left),
+  y: Math.round(box.top),
+  width: Math.round(box.width),
+  height: Math.round(box.height),
+  innerWidth: window.innerWidth,
+  innerHeight: window.innerHeight
+};
+"""
+
+browser_locators_functions_js = """
+function findAll(root, locator) {
+  if (locator.element) {
+    return [locator.element];
+  }
+  if (locator.by === 'xpath') {
+    const snapshot = document.evaluate(locator.value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    return Array.from({length: snapshot.snapshotLength}, (_, index) => snapshot.snapshotItem(index));
+  }
+  return Array.from(root.querySelectorAll(locator.value));
+};
+
+function getElements(locators) {
+  let root = document;
+  for (const locator of locators.slice(0, -1)) {
+    root = findAll(root, locator)[0];
+    if (!root) {
+      return [];
+    }
+  }
+  return findAll(root, locators[locators.length - 1]);
+};
+
+function hasPositiveSize(element) {
+  const rect = element.getBoundingClientRect();
+  if (rect.width > 0 && rect.height > 0) {
+    return true;
+  }
+  return window.getComputedStyle(element).overflow !== 'hidden' && Array.from(element.childNodes).some(
+    node => node.nodeType === Node.TEXT_NODE || (node.nodeType === Node.ELEMENT_NODE && hasPositiveSize(node))
+  );
+};
+
+function isHiddenByOverflow(element) {
+  const rect = element.getBoundingClientRect();
+  if (rect.right + window.scrollX <= 0 || rect.bottom + window.scrollY <= 0) {
+    return true;
+  }
+  for (let parent = element.parentElement; parent && parent !== document.body; parent = parent.parentElement) {
+    const style = window.getComputedStyle(parent);
+    if (/hidden|clip/.test(style.overflowX + style.overflowY)) {
+      const parentRect = parent.getBoundingClientRect();
+      if (rect.right <= parentRect.left || rect.left >= parentRect.right
+        || rect.bottom <= parentRect.top || rect.top >= parentRect.bottom) {
+        return true;
+      }
+    }
+  }
+  return false;
+};
+
+// Follows the rules of Selenium isDisplayed atom: options are shown with their select,
+// and display, visibility, opacity of ancestors, size of children and overflow are taken into account
+function isVisible(element) {
+  const tagName = element.tagName.toUpperCase();
+  if (tagName === 'OPTION' || tagName === 'OPTGROUP') {
+    const select = element.closest('select');
+    return Boolean(select) && isVisible(select);
+  }
+  if (tagName === 'NOSCRIPT' || (tagName === 'INPUT' && element.type.toLowerCase() === 'hidden')) {
+    return false;
+  }
+  if (['hidden', 'collapse'].includes(window.getComputedStyle(element).visibility)) {
+    return false;
+  }
+  for (let node = element; node; node = node.parentElement) {
+    const style = window.getComputedStyle(node);
+    if (style.display === 'none' || style.opacity === '0') {
+      return false;
+    }
+  }
+  return hasPositiveSize(element) && !isHiddenByOverflow(element);
+};
+
+// Follows the rules of Playwright Locator.is_visible: non-empty bounding box and visible computed style
+function isPlaywrightVisible(element) {
+  const style = window.getComputedStyle(element);
+  if (style.display === 'contents') {
+    return Array.from(element.children).some(isPlaywrightVisible);
+  }
+  const rect = element.getBoundingClientRect();
+  return style.visibility === 'visible' && rect.width > 0 && rect.height > 0;
+};
+
+function getAllElements(locators) {
+  let elements = [document];
+  for (const locator of locators) {
+    elements = elements.flatMap(root => findAll(root, locator));
+  }
+  return elements;
+};
+
+function getElementsVisibility(locatorsList, isElementVisible, findElements, missingState) {
+  try {
+    return locatorsList.map(locators => {
+      const element = findElements(locators)[0];
+      return element ? isElementVisible(element) : missingState;
+    });
+  } catch (error) {
+    return null;  // locator isn't supported by the browser
+  }
+};
 
-for (var i=0, max=elements.length; i < max; i++) {
-     elements[0].remove()
+function getElementsRects(locatorsList, findElements) {
+  try {
+    return locatorsList.map(locators => {
+      const element = findElements(locators)[0];
+      if (!element) {
+        return null;
+      }
+      const rect = element.getBoundingClientRect();
+      return {x: rect.left, y: rect.top, width: rect.width, height: rect.height};
+    });
+  } catch (error) {
+    return null;  // locator isn't supported by the browser
+  }
 };
 """
 
-add_element_over_js = """
-function appendElement(given_obj) {
-    given_obj = given_obj.getBoundingClientRect();
-    driver_wrapper_obj = document.createElement("div");
+get_elements_visibility_js = browser_locators_functions_js + """
+return getElementsVisibility(arguments[0], isVisible, getElements, false);
+"""
+
+play_get_elements_visibility_js = '(locatorsList) => {' + browser_locators_functions_js + """
+return getElementsVisibility(locatorsList, isPlaywrightVisible, getAllElements, null);
+}"""
+
+get_elements_rects_js = browser_locators_functions_js + """
+return getElementsRects(arguments[0], getElements);
+"""
+
+play_get_elements_rects_js = '(locatorsList) => {' + browser_locators_functions_js + """
+return getElementsRects(locatorsList, getAllElements);
+}"""
+
+wait_element_condition_js = browser_locators_functions_js + """
+const [locators, condition, expected, timeout] = arguments;
+const callback = arguments[arguments.length - 1];
+
+function normalize(text) {
+  return (text || '').replace(/\\s+/g, ' ').trim();
+};
+
+function isConditionMet() {
+  const elements = getElements(locators);
+  const element = elements[0];
+
+  switch (condition) {
+    case 'available': return Boolean(element);
+    case 'visible': return Boolean(element) && isVisible(element);
+    case 'hidden': return !element || !isVisible(element);
+    case 'count': return elements.length === expected;
+    case 'enabled': return Boolean(element) && !element.matches(':disabled');
+    case 'disabled': return Boolean(element) && element.matches(':disabled');
+    case 'text': return Boolean(element) && (
+      expected ? normalize(element.innerText) === normalize(expected) : Boolean(normalize(element.innerText))
+    );
+    case 'value': return Boolean(element) && (
+      expected ? element.value === expected : Boolean(element.value)
+    );
+    case 'size':
+      if (!element) {
+        return false;
+      }
+      const rect = element.getBoundingClientRect();
+      return (expected.width === null || Math.round(rect.width) === expected.width)
+        && (expected.height === null || Math.round(rect.height) === expected.height);
+  }
+};
+
+let isDone = false;
+const observer = new MutationObserver(() => check());
+const timer = setTimeout(() => finish(false), timeout);
+
+function finish(result) {
+  if (!isDone) {
+    isDone = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    callback(result);
+  }
+};
+
+function check() {
+  try {
+    if (!isDone && isConditionMet()) {
+      finish(true);
+    }
+  } catch (error) {
+    finish(false);
+  }
+};
+
+function loop() {
+  check();
+  if (!isDone) {
+    requestAnimationFrame(loop);
+  }
+};
+
+observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+loop();
+"""
+
+wait_element_size_js = """
+(element, [width, height, timeout]) => new Promise(resolve => {
+  const deadline = Date.now() + timeout;
+  const check = () => {
+    const rect = element.getBoundingClientRect();
+    const isEqual = (width === null || rect.width === width) && (height === null || rect.height === height);
+    if (isEqual || Date.now() >= deadline) {
+      resolve(isEqual);
+    } else {
+      setTimeout(check, 16);
+    }
+  };
+  check();
+})
+"""
+
+get_page_scroll_metrics_js = """
+return {
+  scrollHeight: Math.max(document.body.scrollHeight, document.documentElement.scrollHeight),
+  innerWidth: window.innerWidth,
+  innerHeight: window.innerHeight,
+  scrollX: window.scrollX,
+  scrollY: window.scrollY
+};
+"""
+
+scroll_page_to_js = """
+const callback = arguments[arguments.length - 1];
+window.scrollTo(arguments[0], arguments[1]);
+
+let isDone = false;
+const done = () => { if (!isDone) { isDone = true; callback(window.scrollY); } };
+requestAnimationFrame(() => requestAnimationFrame(done));
+setTimeout(done, 1000);
+"""
+
+visual_mask_class_name = "driver-wrapper-visual-comparison-support-element"
+
+add_visual_mask_js = """
+const [removeElements, fillElement, fillColor] = arguments;
+const callback = arguments[arguments.length - 1];
+const hiddenIndexes = [];
+
+removeElements.forEach((element, index) => {
+    const rect = element.getBoundingClientRect();
+
+    if (!rect.width || !rect.height) {
+        hiddenIndexes.push(index);
+        return;
+    }
+
+    const maskElement = document.createElement("div");
+    maskElement.setAttribute("class", "%s");
+    maskElement.style.zIndex = 9999999;
+    maskElement.style.position = "absolute";
+    maskElement.style.backgroundColor = "#000";
+    maskElement.style.width = rect.width + "px";
+    maskElement.style.height = rect.height + "px";
+    maskElement.style.top = (rect.top + window.scrollY) + "px";
+    maskElement.style.left = (rect.left + window.scrollX) + "px";
+    document.body.appendChild(maskElement);
+});
+
+if (fillElement) {
+    fillElement.style.background = fillColor;
+}
+
+let isDone = false;
+const done = () => { if (!isDone) { isDone = true; callback(hiddenIndexes); } };
+
+// Second animation frame callback is called only after the changes are painted.
+// Animation frames are paused for hidden pages, so timeout is used as a fallback
+requestAnimationFrame(() => requestAnimationFrame(done));
+setTimeout(done, 1000);
+""" % visual_mask_class_name
+
+delete_visual_mask_js = """
+const callback = arguments[arguments.length - 1];
+
+let isDone = false;
+const done = () => { if (!isDone) { isDone = true; callback(true); } };
+
+Array.from(document.getElementsByClassName("%s")).forEach(element => element.remove());
+requestAnimationFrame(() => requestAnimationFrame(done));
+setTimeout(done, 1000);
+""" % visual_mask_class_name
 
-    driver_wrapper_obj.style.zIndex=9999999;
-    driver_wrapper_obj.setAttribute("class","driver-wrapper-comparison-support-element");
 
-    driver_wrapper_obj.style.position = "absolute";
-    driver_wrapper_obj.style.backgroundColor = "#000";
+get_visual_ignore_rects_js = """
+const [origin, elements, isFullPage] = arguments;
+const callback = arguments[arguments.length - 1];
 
-    driver_wrapper_obj.style.width = given_obj.width + "px";
-    driver_wrapper_obj.style.height = given_obj.height + "px";
-    driver_wrapper_obj.style.top = (given_obj.top + window.scrollY) + "px";
-    driver_wrapper_obj.style.left = (given_obj.left + window.scrollX) + "px";
-    
-    document.body.appendChild(driver_wrapper_obj);
+function getRect(element) {
+    const rect = element.getBoundingClientRect();
+    return [rect.x, rect.y, rect.width, rect.height];
 };
 
-return appendElement(arguments[0]);
+callback({
+    origin: origin ? getRect(origin) : [
+        isFullPage ? -window.scrollX : 0, isFullPage ? -window.scrollY : 0, window.innerWidth, window.innerHeight
+    ],
+    rects: elements.map(getRect),
+});
 """
 
 
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class DiffRegion:
+    x: int
+    y: int
+    width: int
+    height: int
+    area: int
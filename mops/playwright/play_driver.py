@@ -13,6 +13,7 @@ from mops.mixins.objects.driver import Driver
 from mops.shared_utils import get_image
 from mops.utils.internal_utils import get_timeout_in_ms, WAIT_UNIT
 from mops.utils.logs import Logging
+from mops.utils.profiler import profile
 
 
 class PlayDriver(Logging, DriverWrapperABC):
@@ -59,6 +60,17 @@ class PlayDriver(Logging, DriverWrapperABC):
         """
         return self.browser_name.lower() == 'firefox'
 
+    @property
+    def device_pixel_ratio(self) -> float:
+        """
+        Returns the device pixel ratio of the browser: ratio of screenshot pixels to the page pixels.
+        Selenium/Appium: The value is cached until the window size or frame is changed,
+        or until the screenshot size doesn't match it (e.g. after the page zoom).
+
+        :return: :class:`float` - device pixel ratio ~ 1 or 2
+        """
+        return self.driver.evaluate('window.devicePixelRatio')
+
     def wait(self, timeout: Union[int, float] = WAIT_UNIT) -> PlayDriver:
         """
         Pauses the execution for a specified amount of time.
@@ -81,6 +93,7 @@ class PlayDriver(Logging, DriverWrapperABC):
         :type silent: bool
         :return: :obj:`PlayDriver` - The current instance of the driver wrapper.
         """
+        self._reset_viewport_cache()
         if not silent:
             self.log(f'Navigating to url {url}')
 
@@ -118,6 +131,7 @@ class PlayDriver(Logging, DriverWrapperABC):
 
         :return: :obj:`PlayDriver` - The current instance of the driver wrapper.
         """
+        self._reset_viewport_cache()
         self.log('Reload current page')
         self.driver.reload()
         return self
@@ -128,6 +142,7 @@ class PlayDriver(Logging, DriverWrapperABC):
 
         :return: :obj:`PlayDriver` - The current instance of the driver wrapper.
         """
+        self._reset_viewport_cache()
         self.log('Going forward')
         self.driver.go_forward()
         return self
@@ -138,6 +153,7 @@ class PlayDriver(Logging, DriverWrapperABC):
 
         :return: :obj:`PlayDriver` - The current instance of the driver wrapper.
         """
+        self._reset_viewport_cache()
         self.log('Going back')
         self.driver.go_back()
         return self
@@ -209,6 +225,7 @@ class PlayDriver(Logging, DriverWrapperABC):
         """
         return self.context.cookies()
 
+    @profile(is_round_trip=True)
     def execute_script(self, script: str, *args) -> Any:
         """
         Synchronously executes JavaScript in the current window or frame.
@@ -232,6 +249,27 @@ class PlayDriver(Logging, DriverWrapperABC):
 
         return self.driver.evaluate(script, args)
 
+    @profile(is_round_trip=True)
+    def execute_async_script(self, script: str, *args) -> Any:
+        """
+        Asynchronously executes JavaScript in the current window or frame and waits for its callback.
+        Compatible with Selenium's `execute_async_script` method: the callback is passed as the last argument
+        and can be reached via ``arguments[arguments.length - 1]``.
+
+        :param script: The JavaScript code to execute.
+        :type script: str
+        :param args: Any arguments to pass to the JavaScript (e.g., Element object or list of Element objects).
+        :type args: list
+        :return: :obj:`typing.Any` - The value passed to the callback.
+        """
+        args = [
+            [self._get_script_arg(item) for item in arg] if isinstance(arg, (list, tuple))
+            else self._get_script_arg(arg)
+            for arg in args
+        ]
+        script = f'arguments => new Promise(resolve => {{ arguments.push(resolve); {script} }})'
+        return self.driver.evaluate(script, args)
+
     def evaluate(self, expression: str, arg: Any = None) -> Any:
         """
         Playwright only: Synchronously executes JavaScript in the current window or frame.
@@ -265,9 +303,11 @@ class PlayDriver(Logging, DriverWrapperABC):
         :type height: int
         :return: :obj:`PlayDriver` - The current instance of the driver wrapper.
         """
+        self._reset_viewport_cache()
         self.driver.set_viewport_size({'width': width, 'height': height})
         return self
 
+    @profile()
     def screenshot_image(self, screenshot_base: bytes = None) -> Image:
         """
         Returns a :class:`PIL.Image.Image` object representing the screenshot of the web page.
@@ -281,7 +321,19 @@ class PlayDriver(Logging, DriverWrapperABC):
         screenshot_base = screenshot_base if screenshot_base else self.screenshot_base
         return get_image(screenshot_base)
 
+    @profile()
+    def full_page_screenshot_image(self) -> Image:
+        """
+        Returns a :class:`PIL.Image.Image` object representing the screenshot of the whole web page.
+        Selenium/Appium: The page is scrolled through and viewport screenshots are stitched together,
+        keeping sticky header and footer only at the top and at the bottom of the page.
+
+        :return: :class:`PIL.Image.Image`
+        """
+        return get_image(self.driver.screenshot(full_page=True))
+
     @property
+    @profile(is_round_trip=True)
     def screenshot_base(self) -> bytes:
         """
         Returns the binary screenshot data of the element.
@@ -305,6 +357,7 @@ class PlayDriver(Logging, DriverWrapperABC):
 
         :return: :obj:`PlayDriver` - The current instance of the driver wrapper, now switched to the new tab.
         """
+        self._reset_viewport_cache()
         with self.context.expect_page() as new_page:
             self.execute_script("window.open(arguments[0], '_blank').focus();", self.current_url)
 
@@ -317,6 +370,7 @@ class PlayDriver(Logging, DriverWrapperABC):
 
         :return: :obj:`PlayDriver` - The current instance of the driver wrapper, now switched to the original tab.
         """
+        self._reset_viewport_cache()
         self.driver = self.original_tab
         self.driver.bring_to_front()
         return self
@@ -329,6 +383,7 @@ class PlayDriver(Logging, DriverWrapperABC):
         :type tab: int
         :return: :obj:`PlayDriver` - The current instance of the driver wrapper, now switched to the specified tab.
         """
+        self._reset_viewport_cache()
         if tab == -1:
             tab = self.get_all_tabs()[tab]
         else:
@@ -345,6 +400,7 @@ class PlayDriver(Logging, DriverWrapperABC):
         :return: :obj:`PlayDriver` - The current instance of the driver wrapper,
           with all tabs except the original closed.
         """
+        self._reset_viewport_cache()
         tabs = self.get_all_tabs()
         tabs.remove(self.original_tab)
 
@@ -370,3 +426,14 @@ class PlayDriver(Logging, DriverWrapperABC):
 
         self.driver.mouse.click(x=x, y=y)
         return self
+
+    @staticmethod
+    def _get_script_arg(arg: Any) -> Any:
+        """
+        Get JavaScript argument, that can be passed to the playwright evaluate
+
+        :param arg: Element object, Locator or any other serializable argument
+        :return: ElementHandle for Element and Locator or given argument
+        """
+        arg = getattr(arg, 'element', arg)
+        return arg.first.element_handle() if isinstance(arg, Locator) else arg
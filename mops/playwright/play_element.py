@@ -2,21 +2,32 @@ from __future__ import annotations
 
 import time
 from abc import ABC
-from typing import Union, List, Any
+import re
+from typing import Union, List, Any, Optional
 
 from PIL.Image import Image
 from mops.keyboard_keys import KeyboardKeys
 from mops.mixins.objects.scrolls import ScrollTo, ScrollTypes
 from playwright.sync_api import TimeoutError as PlayTimeoutError
 from playwright.sync_api import Page as PlaywrightPage
-from playwright.sync_api import Locator, Page, Browser, BrowserContext
+from playwright.sync_api import Locator, Page, Browser, BrowserContext, expect
 
 from mops.mixins.objects.size import Size
 from mops.mixins.objects.location import Location
 from mops.utils.selector_synchronizer import get_platform_locator, get_playwright_locator
 from mops.abstraction.element_abc import ElementABC
-from mops.exceptions import TimeoutException
+from mops.exceptions import (
+    TimeoutException,
+    UnexpectedElementsCountException,
+    UnexpectedElementSizeException,
+    UnexpectedValueException,
+    UnexpectedTextException,
+)
+from mops.js_scripts import wait_element_size_js
 from mops.utils.logs import Logging
+from mops.playwright.play_utils import validate_scheduler
+from mops.utils.profiler import profile
+from mops.utils.wait_scheduler import WaitScheduler
 from mops.shared_utils import cut_log_data, get_image
 from mops.utils.internal_utils import (
     WAIT_EL,
@@ -27,6 +38,20 @@ from mops.utils.internal_utils import (
 )
 
 
+any_text_pattern = re.compile(r'[\s\S]')
+
+
+def get_exact_match_pattern(text: str) -> re.Pattern:
+    """
+    Get pattern of the exact text match for Playwright assertions,
+    that applied without whitespace normalization unlike the string
+
+    :param text: expected text
+    :return: compiled pattern
+    """
+    return re.compile(f'^{re.escape(text)}$')
+
+
 class PlayElement(ElementABC, Logging, ABC):
 
     instance: Browser
@@ -245,14 +270,22 @@ class PlayElement(ElementABC, Logging, ABC):
 
     # Element waits
 
-    def wait_visibility(self, *, timeout: int = WAIT_EL, silent: bool = False) -> PlayElement:
+    @profile(is_round_trip=True)
+    def wait_visibility(
+            self,
+            *,
+            timeout: int = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> PlayElement:
         """
         Waits until the element becomes visible.
         **Note:** The method requires the use of named arguments.
 
         **Selenium:**
 
-        - Applied :func:`wait_condition` decorator integrates a 0.1 seconds delay for each iteration
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
           during the waiting process.
 
         **Appium:**
@@ -265,8 +298,14 @@ class PlayElement(ElementABC, Logging, ABC):
         :type timeout: int
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
         :return: :class:`PlayElement`
         """
+        validate_scheduler(scheduler)
+
         if not silent:
             self.log(f'Wait until "{self.name}" becomes visible')
 
@@ -276,14 +315,22 @@ class PlayElement(ElementABC, Logging, ABC):
             raise TimeoutException(f'"{self.name}" not visible', timeout=timeout, info=self)
         return self
 
-    def wait_hidden(self, *, timeout: int = WAIT_EL, silent: bool = False) -> PlayElement:
+    @profile(is_round_trip=True)
+    def wait_hidden(
+            self,
+            *,
+            timeout: int = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> PlayElement:
         """
         Waits until the element becomes hidden.
         **Note:** The method requires the use of named arguments.
 
         **Selenium:**
 
-        - Applied :func:`wait_condition` decorator integrates a 0.1 seconds delay for each iteration
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
           during the waiting process.
 
         **Appium:**
@@ -296,8 +343,14 @@ class PlayElement(ElementABC, Logging, ABC):
         :type timeout: int
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
         :return: :class:`PlayElement`
         """
+        validate_scheduler(scheduler)
+
         if not silent:
             self.log(f'Wait until "{self.name}" becomes hidden')
         try:
@@ -306,14 +359,22 @@ class PlayElement(ElementABC, Logging, ABC):
             raise TimeoutException(f'"{self.name}" still visible', timeout=timeout, info=self)
         return self
 
-    def wait_availability(self, *, timeout: int = WAIT_EL, silent: bool = False) -> PlayElement:
+    @profile(is_round_trip=True)
+    def wait_availability(
+            self,
+            *,
+            timeout: int = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> PlayElement:
         """
         Waits until the element becomes available in DOM tree. \n
         **Note:** The method requires the use of named arguments.
 
         **Selenium:**
 
-        - Applied :func:`wait_condition` decorator integrates a 0.1 seconds delay for each iteration
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
           during the waiting process.
 
         **Appium:**
@@ -326,8 +387,14 @@ class PlayElement(ElementABC, Logging, ABC):
         :type timeout: int
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
         :return: :class:`PlayElement`
         """
+        validate_scheduler(scheduler)
+
         if not silent:
             self.log(f'Wait until presence of "{self.name}"')
 
@@ -337,6 +404,348 @@ class PlayElement(ElementABC, Logging, ABC):
             raise TimeoutException(f'"{self.name}" not available in DOM', timeout=timeout, info=self)
         return self
 
+    @profile(is_round_trip=True)
+    def wait_for_text(
+            self,
+            expected_text: Optional[str] = None,
+            *,
+            timeout: Union[int, float] = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> PlayElement:
+        """
+        Wait for the presence of a specific text in the current element, or for any non-empty text.
+
+        **Note:** The method requires the use of named arguments except ``expected_text``.
+
+        **Selenium:**
+
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
+          during the waiting process.
+
+        **Appium:**
+
+        - Applied :func:`wait_condition` decorator integrates an exponential delay
+          (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
+          with each iteration during the waiting process.
+
+        **Playwright:**
+
+        - The condition is polled by Playwright auto-waiting, without delays between requests.
+
+        :param expected_text: The text to wait for. :obj:`None` - any text; :class:`str` - expected text.
+        :type expected_text: typing.Optional[str]
+        :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
+        :type timeout: int or float
+        :param silent: If :obj:`True`, suppresses logging.
+        :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
+        :return: :class:`PlayElement`
+        """
+        validate_scheduler(scheduler)
+
+        if expected_text:
+            pattern = get_exact_match_pattern(expected_text)
+            error = f'Not expected text for "{self.name}"'
+            log_msg = f'Wait until text of "{self.name}" will be equal to "{expected_text}"'
+        else:
+            pattern = any_text_pattern
+            error = f'Text of "{self.name}" is empty'
+            log_msg = f'Wait for any text of "{self.name}"'
+
+        if not silent:
+            self.log(log_msg)
+
+        try:
+            expect(self._first_element).to_have_text(pattern, use_inner_text=True, timeout=get_timeout_in_ms(timeout))
+        except AssertionError:
+            actual_text = self.text if self.is_available() else None
+            raise UnexpectedTextException(error, actual_text, expected_text, timeout=timeout)
+        return self
+
+    @profile(is_round_trip=True)
+    def wait_for_value(
+            self,
+            expected_value: Optional[str] = None,
+            *,
+            timeout: Union[int, float] = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> PlayElement:
+        """
+        Wait for a specific value in the current element, or for any non-empty value.
+
+        **Note:** The method requires the use of named arguments except ``expected_value``.
+
+        **Selenium:**
+
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
+          during the waiting process.
+
+        **Appium:**
+
+        - Applied :func:`wait_condition` decorator integrates an exponential delay
+          (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
+          with each iteration during the waiting process.
+
+        **Playwright:**
+
+        - The condition is polled by Playwright auto-waiting, without delays between requests.
+
+        :param expected_value: The value to waiting for. :obj:`None` - any value; :class:`str` - expected value.
+        :type expected_value: typing.Optional[str]
+        :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
+        :type timeout: int or float
+        :param silent: If :obj:`True`, suppresses logging.
+        :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
+        :return: :class:`PlayElement`
+        """
+        validate_scheduler(scheduler)
+
+        if expected_value:
+            pattern = get_exact_match_pattern(expected_value)
+            error = f'Not expected value for "{self.name}"'
+            log_msg = f'Wait until value of "{self.name}" will be equal to "{expected_value}"'
+        else:
+            pattern = any_text_pattern
+            error = f'Value of "{self.name}" is empty'
+            log_msg = f'Wait for any value inside "{self.name}"'
+
+        if not silent:
+            self.log(log_msg)
+
+        try:
+            expect(self._first_element).to_have_value(pattern, timeout=get_timeout_in_ms(timeout))
+        except AssertionError:
+            actual_value = self.value if self.is_available() else None
+            raise UnexpectedValueException(error, actual_value, expected_value, timeout=timeout)
+        return self
+
+    @profile(is_round_trip=True)
+    def wait_enabled(
+            self,
+            *,
+            timeout: Union[int, float] = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> PlayElement:
+        """
+        Wait for the element to become enabled and/or clickable.
+
+        **Note:** The method requires the use of named arguments.
+
+        **Selenium:**
+
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
+          during the waiting process.
+
+        **Appium:**
+
+        - Applied :func:`wait_condition` decorator integrates an exponential delay
+          (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
+          with each iteration during the waiting process.
+
+        **Playwright:**
+
+        - The condition is polled by Playwright auto-waiting, without delays between requests.
+
+        :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
+        :type timeout: int or float
+        :param silent: If :obj:`True`, suppresses logging.
+        :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
+        :return: :class:`PlayElement`
+        """
+        validate_scheduler(scheduler)
+
+        if not silent:
+            self.log(f'Wait until "{self.name}" becomes enabled')
+
+        try:
+            expect(self._first_element).to_be_enabled(timeout=get_timeout_in_ms(timeout))
+        except AssertionError:
+            raise TimeoutException(f'"{self.name}" is not enabled', timeout=timeout, info=self)
+        return self
+
+    @profile(is_round_trip=True)
+    def wait_disabled(
+            self,
+            *,
+            timeout: Union[int, float] = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> PlayElement:
+        """
+        Wait for the element to become disabled.
+
+        **Note:** The method requires the use of named arguments.
+
+        **Selenium:**
+
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
+          during the waiting process.
+
+        **Appium:**
+
+        - Applied :func:`wait_condition` decorator integrates an exponential delay
+          (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
+          with each iteration during the waiting process.
+
+        **Playwright:**
+
+        - The condition is polled by Playwright auto-waiting, without delays between requests.
+
+        :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
+        :type timeout: [int, float]
+        :param silent: If :obj:`True`, suppresses logging.
+        :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
+        :return: :class:`PlayElement`
+        """
+        validate_scheduler(scheduler)
+
+        if not silent:
+            self.log(f'Wait until "{self.name}" becomes disabled')
+
+        try:
+            expect(self._first_element).to_be_disabled(timeout=get_timeout_in_ms(timeout))
+        except AssertionError:
+            raise TimeoutException(f'"{self.name}" is not disabled', timeout=timeout, info=self)
+        return self
+
+    @profile(is_round_trip=True)
+    def wait_for_size(
+            self,
+            expected_size: Size,
+            *,
+            timeout: Union[int, float] = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> PlayElement:
+        """
+        Wait until element size will be equal to given :class:`Size` object
+
+        **Note:** The method requires the use of named arguments except ``expected_size``.
+
+        **Selenium:**
+
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
+          during the waiting process.
+
+        **Appium:**
+
+        - Applied :func:`wait_condition` decorator integrates an exponential delay
+          (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
+          with each iteration during the waiting process.
+
+        **Playwright:**
+
+        - The condition is polled by Playwright auto-waiting, without delays between requests.
+
+        :param expected_size: expected element size
+        :type expected_size: :class:`Size`
+        :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
+        :type timeout: int or float
+        :param silent: If :obj:`True`, suppresses logging.
+        :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
+        :return: :class:`PlayElement`
+        """
+        validate_scheduler(scheduler)
+
+        if not silent:
+            self.log(f'Wait until "{self.name}" size will be equal to {expected_size}')
+
+        timeout_in_ms = get_timeout_in_ms(timeout)
+        size_data = [expected_size.width, expected_size.height, timeout_in_ms]
+
+        try:
+            is_size_equal = self._first_element.evaluate(wait_element_size_js, size_data, timeout=timeout_in_ms)
+        except PlayTimeoutError:
+            is_size_equal = False
+
+        if not is_size_equal:
+            actual = self.size if self.is_available() else None
+            error = f'Unexpected size for "{self.name}"'
+            raise UnexpectedElementSizeException(error, actual, expected_size, timeout=timeout)
+        return self
+
+    @profile(is_round_trip=True)
+    def wait_elements_count(
+            self,
+            expected_count: int,
+            *,
+            timeout: Union[int, float] = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> PlayElement:
+        """
+        Wait until the number of matching elements equals the expected count.
+
+        **Note:** The method requires the use of named arguments except ``expected_count``.
+
+        **Selenium:**
+
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
+          during the waiting process.
+
+        **Appium:**
+
+        - Applied :func:`wait_condition` decorator integrates an exponential delay
+          (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
+          with each iteration during the waiting process.
+
+        **Playwright:**
+
+        - The condition is polled by Playwright auto-waiting, without delays between requests.
+
+        :param expected_count: The expected number of elements.
+        :type expected_count: int
+        :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
+        :type timeout: typing.Union[int, float]
+        :param silent: If :obj:`True`, suppresses logging.
+        :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
+        :return: :class:`PlayElement`
+        """
+        validate_scheduler(scheduler)
+
+        if not silent:
+            self.log(f'Wait until elements count of "{self.name}" will be equal to "{expected_count}"')
+
+        try:
+            expect(self.element).to_have_count(expected_count, timeout=get_timeout_in_ms(timeout))
+        except AssertionError:
+            actual_count = self.get_elements_count(silent=True)
+            error_msg = f'Unexpected elements count of "{self.name}"'
+            raise UnexpectedElementsCountException(error_msg, actual_count, expected_count, timeout=timeout)
+        return self
+
     # Element state
 
     def scroll_into_view(
@@ -369,6 +778,7 @@ class PlayElement(ElementABC, Logging, ABC):
 
         return self
 
+    @profile()
     def screenshot_image(self, screenshot_base: bytes = None) -> Image:
         """
         Returns a :class:`PIL.Image.Image` object representing the screenshot of the web element.
@@ -383,6 +793,7 @@ class PlayElement(ElementABC, Logging, ABC):
         return get_image(screenshot_base)
 
     @property
+    @profile(is_round_trip=True)
     def screenshot_base(self) -> bytes:
         """
         Returns the binary screenshot data of the element.
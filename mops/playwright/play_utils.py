@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import Any, List, Optional
+
+from playwright.sync_api import Error as PlayError
+
+from mops.js_scripts import play_get_elements_rects_js, play_get_elements_visibility_js
+from mops.utils.profiler import profile
+
+
+def validate_scheduler(scheduler: Any) -> None:
+    """
+    Reject the scheduler of the element wait: conditions are polled by Playwright auto-waiting
+
+    :param scheduler: scheduler, given to the wait
+    :return: None
+    """
+    if scheduler is not None:
+        raise ValueError('The `scheduler` arg is not supported by Playwright waits, that use Playwright auto-waiting')
+
+
+def get_browser_locators(element: Any) -> Optional[List[dict]]:
+    """
+    Get locators chain of the element and its parents for the browser side search
+
+    :param element: PlayElement
+    :return: list of locators from the outermost parent or :obj:`None` if any locator isn't supported by browser
+    """
+    locators = []
+
+    while element:
+        if element._element is not None:
+            return None
+
+        locator = element.locator
+
+        if locator.startswith('xpath='):
+            locators.insert(0, {'by': 'xpath', 'value': locator[len('xpath='):]})
+        elif locator.startswith('id='):
+            locators.insert(0, {'by': 'css selector', 'value': f'[id="{locator[len("id="):]}"]'})
+        elif '>>' in locator or '=' in locator.split('[', 1)[0]:
+            return None  # Playwright specific selector ~ 'text=Submit' or 'div >> nth=1'
+        else:
+            locators.insert(0, {'by': 'css selector', 'value': locator})
+
+        element = element.parent
+
+    return locators
+
+
+@profile(is_round_trip=True)
+def get_elements_visibility(driver_wrapper: Any, elements: List[Any]) -> Optional[List[bool]]:
+    """
+    Get visibility of given elements within a single evaluate call.
+    Elements, that are not found by the browser side search (e.g. inside of shadow DOM),
+    are checked by :meth:`PlayElement.is_displayed`
+
+    :param driver_wrapper: DriverWrapper of the elements
+    :param elements: list of PlayElement
+    :return: list of visibility states or :obj:`None` if browser side check unavailable
+    """
+    locators = [get_browser_locators(element) for element in elements]
+    if not all(locators):
+        return None
+
+    try:
+        states = driver_wrapper.driver.evaluate(play_get_elements_visibility_js, locators)
+    except PlayError:
+        return None
+
+    if states is None:
+        return None
+
+    return [
+        element.is_displayed(silent=True) if state is None else state
+        for element, state in zip(elements, states)
+    ]
+
+
+@profile(is_round_trip=True)
+def get_elements_rects(driver_wrapper: Any, elements: List[Any]) -> Optional[List[dict]]:
+    """
+    Get viewport rects of given elements within a single evaluate call.
+    Elements, that are not found by the browser side search (e.g. inside of shadow DOM),
+    are measured by :meth:`PlayElement.get_rect`
+
+    :param driver_wrapper: DriverWrapper of the elements
+    :param elements: list of PlayElement
+    :return: list of {'x', 'y', 'width', 'height'} dicts or :obj:`None` if browser side search unavailable
+    """
+    locators = [get_browser_locators(element) for element in elements]
+    if not all(locators):
+        return None
+
+    try:
+        rects = driver_wrapper.driver.evaluate(play_get_elements_rects_js, locators)
+    except PlayError:
+        return None
+
+    if rects is None:
+        return None
+
+    return [element.get_rect() if rect is None else rect for element, rect in zip(elements, rects)]
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import pytest
+
+from mops.utils.artifact_writer import artifact_writer
+from mops.utils.logs import LogLevel, autolog
+from mops.utils.reference_generation import flush_reference_generation
+from mops.utils.reference_storage import reference_cache
+
+
+session_flushes = (flush_reference_generation, artifact_writer.flush)
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """
+    Flush background artifacts writing and references generation of visual comparison at session end.
+    Failed writes fail the run here, instead of being only logged by the fallback flush at interpreter exit.
+    Registered by the ``pytest11`` entry point of mops, and can be disabled with ``-p no:mops.pytest_plugin``
+
+    :param session: pytest session
+    :return: None
+    """
+    for flush in session_flushes:
+        try:
+            flush()
+        except Exception as exc:
+            autolog(f'Background artifacts writing failed: {exc!r}', level=LogLevel.ERROR)
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    reference_cache.log_stats()
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import time
 from functools import cached_property
-from typing import Union, List, Any, TYPE_CHECKING
+from typing import Union, List, Any, Callable, TYPE_CHECKING
 
+import numpy
 from PIL import Image
 from appium.webdriver.webdriver import WebDriver as AppiumDriver
-from mops.shared_utils import _scaled_screenshot
+from mops.shared_utils import _scaled_screenshot, get_image
 from selenium.common.exceptions import WebDriverException as SeleniumWebDriverException, NoAlertPresentException
 from selenium.webdriver.common.alert import Alert
 from selenium.webdriver.remote.webdriver import WebDriver as SeleniumWebDriver
@@ -15,7 +16,11 @@ from mops.abstraction.driver_wrapper_abc import DriverWrapperABC
 from mops.selenium.sel_utils import ActionChains
 from mops.exceptions import DriverWrapperException, TimeoutException
 from mops.utils.internal_utils import WAIT_EL, WAIT_UNIT
+from mops.js_scripts import get_page_scroll_metrics_js, scroll_page_to_js
 from mops.utils.logs import Logging
+from mops.utils.profiler import profile, profile_commands
+from mops.utils.screenshot_stitcher import ScreenshotStitcher
+from mops.visual_comparison import VisualComparison
 
 if TYPE_CHECKING:
     from mops.base.element import Element
@@ -32,6 +37,7 @@ class CoreDriver(Logging, DriverWrapperABC):
 
         :param driver: appium or selenium driver to initialize
         """
+        profile_commands(driver)  # each command of the driver and its elements is sent by WebDriver.execute
         driver.implicitly_wait(0.001)  # reduce selenium wait
 
     @cached_property
@@ -61,6 +67,20 @@ class CoreDriver(Logging, DriverWrapperABC):
         """
         return self.browser_name.lower() == 'firefox'
 
+    @property
+    def device_pixel_ratio(self) -> float:
+        """
+        Returns the device pixel ratio of the browser: ratio of screenshot pixels to the page pixels.
+        Selenium/Appium: The value is cached until the window size or frame is changed,
+        or until the screenshot size doesn't match it (e.g. after the page zoom).
+
+        :return: :class:`float` - device pixel ratio ~ 1 or 2
+        """
+        if not self._device_pixel_ratio:
+            self._device_pixel_ratio = self.execute_script('return window.devicePixelRatio;')
+
+        return self._device_pixel_ratio
+
     def wait(self, timeout: Union[int, float] = WAIT_UNIT) -> CoreDriver:
         """
         Pauses the execution for a specified amount of time.
@@ -83,6 +103,7 @@ class CoreDriver(Logging, DriverWrapperABC):
         :type silent: bool
         :return: :obj:`CoreDriver` - The current instance of the driver wrapper.
         """
+        self._reset_viewport_cache()
         if not silent:
             self.log(f'Navigating to url {url}')
 
@@ -93,6 +114,7 @@ class CoreDriver(Logging, DriverWrapperABC):
 
         return self
 
+    @profile()
     def screenshot_image(self, screenshot_base: bytes = None) -> Image:
         """
         Returns a :class:`PIL.Image.Image` object representing the screenshot of the web page.
@@ -104,9 +126,67 @@ class CoreDriver(Logging, DriverWrapperABC):
         :return: :class:`PIL.Image.Image`
         """
         screenshot_base = screenshot_base if screenshot_base else self.screenshot_base
-        return _scaled_screenshot(screenshot_base, self.get_inner_window_size().width)
+        return self._get_scaled_screenshot(screenshot_base, lambda: self.get_inner_window_size().width)
+
+    def _get_scaled_screenshot(self, screenshot_base: bytes, get_width: Callable[[], int]) -> Image:
+        """
+        Scale the screenshot from device pixels to the page pixels by the cached device pixel ratio.
+        Fractional, unknown or stale ratio: the screenshot is fitted to the measured width instead,
+        the same way as references are taken
+
+        :param screenshot_base: screenshot binary of the page or element
+        :param get_width: function, that measures the width of the page or element in the page pixels
+        :return: :class:`PIL.Image.Image`
+        """
+        resample = VisualComparison.screenshot_resample
+        scale = self.device_pixel_ratio
+
+        if scale and float(scale).is_integer():
+            if not get_image(screenshot_base).size[0] % scale:
+                return _scaled_screenshot(screenshot_base, scale=scale, resample=resample)
+
+            self._device_pixel_ratio = None  # screenshot doesn't match the cached ratio, e.g. after the page zoom
+
+        return _scaled_screenshot(screenshot_base, get_width(), resample=resample)
+
+    @profile()
+    def full_page_screenshot_image(self) -> Image:
+        """
+        Returns a :class:`PIL.Image.Image` object representing the screenshot of the whole web page.
+        Selenium/Appium: The page is scrolled through and viewport screenshots are stitched together,
+        keeping sticky header and footer only at the top and at the bottom of the page.
+
+        :return: :class:`PIL.Image.Image`
+        """
+        metrics = self.execute_script(get_page_scroll_metrics_js)
+        max_scroll = max(metrics['scrollHeight'] - metrics['innerHeight'], 0)
+        stitcher, scroll_y, target_y = None, None, 0
+
+        try:
+            while True:
+                previous_scroll_y, scroll_y = scroll_y, self.execute_async_script(
+                    scroll_page_to_js, metrics['scrollX'], target_y
+                )
+                frame = numpy.asarray(self.screenshot_image().convert('RGB'))
+                scale = frame.shape[1] / metrics['innerWidth']
+
+                if stitcher is None:
+                    stitcher = ScreenshotStitcher(frame.shape[1], round(metrics['scrollHeight'] * scale))
+
+                is_last = scroll_y >= max_scroll or (previous_scroll_y is not None and scroll_y <= previous_scroll_y)
+                stitcher.add(frame, round(scroll_y * scale), is_last=is_last)
+
+                if is_last:
+                    break
+
+                target_y = scroll_y + stitcher.get_step(frame.shape[0]) / scale
+        finally:
+            self.execute_script('window.scrollTo(arguments[0], arguments[1]);', metrics['scrollX'], metrics['scrollY'])
+
+        return Image.fromarray(stitcher.image)
 
     @property
+    @profile()
     def screenshot_base(self) -> bytes:
         """
         Returns the binary screenshot data of the element.
@@ -146,6 +226,7 @@ class CoreDriver(Logging, DriverWrapperABC):
 
         :return: :obj:`CoreDriver` - The current instance of the driver wrapper.
         """
+        self._reset_viewport_cache()
         self.log('Reload current page')
         self.driver.refresh()
         return self
@@ -156,6 +237,7 @@ class CoreDriver(Logging, DriverWrapperABC):
 
         :return: :obj:`CoreDriver` - The current instance of the driver wrapper.
         """
+        self._reset_viewport_cache()
         self.log('Going forward')
         self.driver.forward()
         return self
@@ -166,6 +248,7 @@ class CoreDriver(Logging, DriverWrapperABC):
 
         :return: :obj:`CoreDriver` - The current instance of the driver wrapper.
         """
+        self._reset_viewport_cache()
         self.log('Going back')
         self.driver.back()
         return self
@@ -251,6 +334,7 @@ class CoreDriver(Logging, DriverWrapperABC):
         :type frame: Element
         :return: :obj:`CoreDriver` - The current instance of the driver wrapper.
         """
+        self._reset_viewport_cache()
         self.driver.switch_to.frame(frame.element)
         return self
 
@@ -260,9 +344,11 @@ class CoreDriver(Logging, DriverWrapperABC):
 
         :return: :obj:`CoreDriver` - The current instance of the driver wrapper.
         """
+        self._reset_viewport_cache()
         self.driver.switch_to.default_content()
         return self
 
+    @profile()
     def execute_script(self, script: str, *args) -> Any:
         """
         Synchronously executes JavaScript in the current window or frame.
@@ -277,6 +363,26 @@ class CoreDriver(Logging, DriverWrapperABC):
         args = [getattr(arg, 'element', arg) for arg in args]
         return self.driver.execute_script(script, *args)
 
+    @profile()
+    def execute_async_script(self, script: str, *args) -> Any:
+        """
+        Asynchronously executes JavaScript in the current window or frame and waits for its callback.
+        Compatible with Selenium's `execute_async_script` method: the callback is passed as the last argument
+        and can be reached via ``arguments[arguments.length - 1]``.
+
+        :param script: The JavaScript code to execute.
+        :type script: str
+        :param args: Any arguments to pass to the JavaScript (e.g., Element object or list of Element objects).
+        :type args: list
+        :return: :obj:`typing.Any` - The value passed to the callback.
+        """
+        args = [
+            [getattr(item, 'element', item) for item in arg] if isinstance(arg, (list, tuple))
+            else getattr(arg, 'element', arg)
+            for arg in args
+        ]
+        return self.driver.execute_async_script(script, *args)
+
     def set_page_load_timeout(self, timeout: int = 30) -> CoreDriver:
         """
         Set the maximum time to wait for a page load to complete before throwing an error.
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import time
 from abc import ABC
-from typing import Union, List, Any, Callable
+from typing import Union, List, Any, Callable, Optional
 
 from PIL import Image
 from mops.mixins.objects.wait_result import Result
@@ -20,14 +20,16 @@ from selenium.common.exceptions import (
 )
 
 from mops.abstraction.element_abc import ElementABC
-from mops.selenium.sel_utils import ActionChains
+from mops.selenium.sel_utils import ActionChains, browser_wait_condition
 from mops.js_scripts import get_element_size_js, get_element_position_on_screen_js, js_click
 from mops.keyboard_keys import KeyboardKeys
 from mops.mixins.objects.location import Location
 from mops.mixins.objects.scrolls import ScrollTo, ScrollTypes, scroll_into_view_blocks
 from mops.mixins.objects.size import Size
-from mops.shared_utils import cut_log_data, _scaled_screenshot
+from mops.shared_utils import cut_log_data
 from mops.utils.internal_utils import WAIT_EL, safe_call, get_dict, HALF_WAIT_EL, wait_condition
+from mops.utils.profiler import profile
+from mops.utils.wait_scheduler import WaitScheduler
 from mops.exceptions import (
     TimeoutException,
     InvalidSelectorException,
@@ -35,6 +37,10 @@ from mops.exceptions import (
     NoSuchElementException,
     ElementNotInteractableException,
     NoSuchParentException,
+    UnexpectedElementsCountException,
+    UnexpectedElementSizeException,
+    UnexpectedValueException,
+    UnexpectedTextException,
 )
 
 
@@ -208,15 +214,23 @@ class CoreElement(ElementABC, ABC):
 
     # Element waits
 
+    @browser_wait_condition('visible')
     @wait_condition
-    def wait_visibility(self, *, timeout: int = WAIT_EL, silent: bool = False) -> CoreElement:
+    def wait_visibility(
+            self,
+            *,
+            timeout: int = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> CoreElement:
         """
         Waits until the element becomes visible.
         **Note:** The method requires the use of named arguments.
 
         **Selenium:**
 
-        - Applied :func:`wait_condition` decorator integrates a 0.1 seconds delay for each iteration
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
           during the waiting process.
 
         **Appium:**
@@ -229,6 +243,10 @@ class CoreElement(ElementABC, ABC):
         :type timeout: int
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
         :return: :class:`CoreElement`
         """
         return Result(  # noqa
@@ -237,15 +255,23 @@ class CoreElement(ElementABC, ABC):
             exc=TimeoutException(f'"{self.name}" not visible', info=self)
         )
 
+    @browser_wait_condition('hidden')
     @wait_condition
-    def wait_hidden(self, *, timeout: int = WAIT_EL, silent: bool = False) -> CoreElement:
+    def wait_hidden(
+            self,
+            *,
+            timeout: int = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> CoreElement:
         """
         Waits until the element becomes hidden.
         **Note:** The method requires the use of named arguments.
 
         **Selenium:**
 
-        - Applied :func:`wait_condition` decorator integrates a 0.1 seconds delay for each iteration
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
           during the waiting process.
 
         **Appium:**
@@ -258,6 +284,10 @@ class CoreElement(ElementABC, ABC):
         :type timeout: int
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
         :return: :class:`CoreElement`
         """
         return Result(  # noqa
@@ -266,15 +296,23 @@ class CoreElement(ElementABC, ABC):
             exc=TimeoutException(f'"{self.name}" still visible', info=self),
         )
 
+    @browser_wait_condition('available')
     @wait_condition
-    def wait_availability(self, *, timeout: int = WAIT_EL, silent: bool = False) -> CoreElement:
+    def wait_availability(
+            self,
+            *,
+            timeout: int = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> CoreElement:
         """
         Waits until the element becomes available in DOM tree. \n
         **Note:** The method requires the use of named arguments.
 
         **Selenium:**
 
-        - Applied :func:`wait_condition` decorator integrates a 0.1 seconds delay for each iteration
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
           during the waiting process.
 
         **Appium:**
@@ -287,6 +325,10 @@ class CoreElement(ElementABC, ABC):
         :type timeout: int
         :param silent: If :obj:`True`, suppresses logging.
         :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
         :return: :class:`CoreElement`
         """
         return Result(  # noqa
@@ -295,6 +337,313 @@ class CoreElement(ElementABC, ABC):
             exc=TimeoutException(f'"{self.name}" not available in DOM', info=self),
         )
 
+    @browser_wait_condition('text', expected_arg='expected_text')
+    @wait_condition
+    def wait_for_text(
+            self,
+            expected_text: Optional[str] = None,
+            *,
+            timeout: Union[int, float] = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> CoreElement:
+        """
+        Wait for the presence of a specific text in the current element, or for any non-empty text.
+
+        **Note:** The method requires the use of named arguments except ``expected_text``.
+
+        **Selenium:**
+
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
+          during the waiting process.
+
+        **Appium:**
+
+        - Applied :func:`wait_condition` decorator integrates an exponential delay
+          (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
+          with each iteration during the waiting process.
+
+        **Playwright:**
+
+        - The condition is polled by Playwright auto-waiting, without delays between requests.
+
+        :param expected_text: The text to wait for. :obj:`None` - any text; :class:`str` - expected text.
+        :type expected_text: typing.Optional[str]
+        :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
+        :type timeout: int or float
+        :param silent: If :obj:`True`, suppresses logging.
+        :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
+        :return: :class:`CoreElement`
+        """
+        actual_text = self.text
+
+        if expected_text:
+            result = actual_text == expected_text
+            error = f'Not expected text for "{self.name}"'
+            log_msg = f'Wait until text of "{self.name}" will be equal to "{expected_text}"'
+        else:
+            result = actual_text
+            error = f'Text of "{self.name}" is empty'
+            log_msg = f'Wait for any text of "{self.name}"'
+
+        return Result(result, log_msg, UnexpectedTextException(error, actual_text, expected_text))  # noqa
+
+    @browser_wait_condition('value', expected_arg='expected_value')
+    @wait_condition
+    def wait_for_value(
+            self,
+            expected_value: Optional[str] = None,
+            *,
+            timeout: Union[int, float] = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> CoreElement:
+        """
+        Wait for a specific value in the current element, or for any non-empty value.
+
+        **Note:** The method requires the use of named arguments except ``expected_value``.
+
+        **Selenium:**
+
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
+          during the waiting process.
+
+        **Appium:**
+
+        - Applied :func:`wait_condition` decorator integrates an exponential delay
+          (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
+          with each iteration during the waiting process.
+
+        **Playwright:**
+
+        - The condition is polled by Playwright auto-waiting, without delays between requests.
+
+        :param expected_value: The value to waiting for. :obj:`None` - any value; :class:`str` - expected value.
+        :type expected_value: typing.Optional[str]
+        :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
+        :type timeout: int or float
+        :param silent: If :obj:`True`, suppresses logging.
+        :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
+        :return: :class:`CoreElement`
+        """
+        actual_value = self.value
+
+        if expected_value:
+            result = actual_value == expected_value
+            error = f'Not expected value for "{self.name}"'
+            log_msg = f'Wait until value of "{self.name}" will be equal to "{expected_value}"'
+        else:
+            result = actual_value
+            error = f'Value of "{self.name}" is empty'
+            log_msg = f'Wait for any value inside "{self.name}"'
+
+        return Result(result, log_msg, UnexpectedValueException(error, actual_value, expected_value))  # noqa
+
+    @browser_wait_condition('enabled')
+    @wait_condition
+    def wait_enabled(
+            self,
+            *,
+            timeout: Union[int, float] = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> CoreElement:
+        """
+        Wait for the element to become enabled and/or clickable.
+
+        **Note:** The method requires the use of named arguments.
+
+        **Selenium:**
+
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
+          during the waiting process.
+
+        **Appium:**
+
+        - Applied :func:`wait_condition` decorator integrates an exponential delay
+          (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
+          with each iteration during the waiting process.
+
+        **Playwright:**
+
+        - The condition is polled by Playwright auto-waiting, without delays between requests.
+
+        :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
+        :type timeout: int or float
+        :param silent: If :obj:`True`, suppresses logging.
+        :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
+        :return: :class:`CoreElement`
+        """
+        return Result(  # noqa
+            execution_result=self.is_enabled(silent=True),
+            log=f'Wait until "{self.name}" becomes enabled',
+            exc=TimeoutException(f'"{self.name}" is not enabled', info=self),
+        )
+
+    @browser_wait_condition('disabled')
+    @wait_condition
+    def wait_disabled(
+            self,
+            *,
+            timeout: Union[int, float] = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> CoreElement:
+        """
+        Wait for the element to become disabled.
+
+        **Note:** The method requires the use of named arguments.
+
+        **Selenium:**
+
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
+          during the waiting process.
+
+        **Appium:**
+
+        - Applied :func:`wait_condition` decorator integrates an exponential delay
+          (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
+          with each iteration during the waiting process.
+
+        **Playwright:**
+
+        - The condition is polled by Playwright auto-waiting, without delays between requests.
+
+        :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
+        :type timeout: [int, float]
+        :param silent: If :obj:`True`, suppresses logging.
+        :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
+        :return: :class:`CoreElement`
+        """
+        return Result(  # noqa
+            execution_result=not self.is_enabled(silent=True),
+            log=f'Wait until "{self.name}" becomes disabled',
+            exc=TimeoutException(f'"{self.name}" is not disabled', info=self),
+        )
+
+    @browser_wait_condition('size', expected_arg='expected_size')
+    @wait_condition
+    def wait_for_size(
+            self,
+            expected_size: Size,
+            *,
+            timeout: Union[int, float] = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> CoreElement:
+        """
+        Wait until element size will be equal to given :class:`Size` object
+
+        **Note:** The method requires the use of named arguments except ``expected_size``.
+
+        **Selenium:**
+
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
+          during the waiting process.
+
+        **Appium:**
+
+        - Applied :func:`wait_condition` decorator integrates an exponential delay
+          (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
+          with each iteration during the waiting process.
+
+        **Playwright:**
+
+        - The condition is polled by Playwright auto-waiting, without delays between requests.
+
+        :param expected_size: expected element size
+        :type expected_size: :class:`Size`
+        :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
+        :type timeout: int or float
+        :param silent: If :obj:`True`, suppresses logging.
+        :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
+        :return: :class:`CoreElement`
+        """
+        actual = self.size
+        is_height_equal = actual.height == expected_size.height if expected_size.height is not None else True
+        is_width_equal = actual.width == expected_size.width if expected_size.width is not None else True
+        return Result(  # noqa
+            execution_result=is_height_equal and is_width_equal,
+            log=f'Wait until "{self.name}" size will be equal to {expected_size}',
+            exc=UnexpectedElementSizeException(f'Unexpected size for "{self.name}"', actual, expected_size),
+        )
+
+    @browser_wait_condition('count', expected_arg='expected_count')
+    @wait_condition
+    def wait_elements_count(
+            self,
+            expected_count: int,
+            *,
+            timeout: Union[int, float] = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None
+    ) -> CoreElement:
+        """
+        Wait until the number of matching elements equals the expected count.
+
+        **Note:** The method requires the use of named arguments except ``expected_count``.
+
+        **Selenium:**
+
+        - The condition is awaited inside the browser in script calls of up to 1 second, each confirmed
+          by :func:`wait_condition` decorator, that integrates a 0.1 seconds delay for each iteration
+          during the waiting process.
+
+        **Appium:**
+
+        - Applied :func:`wait_condition` decorator integrates an exponential delay
+          (starting at 0.1 seconds, up to a maximum of 1.6 seconds) which increases
+          with each iteration during the waiting process.
+
+        **Playwright:**
+
+        - The condition is polled by Playwright auto-waiting, without delays between requests.
+
+        :param expected_count: The expected number of elements.
+        :type expected_count: int
+        :param timeout: The maximum time to wait for the condition (in seconds). Default: :obj:`WAIT_EL`.
+        :type timeout: typing.Union[int, float]
+        :param silent: If :obj:`True`, suppresses logging.
+        :type silent: bool
+        :param scheduler: Selenium/Appium: :class:`WaitScheduler` of this wait.
+          Default: scheduler of the driver wrapper. Playwright: not supported, the condition is polled
+          by Playwright auto-waiting, so :exc:`ValueError` is raised if a scheduler is given.
+        :type scheduler: typing.Optional[WaitScheduler]
+        :return: :class:`CoreElement`
+        """
+        actual_count = self.get_elements_count(silent=True)
+        error_msg = f'Unexpected elements count of "{self.name}"'
+        return Result(  # noqa
+            execution_result=actual_count == expected_count,
+            log=f'Wait until elements count of "{self.name}" will be equal to "{expected_count}"',
+            exc=UnexpectedElementsCountException(error_msg, actual_count, expected_count),
+        )
+
     # Element state
 
     def scroll_into_view(
@@ -329,6 +678,7 @@ class CoreElement(ElementABC, ABC):
 
         return self
 
+    @profile()
     def screenshot_image(self, screenshot_base: bytes = None) -> Image:
         """
         Returns a :class:`PIL.Image.Image` object representing the screenshot of the web element.
@@ -340,9 +690,10 @@ class CoreElement(ElementABC, ABC):
         :return: :class:`PIL.Image.Image`
         """
         screenshot_base = screenshot_base if screenshot_base else self.screenshot_base
-        return _scaled_screenshot(screenshot_base, self.size.width)
+        return self.driver_wrapper._get_scaled_screenshot(screenshot_base, lambda: self.size.width)  # noqa
 
     @property
+    @profile()
     def screenshot_base(self) -> bytes:
         """
         Returns the binary screenshot data of the element.
@@ -533,6 +884,7 @@ class CoreElement(ElementABC, ABC):
         """
         return ActionChains(self.driver)
 
+    @profile()
     def _get_element(self, wait: Union[bool, Callable] = True, force_wait: bool = False) -> SeleniumWebElement:
         """
         Get selenium element from driver or parent element
@@ -588,6 +940,7 @@ class CoreElement(ElementABC, ABC):
 
         return base
 
+    @profile()
     def _find_element(self, wait_parent: bool = False) -> Union[SeleniumWebElement, AppiumWebElement]:
         """
         Find selenium/appium element
@@ -607,6 +960,7 @@ class CoreElement(ElementABC, ABC):
         except SeleniumNoSuchElementException as exc:
             raise NoSuchElementException(exc.msg)
 
+    @profile()
     def _find_elements(self, wait_parent: bool = False) -> List[Union[SeleniumWebElement, AppiumWebElement]]:
         """
         Find all selenium/appium elements
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Union, List, Optional
+from typing import Union, List, Optional, Dict, Tuple
 
 from appium.webdriver.applicationstate import ApplicationState
 from appium.webdriver.webdriver import WebDriver as AppiumDriver
@@ -9,6 +9,10 @@ from mops.selenium.core.core_driver import CoreDriver
 from mops.mixins.native_context import NativeContext, NativeSafari
 
 
+# Safari bars heights of the device: (device name, platform version, orientation) -> (top bar, bottom bar)
+safari_bars_cache: Dict[Tuple[str, str, str], Tuple[int, int]] = {}
+
+
 class MobileDriver(CoreDriver):
 
     bundle_id: Optional[str]
@@ -32,8 +36,8 @@ class MobileDriver(CoreDriver):
         self.__is_native_context = None
         self.__is_web_context = None
 
-        self._top_bar_height = None
-        self._bottom_bar_height = None
+        self._orientation = 'portrait'
+        self._window_heights: Dict[str, int] = {}
 
         self.original_tab = None
         self.page_box = None
@@ -106,6 +110,7 @@ class MobileDriver(CoreDriver):
 
         :return: :obj:`MobileDriver` - The current instance of the driver wrapper, now in the native app context.
         """
+        self._reset_viewport_cache()
         self.driver.switch_to.context(self.native_context_name)
         self.__is_native_context = True
         self.__is_web_context = False
@@ -117,6 +122,7 @@ class MobileDriver(CoreDriver):
 
         :return: :obj:`MobileDriver` - The current instance of the driver wrapper, now in the web app context.
         """
+        self._reset_viewport_cache()
         self.driver.switch_to.context(self.web_context_name)
         self.__is_native_context = False
         self.__is_web_context = True
@@ -172,11 +178,7 @@ class MobileDriver(CoreDriver):
 
         :return: :obj:`int` - The height of the top bar in pixels.
         """
-        if self._top_bar_height is None:
-            with NativeContext(self):
-                self._top_bar_height = self.native_safari.top_bar.size.height
-
-        return self._top_bar_height
+        return self._get_safari_bars()[0]
 
     @property
     def bottom_bar_height(self) -> int:
@@ -185,14 +187,7 @@ class MobileDriver(CoreDriver):
 
         :return: :obj:`int` - The height of the bottom bar in pixels.
         """
-        if self.is_tablet:
-            return 0
-
-        if self._bottom_bar_height is None:
-            with NativeContext(self):
-                self._bottom_bar_height = self.native_safari.get_bottom_bar_height()
-
-        return self._bottom_bar_height
+        return self._get_safari_bars()[1]
 
     def get_all_contexts(self) -> List[str]:
         """
@@ -216,9 +211,10 @@ class MobileDriver(CoreDriver):
         image = CoreDriver.screenshot_image(self, screenshot_base)
 
         if self.is_ios and not screenshot_base:
-            if not self.page_box:
-                width, height = image.size
-                self.page_box = 0, self.top_bar_height, width, height - self.bottom_bar_height
+            width, height = image.size
+            self._orientation = 'landscape' if width > height else 'portrait'
+            top_bar_height, bottom_bar_height = self._get_safari_bars()
+            self.page_box = 0, top_bar_height, width, height - bottom_bar_height
 
             image = image.crop(self.page_box)
 
@@ -263,6 +259,36 @@ class MobileDriver(CoreDriver):
 
         return self
 
+    def _get_safari_bars(self) -> Tuple[int, int]:
+        """
+        iOS only - Get heights of the Safari top and bottom bars for the last known orientation.
+        Heights are taken from the native context once per device and orientation, and shared between sessions
+
+        :return: (top bar height, bottom bar height)
+        """
+        key = (self.caps.get('deviceName', ''), self.caps.get('platformVersion', ''), self._orientation)
+
+        if key not in safari_bars_cache:
+            with NativeContext(self):
+                top_bar_height = self.native_safari.top_bar.size.height
+                bottom_bar_height = 0 if self.is_tablet else self.native_safari.get_bottom_bar_height()
+
+            safari_bars_cache[key] = top_bar_height, bottom_bar_height
+
+        return safari_bars_cache[key]
+
+    def _get_window_height(self) -> int:
+        """
+        iOS only - Get the native window height for the last known orientation.
+        The height is requested once per orientation of the session
+
+        :return: window height
+        """
+        if self._orientation not in self._window_heights:
+            self._window_heights[self._orientation] = self.driver.get_window_size()['height']
+
+        return self._window_heights[self._orientation]
+
 
 def _set_static(obj) -> None:
     """
@@ -33,6 +33,7 @@ class WebDriver(CoreDriver):
         :type height: int
         :return: :obj:`WebDriver` - The current instance of the driver wrapper.
         """
+        self._reset_viewport_cache()
         self.driver.set_window_size(width, height)
         return self
 
@@ -51,6 +52,7 @@ class WebDriver(CoreDriver):
 
         :return: :obj:`WebDriver` - The current instance of the driver wrapper, now switched to the new tab.
         """
+        self._reset_viewport_cache()
         self.driver.switch_to.new_window('tab')
         return self
 
@@ -60,6 +62,7 @@ class WebDriver(CoreDriver):
 
         :return: :obj:`WebDriver` - The current instance of the driver wrapper, now switched to the original tab.
         """
+        self._reset_viewport_cache()
         self.driver.switch_to.window(self.original_tab)
         return self
 
@@ -71,6 +74,7 @@ class WebDriver(CoreDriver):
         :type tab: int
         :return: :obj:`WebDriver` - The current instance of the driver wrapper, now switched to the specified tab.
         """
+        self._reset_viewport_cache()
         if tab == -1:
             tab = self.get_all_tabs()[tab]
         else:
@@ -86,6 +90,7 @@ class WebDriver(CoreDriver):
         :return: :obj:`WebDriver` - The current instance of the driver wrapper,
           with all tabs except the original closed.
         """
+        self._reset_viewport_cache()
         tabs = self.get_all_tabs()
         tabs.remove(self.original_tab)
 
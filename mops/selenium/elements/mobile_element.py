@@ -6,6 +6,7 @@ from typing import Union
 
 from PIL.Image import Image
 
+from mops.js_scripts import get_element_geometry_js
 from mops.selenium.core.core_element import CoreElement
 from mops.mixins.objects.location import Location
 from mops.mixins.objects.locator import Locator, take_locator_type
@@ -128,12 +129,16 @@ class MobileElement(CoreElement, ABC):
         :return: :class:`PIL.Image.Image`
         """
         if self.driver_wrapper.is_ios:
-            element_box = self._element_box()
-            window_height = self.driver.get_window_size()['height']
+            geometry = self.execute_script(get_element_geometry_js)
             image = self.driver_wrapper.screenshot_image()
 
-            if window_height > self.size.height:
-                image = image.crop(element_box)
+            if self.driver_wrapper._get_window_height() > geometry['height']:  # noqa
+                image = image.crop((
+                    geometry['x'],
+                    geometry['y'],
+                    geometry['x'] + geometry['width'],
+                    geometry['y'] + geometry['height'],
+                ))
 
         else:
             image = CoreElement.screenshot_image(self, screenshot_base)
@@ -163,19 +168,3 @@ class MobileElement(CoreElement, ABC):
             return Location(**self.element.location)
 
         return CoreElement.location.fget(self)
-
-    def _element_box(self) -> tuple:
-        """
-        Get element coordinates on screen for ios safari
-
-        :return: element coordinates on screen (start_x, start_y, end_x, end_y)
-        """
-        element_size = self.size
-        element_location = self.location
-
-        return (
-            element_location.x,
-            element_location.y,
-            element_location.x + element_size.width,
-            element_location.y + element_size.height,
-        )
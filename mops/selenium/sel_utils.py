@@ -1,6 +1,24 @@
 from __future__ import annotations
 
+import inspect
+import time
+from functools import wraps
+from typing import Any, Callable, List, Optional, Union
+
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver import ActionChains as SeleniumActionChains
+from selenium.webdriver.common.by import By
+
+from mops.exceptions import DriverWrapperException
+from mops.js_scripts import get_elements_rects_js, get_elements_visibility_js, wait_element_condition_js
+from mops.utils.internal_utils import WAIT_EL, get_dict, validate_timeout
+from mops.utils.profiler import profile
+from mops.utils.wait_scheduler import WaitScheduler
+
+
+BROWSER_LOCATOR_TYPES = (By.CSS_SELECTOR, By.XPATH)
+BROWSER_WAIT_CHUNK = 1  # seconds of single script execution, followed by the Python side check
+MIN_FALLBACK_TIMEOUT = 0.001  # fallback makes at least one check, even if browser side wait took all the time
 
 
 class ActionChains(SeleniumActionChains):
@@ -17,3 +35,167 @@ class ActionChains(SeleniumActionChains):
         self.w3c_actions.key_action.pause()
 
         return self
+
+
+def get_browser_locators(element: Any) -> Optional[List[dict]]:
+    """
+    Get locators chain of the element and its parents for the browser side search.
+    Already found element of the chain is passed as is, so its parents are skipped
+
+    :param element: CoreElement
+    :return: list of locators from the outermost parent or :obj:`None` if any locator isn't supported by browser
+    """
+    locators = []
+
+    while element:
+        if element._element is not None:
+            locators.insert(0, {'element': element._element})
+            break
+
+        if element.locator_type not in BROWSER_LOCATOR_TYPES:
+            return None
+
+        locators.insert(0, {'by': element.locator_type, 'value': element.locator})
+        element = element.parent
+
+    return locators
+
+
+@profile()
+def get_elements_visibility(driver_wrapper: Any, elements: List[Any]) -> Optional[List[bool]]:
+    """
+    Get visibility of given elements within a single script call
+
+    :param driver_wrapper: DriverWrapper of the elements
+    :param elements: list of CoreElement
+    :return: list of visibility states or :obj:`None` if browser side check unavailable
+    """
+    if driver_wrapper.is_appium and driver_wrapper.is_native_context:
+        return None
+
+    locators = [get_browser_locators(element) for element in elements]
+    if not all(locators):
+        return None
+
+    try:
+        return driver_wrapper.driver.execute_script(get_elements_visibility_js, locators)
+    except WebDriverException:
+        return None
+
+
+@profile()
+def get_elements_rects(driver_wrapper: Any, elements: List[Any]) -> Optional[List[dict]]:
+    """
+    Get viewport rects of given elements within a single script call.
+    Elements, that are not found by the browser side search, are measured by :meth:`CoreElement.get_rect`
+
+    :param driver_wrapper: DriverWrapper of the elements
+    :param elements: list of CoreElement
+    :return: list of {'x', 'y', 'width', 'height'} dicts or :obj:`None` if browser side search unavailable
+    """
+    if driver_wrapper.is_appium and driver_wrapper.is_native_context:
+        return None
+
+    locators = [get_browser_locators(element) for element in elements]
+    if not all(locators):
+        return None
+
+    try:
+        rects = driver_wrapper.driver.execute_script(get_elements_rects_js, locators)
+    except WebDriverException:
+        return None
+
+    if rects is None:
+        return None
+
+    return [element.get_rect() if rect is None else rect for element, rect in zip(elements, rects)]
+
+
+@profile()
+def wait_in_browser(element: Any, condition: str, expected: Any, timeout: Union[int, float]) -> Optional[bool]:
+    """
+    Wait for the element condition inside the browser: condition is checked by ``MutationObserver``
+    and each animation frame, and script returns once condition is met or timeout is reached
+
+    :param element: CoreElement
+    :param condition: 'available', 'visible', 'hidden', 'count', 'enabled', 'disabled', 'text', 'value' or 'size'
+    :param expected: expected text, value, count or size dict
+    :param timeout: timeout in seconds
+    :return: :obj:`True` if condition is met, :obj:`False` if timeout reached
+      or :obj:`None` if browser side wait unavailable
+    """
+    driver_wrapper = element.driver_wrapper
+
+    if driver_wrapper.is_appium and driver_wrapper.is_native_context:
+        return None
+
+    locators = get_browser_locators(element)
+    if not locators:
+        return None
+
+    try:
+        return bool(element.driver.execute_async_script(
+            wait_element_condition_js, locators, condition, expected, timeout * 1000
+        ))
+    except WebDriverException:
+        return None
+
+
+def browser_wait_condition(condition: str, expected_arg: Optional[str] = None) -> Callable:
+    """
+    Decorator of :func:`wait_condition` methods, that waits for the condition inside the browser
+    in chunks of :obj:`BROWSER_WAIT_CHUNK` seconds, with a single Python side check after each chunk.
+    Python side check is the only one trusted, so the original condition and exception are kept.
+    Python side polling continues for the remaining time, if browser side wait isn't available
+    or browser reports the condition, that isn't confirmed by Python side check.
+
+    :param condition: browser side condition name, see :func:`wait_in_browser`
+    :param expected_arg: name of the method argument with the expected value of the condition, if any
+    :return: decorator
+    """
+
+    def decorator(method: Callable) -> Callable:
+        signature = inspect.signature(method)
+
+        @wraps(method)
+        def wrapper(
+                self,
+                *args,
+                timeout: Union[int, float] = WAIT_EL,
+                silent: bool = False,
+                scheduler: Optional[WaitScheduler] = None,
+                **kwargs
+        ):
+            validate_timeout(timeout)
+            expected = None
+
+            if expected_arg:
+                arguments = signature.bind(self, *args, **kwargs)
+                arguments.apply_defaults()
+                expected = arguments.arguments[expected_arg]
+
+            if condition == 'size':
+                expected = get_dict(expected)
+
+            deadline = time.monotonic() + timeout
+            is_silent = silent
+
+            while True:
+                chunk = min(deadline - time.monotonic(), BROWSER_WAIT_CHUNK)
+                is_met = wait_in_browser(self, condition, expected, chunk)
+                remaining = deadline - time.monotonic()
+                check_timeout = MIN_FALLBACK_TIMEOUT if is_met is False else max(remaining, MIN_FALLBACK_TIMEOUT)
+
+                try:
+                    return method(self, *args, timeout=check_timeout, silent=is_silent, scheduler=scheduler, **kwargs)
+                except DriverWrapperException as exc:
+                    if is_met is not False or deadline <= time.monotonic():
+                        raise type(exc)(
+                            exc._original_msg, exc._actual, exc._expected, timeout=timeout, info=exc._info  # noqa
+                        )
+
+                is_silent = True  # the wait is logged by the first check only
+
+        return wrapper
+
+    return decorator
@@ -1,26 +1,40 @@
 import io
 import logging
 from subprocess import Popen, PIPE, run
+from typing import Optional
 
 from PIL import Image
 
 
-def _scaled_screenshot(screenshot_binary: bytes, width: int) -> Image:
+def _scaled_screenshot(
+        screenshot_binary: bytes,
+        width: Optional[int] = None,
+        scale: Optional[float] = None,
+        resample: int = Image.Resampling.LANCZOS,
+) -> Image:
     """
-    Get scaled screenshot to fit driver window / element size
+    Get scaled screenshot to fit driver window / element size.
+    Integer scale with BOX filter is done by :meth:`PIL.Image.Image.reduce`, that is much faster than resize
 
     :param screenshot_binary: original screenshot binary
-    :param width: driver or element width
+    :param width: driver or element width. Used to calculate the scale if it's not given
+    :param scale: ratio of screenshot size to the driver or element size ~ device pixel ratio
+    :param resample: resampling filter ~ Image.Resampling.LANCZOS
     :return: scaled image binary
     """
     img_binary = get_image(screenshot_binary)
-    scale = img_binary.size[0] / width
+    scale = scale or img_binary.size[0] / width
 
-    if scale != 1:
-        new_image_size = (int(img_binary.size[0] / scale), int(img_binary.size[1] / scale))
-        img_binary = img_binary.resize(new_image_size, Image.Resampling.LANCZOS)
+    if scale == 1:
+        return img_binary
 
-    return img_binary
+    new_image_size = (int(img_binary.size[0] / scale), int(img_binary.size[1] / scale))
+
+    if resample == Image.Resampling.BOX and float(scale).is_integer():
+        factor = int(scale)
+        return img_binary.reduce(factor, box=(0, 0, new_image_size[0] * factor, new_image_size[1] * factor))
+
+    return img_binary.resize(new_image_size, resample)
 
 
 def get_image(screenshot_binary: bytes):
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import os
+import atexit
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+try:
+    import cv2.cv2 as cv2  # ~cv2@4.5.5.62 + python@3.8/9/10
+except ImportError:
+    import cv2  # ~cv2@4.10.0.84 + python@3.11/12
+import numpy
+
+from mops.utils.logs import autolog, LogLevel
+
+
+def encode_png(image: numpy.ndarray, compression_level: Optional[int] = None) -> bytes:
+    """
+    Encode BGR image to PNG bytes
+
+    :param image: BGR numpy.ndarray
+    :param compression_level: PNG compression level (0-9). :obj:`None` - default level of OpenCV
+    :return: PNG bytes
+    """
+    params = [] if compression_level is None else [cv2.IMWRITE_PNG_COMPRESSION, compression_level]
+    is_encoded, buffer = cv2.imencode('.png', image, params)
+
+    if not is_encoded:
+        raise ValueError(f'Cannot encode image with shape {image.shape} to PNG')
+
+    return buffer.tobytes()
+
+
+def write_png(file: str, image: numpy.ndarray, compression_level: Optional[int] = None) -> bytes:
+    """
+    Encode BGR image to PNG and write it to the given file
+
+    :param file: file path
+    :param image: BGR numpy.ndarray
+    :param compression_level: PNG compression level (0-9). :obj:`None` - default level of OpenCV
+    :return: PNG bytes
+    """
+    data = encode_png(image, compression_level)
+
+    with open(file, 'wb') as image_file:
+        image_file.write(data)
+
+    return data
+
+
+def move_file(source: str, destination: str) -> None:
+    """
+    Move file with replacement of existing destination
+
+    :param source: source file path
+    :param destination: destination file path
+    :return: None
+    """
+    if os.path.exists(destination):
+        os.remove(destination)
+
+    shutil.move(source, destination)
+
+
+def remove_files(*files: str) -> None:
+    """
+    Remove given files if they exist
+
+    :param files: file paths
+    :return: None
+    """
+    for file_path in files:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+
+class ArtifactWriter:
+    """
+    Background writer of visual comparison artifacts, backed by a thread pool.
+
+    - Tasks related to the same file are executed in submission order;
+    - Memory of queued images is bounded by :obj:`max_pending_bytes`:
+      submission blocks until enough of the queued images are written;
+    - :meth:`flush` waits for all queued tasks and should be called at session end, e.g. by ``mops.pytest_plugin``,
+      so failed writes can fail the run. Flush at interpreter exit is only a fallback.
+    """
+
+    def __init__(self, workers: int = 2, max_pending_bytes: int = 256 * 1024 * 1024):
+        self.workers = workers
+        self.max_pending_bytes = max_pending_bytes
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: Set[Future] = set()
+        self._path_futures: Dict[str, Future] = {}
+        self._errors: List[BaseException] = []
+        self._pending_bytes = 0
+        self._condition = threading.Condition()
+
+        atexit.register(self.flush)
+
+    @property
+    def pending(self) -> int:
+        """
+        Get count of queued and running tasks
+
+        :return: tasks count
+        """
+        return len(self._futures)
+
+    @property
+    def pending_bytes(self) -> int:
+        """
+        Get size of queued images in bytes
+
+        :return: bytes count
+        """
+        return self._pending_bytes
+
+    def submit(self, func: Callable, *args: Any, paths: Iterable[str] = (), nbytes: int = 0) -> Future:
+        """
+        Queue given function call
+
+        :param func: function to be called in the pool
+        :param args: function arguments
+        :param paths: file paths affected by the function. Task waits for previous tasks of same paths
+        :param nbytes: memory held by the task until its completion
+        :return: Future of function result
+        """
+        paths = tuple(paths)
+
+        with self._condition:
+            self._condition.wait_for(
+                lambda: not self._pending_bytes or self._pending_bytes + nbytes <= self.max_pending_bytes
+            )
+            dependencies = [self._path_futures[path] for path in paths if path in self._path_futures]
+            future = self._get_executor().submit(self._run, dependencies, func, *args)
+
+            self._pending_bytes += nbytes
+            self._futures.add(future)
+            self._path_futures.update(dict.fromkeys(paths, future))
+
+        future.add_done_callback(partial(self._release, paths, nbytes))
+        return future
+
+    def encode_image(self, image: numpy.ndarray) -> Future:
+        """
+        Queue PNG encoding of the given image
+
+        :param image: BGR numpy.ndarray
+        :return: Future of PNG bytes
+        """
+        return self.submit(encode_png, image, nbytes=image.nbytes)
+
+    def write_image(self, file: str, image: numpy.ndarray) -> Future:
+        """
+        Queue PNG encoding and writing of the given image
+
+        :param file: file path
+        :param image: BGR numpy.ndarray
+        :return: Future of PNG bytes
+        """
+        return self.submit(write_png, file, image, paths=(file,), nbytes=image.nbytes)
+
+    def move_file(self, source: str, destination: str) -> Future:
+        """
+        Queue file moving with replacement of existing destination
+
+        :param source: source file path
+        :param destination: destination file path
+        :return: Future
+        """
+        return self.submit(move_file, source, destination, paths=(source, destination))
+
+    def remove_files(self, *files: str) -> Future:
+        """
+        Queue files removing
+
+        :param files: file paths
+        :return: Future
+        """
+        return self.submit(remove_files, *files, paths=files)
+
+    def flush(self) -> None:
+        """
+        Wait for all queued tasks. Errors of finished tasks will be logged and the first one raised
+
+        :return: None
+        """
+        with self._condition:
+            futures = list(self._futures)
+
+        wait(futures)
+
+        with self._condition:
+            errors, self._errors = self._errors, []
+
+        for error in errors:
+            autolog(f'Artifact writing failed: {error!r}', level=LogLevel.ERROR)
+
+        if errors:
+            raise errors[0]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get thread pool, that will be created on the first task
+
+        :return: ThreadPoolExecutor
+        """
+        if not self._executor:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='mops_artifacts')
+
+        return self._executor
+
+    @staticmethod
+    def _run(dependencies: List[Future], func: Callable, *args: Any) -> Any:
+        """
+        Call given function after dependencies completion.
+        Dependencies always submitted earlier, so they are already taken by the pool workers
+
+        :param dependencies: futures of previous tasks of same paths
+        :param func: function to be called
+        :param args: function arguments
+        :return: function result
+        """
+        wait(dependencies)
+        return func(*args)
+
+    def _release(self, paths: tuple, nbytes: int, future: Future) -> None:
+        """
+        Release memory and paths of finished task
+
+        :param paths: file paths affected by the task
+        :param nbytes: memory held by the task
+        :param future: finished task
+        :return: None
+        """
+        with self._condition:
+            self._pending_bytes -= nbytes
+            self._futures.discard(future)
+
+            for path in paths:
+                if self._path_futures.get(path) is future:
+                    del self._path_futures[path]
+
+            if future.exception():
+                self._errors.append(future.exception())
+
+            self._condition.notify_all()
+
+
+artifact_writer = ArtifactWriter()
@@ -5,16 +5,17 @@ import inspect
 import time
 from copy import copy
 from functools import lru_cache, wraps
-from typing import Any, Union, Callable
+from typing import Any, Optional, Union, Callable
 
 from mops.mixins.objects.size import Size
 from mops.mixins.objects.wait_result import Result
 from selenium.common.exceptions import StaleElementReferenceException as SeleniumStaleElementReferenceException
 
 from mops.exceptions import NoSuchElementException, InvalidSelectorException, TimeoutException, NoSuchParentException
+from mops.utils.profiler import profile
+from mops.utils.wait_scheduler import WAIT_METHODS_DELAY, WaitScheduler, get_wait_scheduler
 
 
-WAIT_METHODS_DELAY = 0.1
 WAIT_UNIT = 1
 WAIT_EL = 10
 HALF_WAIT_EL = WAIT_EL / 2
@@ -293,38 +294,45 @@ def validate_silent(silent) -> bool:
     return silent
 
 
-def increase_delay(delay, max_delay: Union[int, float] = 1.5) -> Union[int, float]:
-    if delay < max_delay:
-        return delay + delay
-    return delay
-
-
 def wait_condition(method: Callable):
+    """
+    Decorator of the wait methods, that returns :class:`Result` of a single check.
+    The check is repeated by the :class:`WaitScheduler`, given with ``scheduler`` kwarg,
+    or set to the ``wait_scheduler`` attribute of the driver wrapper,
+    or the default one: 0.1 seconds delay, and the exponential delay for Appium
+
+    :param method: wait method
+    :return: wrapped method
+    """
 
     @wraps(method)
-    def wrapper(self, *args, timeout: Union[int, float] = WAIT_EL, silent: bool = False, **kwargs):
+    def wrapper(
+            self,
+            *args,
+            timeout: Union[int, float] = WAIT_EL,
+            silent: bool = False,
+            scheduler: Optional[WaitScheduler] = None,
+            **kwargs
+    ):
         validate_timeout(timeout)
         validate_silent(silent)
 
-        start_time = time.time()
-        result: Result = method(self, *args, **kwargs)
+        result: Optional[Result] = None
 
-        if not silent:
-            self.log(result.log)
+        def check() -> bool:
+            nonlocal result
+            is_first_check = result is None
+            result = method(self, *args, **kwargs)
 
-        should_increase_delay = self.driver_wrapper.is_appium
-        delay = WAIT_METHODS_DELAY
+            if is_first_check and not silent:
+                self.log(result.log)
 
-        while time.time() - start_time < timeout and not result.execution_result:
-            time.sleep(delay)
-            result: Result = method(self, *args, **kwargs)
-            if should_increase_delay:
-                delay = increase_delay(delay)
+            return bool(result.execution_result)
 
-        if result.execution_result:
+        if get_wait_scheduler(self.driver_wrapper, scheduler).run(check, timeout):
             return self
 
         result.exc._timeout = timeout  # noqa
         raise result.exc
 
-    return wrapper
+    return profile()(wrapper)
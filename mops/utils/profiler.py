@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import os
+import json
+import time
+import atexit
+import threading
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+DEFAULT_REPORT_PATH = 'mops_profile.json'
+SUMMARY_TOP_COUNT = 20
+
+
+@dataclass
+class ProfileRecord:
+    calls: int = 0
+    elapsed: float = 0.0  # seconds of all calls
+    top_elapsed: float = 0.0  # seconds of calls, that are not nested into other profiled calls
+    iterations: int = 0  # polling iterations of waits
+    round_trips: int = 0  # calls to the driver/browser
+
+
+@dataclass
+class ProfileFrame:
+    owner: Tuple[str, str]
+    iterations: int = 0
+
+
+def is_element_object(obj: Any) -> bool:
+    """
+    Check whether given object is an element with name and locator
+
+    :param obj: any object
+    :return: :obj:`True` if object is an element, otherwise :obj:`False`
+    """
+    return getattr(obj, 'locator', None) is not None and hasattr(obj, 'name')
+
+
+def get_owner(obj: Any, args: tuple, stack: List[ProfileFrame]) -> Tuple[str, str]:
+    """
+    Get name and locator of the element, that the profiled call belongs to.
+    Driver calls are attributed to the element of their arguments or to the element of the outer profiled call
+
+    :param obj: object of the profiled call
+    :param args: arguments of the profiled call
+    :param stack: frames of the outer profiled calls
+    :return: (name, locator)
+    """
+    element = obj if is_element_object(obj) else next((arg for arg in args if is_element_object(arg)), None)
+
+    if element is not None:
+        return str(element.name), str(element.locator)
+
+    if stack:
+        return stack[-1].owner
+
+    return str(getattr(obj, 'label', None) or type(obj).__name__), ''
+
+
+class Profiler:
+    """
+    Opt-in profiler of waits and driver round trips.
+
+    - Enabled by ``MOPS_PROFILE=1`` environment variable or :meth:`enable`.
+      Disabled profiler adds only a single attribute check to each profiled call;
+    - Call counts, elapsed time, polling iterations and round trips are collected
+      per test, element name, element locator and profiled method;
+    - Test name is taken from :attr:`current_test` or from the ``PYTEST_CURRENT_TEST`` environment variable;
+    - Sorted JSON report and text summary are saved at interpreter exit, see :meth:`save_report`.
+    """
+
+    def __init__(self):
+        self.enabled = os.getenv('MOPS_PROFILE', '').lower() in ('1', 'true', 'yes')
+        self.report_path = os.getenv('MOPS_PROFILE_REPORT', DEFAULT_REPORT_PATH)
+        self.current_test: Optional[str] = None
+        self.records: Dict[Tuple[str, str, str, str], ProfileRecord] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def enable(self, report_path: Optional[str] = None) -> None:
+        """
+        Enable profiling
+
+        :param report_path: path of the JSON report. Text summary is saved next to it with ``.txt`` extension
+        :return: None
+        """
+        self.enabled = True
+        self.report_path = report_path or self.report_path
+
+    def disable(self) -> None:
+        """
+        Disable profiling. Collected records are kept
+
+        :return: None
+        """
+        self.enabled = False
+
+    def reset(self) -> None:
+        """
+        Remove collected records
+
+        :return: None
+        """
+        with self._lock:
+            self.records.clear()
+
+    def get_test(self) -> str:
+        """
+        Get name of the current test
+
+        :return: test name or empty string
+        """
+        if self.current_test is not None:
+            return self.current_test
+
+        return os.getenv('PYTEST_CURRENT_TEST', '').rsplit(' ', 1)[0]
+
+    def measure(self, kind: str, is_round_trip: bool, method: Callable, obj: Any, *args, **kwargs) -> Any:
+        """
+        Call the method and record its profile
+
+        :param kind: name of the profiled method
+        :param is_round_trip: whether the call is a round trip to the driver/browser
+        :param method: profiled method
+        :param obj: object of the method
+        :param args: method arguments
+        :param kwargs: method keyword arguments
+        :return: result of the method
+        """
+        stack = self._get_stack()
+        frame = ProfileFrame(owner=get_owner(obj, args, stack))
+        stack.append(frame)
+        start_time = time.perf_counter()
+
+        try:
+            return method(obj, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start_time
+            stack.pop()
+            key = (self.get_test(), *frame.owner, kind)
+
+            with self._lock:
+                record = self.records.setdefault(key, ProfileRecord())
+                record.calls += 1
+                record.elapsed += elapsed
+                record.top_elapsed += 0 if stack else elapsed
+                record.iterations += frame.iterations
+                record.round_trips += int(is_round_trip)
+
+    def add_iterations(self, iterations: int) -> None:
+        """
+        Add polling iterations to the innermost profiled call of the current thread
+
+        :param iterations: iterations count
+        :return: None
+        """
+        stack = self._get_stack()
+
+        if stack:
+            stack[-1].iterations += iterations
+
+    def get_report(self) -> dict:
+        """
+        Get profile report, sorted by elapsed time
+
+        :return: report with total, per element, per test and per call values
+        """
+        with self._lock:
+            records = list(self.records.items())
+
+        def get_empty_summary(**values) -> dict:
+            return dict(values, elapsed=0.0, round_trips=0, iterations=0)
+
+        total = get_empty_summary()
+        elements, tests, calls = {}, {}, []
+
+        for (test, name, locator, kind), record in records:
+            element = elements.setdefault((name, locator), get_empty_summary(name=name, locator=locator, calls={}))
+            test_summary = tests.setdefault(test, get_empty_summary(test=test))
+
+            for summary in (total, element, test_summary):
+                summary['elapsed'] += record.top_elapsed
+                summary['round_trips'] += record.round_trips
+                summary['iterations'] += record.iterations
+
+            element['calls'][kind] = element['calls'].get(kind, 0) + record.calls
+            calls.append(dict(
+                test=test, name=name, locator=locator, kind=kind, calls=record.calls, elapsed=record.elapsed,
+                iterations=record.iterations, round_trips=record.round_trips,
+            ))
+
+        def get_sorted(items) -> list:
+            return sorted(items, key=lambda item: (item['elapsed'], item['round_trips']), reverse=True)
+
+        return {
+            'total': total,
+            'elements': get_sorted(elements.values()),
+            'tests': get_sorted(tests.values()),
+            'calls': get_sorted(calls),
+        }
+
+    def get_summary(self, report: Optional[dict] = None) -> str:
+        """
+        Get text summary of the profile report
+
+        :param report: report from :meth:`get_report`. Taken from collected records, if not given
+        :return: summary text
+        """
+        report = report or self.get_report()
+        total = report['total']
+        lines = [
+            f'Profiled: {total["elapsed"]:.3f}s, {total["round_trips"]} round trips, '
+            f'{total["iterations"]} wait iterations',
+            '',
+            'Elements:',
+        ]
+
+        for element in report['elements'][:SUMMARY_TOP_COUNT]:
+            locator = f' ({element["locator"]})' if element['locator'] else ''
+            lines.append(
+                f'  {element["elapsed"]:9.3f}s {element["round_trips"]:6} round trips {element["iterations"]:6} '
+                f'iterations  "{element["name"]}"{locator}'
+            )
+
+        lines.extend(['', 'Tests:'])
+
+        for test in report['tests'][:SUMMARY_TOP_COUNT]:
+            lines.append(
+                f'  {test["elapsed"]:9.3f}s {test["round_trips"]:6} round trips {test["iterations"]:6} '
+                f'iterations  {test["test"] or "<outside of tests>"}'
+            )
+
+        return '\n'.join(lines)
+
+    def save_report(self, path: Optional[str] = None) -> Optional[str]:
+        """
+        Save JSON report and text summary of collected records. Called automatically at interpreter exit
+
+        :param path: path of the JSON report. :attr:`report_path` by default
+        :return: path of the JSON report or :obj:`None`, if there is nothing to report
+        """
+        if not self.records:
+            return None
+
+        from mops.utils.logs import autolog  # logs module depends on internal utils, that use the profiler
+
+        path = path or self.report_path
+        report = self.get_report()
+        summary = self.get_summary(report)
+
+        with open(path, 'w') as report_file:
+            json.dump(report, report_file, indent=2)
+
+        with open(f'{os.path.splitext(path)[0]}.txt', 'w') as summary_file:
+            summary_file.write(summary)
+
+        autolog(f'Profile report saved to {path}\n{summary}')
+        return path
+
+    def _get_stack(self) -> List[ProfileFrame]:
+        """
+        Get frames of profiled calls of the current thread
+
+        :return: list of frames
+        """
+        stack = getattr(self._local, 'stack', None)
+
+        if stack is None:
+            stack = self._local.stack = []
+
+        return stack
+
+
+profiler = Profiler()
+
+
+def profile(is_round_trip: bool = False) -> Callable:
+    """
+    Decorator of the methods to be profiled by :obj:`profiler`
+
+    :param is_round_trip: whether each call is a round trip to the driver/browser
+    :return: decorator
+    """
+
+    def decorator(method: Callable) -> Callable:
+        kind = method.__name__
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not profiler.enabled:
+                return method(self, *args, **kwargs)
+
+            return profiler.measure(kind, is_round_trip, method, self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def profile_commands(obj: Any, method_name: str = 'execute') -> None:
+    """
+    Profile each call of the object method, that sends a command to the driver/browser, as a round trip,
+    named by the command and attributed to the outer profiled call.
+    Only given object is affected, the method of its class is kept as is
+
+    :param obj: driver object ~ Selenium/Appium WebDriver
+    :param method_name: name of the method with the command name as the first argument
+    :return: None
+    """
+    method = getattr(type(obj), method_name, None)
+
+    if method is None or method_name in vars(obj):
+        return
+
+    @wraps(method)
+    def wrapper(command: str, *args, **kwargs):
+        if not profiler.enabled:
+            return method(obj, command, *args, **kwargs)
+
+        return profiler.measure(command, True, method, obj, command, *args, **kwargs)
+
+    setattr(obj, method_name, wrapper)
+
+
+atexit.register(profiler.save_report)
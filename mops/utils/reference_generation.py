@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import os
+import json
+import atexit
+import threading
+from collections import Counter
+from typing import Dict
+
+from mops.utils.artifact_writer import ArtifactWriter
+from mops.utils.logs import autolog
+
+
+CREATED = 'created'
+CHANGED = 'changed'
+UNCHANGED = 'unchanged'
+
+
+class ReferenceGenerationManifest:
+    """
+    Summary of references generation of the reference directory:
+    maps each generated reference (path relative to the reference directory) to its status -
+    ``created``, ``changed`` or ``unchanged``.
+    Entries of the existing manifest are kept on saving, so parallel sessions are merged into the single manifest.
+    """
+
+    manifest_name = '.mops_generation_manifest.json'
+
+    def __init__(self, reference_directory: str):
+        self.reference_directory = reference_directory
+        self.manifest_path = os.path.join(reference_directory, self.manifest_name)
+        self.entries: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def summary(self) -> Dict[str, int]:
+        """
+        Get count of references of each status, recorded in the current session
+
+        :return: dict with created, changed and unchanged counts
+        """
+        counter = Counter(self.entries.values())
+        return {status: counter[status] for status in (CREATED, CHANGED, UNCHANGED)}
+
+    def record(self, reference_file: str, status: str) -> None:
+        """
+        Record status of the generated reference
+
+        :param reference_file: reference file path
+        :param status: ``created``, ``changed`` or ``unchanged``
+        :return: None
+        """
+        with self._lock:
+            self.entries[os.path.relpath(reference_file, self.reference_directory)] = status
+
+    def save(self) -> None:
+        """
+        Save manifest to the reference directory, if any reference was recorded
+
+        :return: None
+        """
+        with self._lock:
+            if not self.entries or not os.path.isdir(self.reference_directory):
+                return None
+
+            entries = {**self._load(), **self.entries}
+            temp_path = f'{self.manifest_path}.{os.getpid()}.tmp'
+
+            with open(temp_path, 'w') as manifest_file:
+                json.dump(entries, manifest_file, sort_keys=True, indent=1)
+
+            os.replace(temp_path, self.manifest_path)
+
+    def _load(self) -> Dict[str, str]:
+        """
+        Load manifest from the reference directory
+
+        :return: manifest entries
+        """
+        try:
+            with open(self.manifest_path) as manifest_file:
+                return json.load(manifest_file)
+        except (OSError, ValueError):
+            return {}
+
+
+reference_generator = ArtifactWriter(workers=os.cpu_count() or 2)
+generation_manifests: Dict[str, ReferenceGenerationManifest] = {}
+
+
+def get_generation_manifest(reference_directory: str) -> ReferenceGenerationManifest:
+    """
+    Get process-wide generation manifest of given reference directory
+
+    :param reference_directory: reference directory path
+    :return: ReferenceGenerationManifest
+    """
+    if reference_directory not in generation_manifests:
+        generation_manifests[reference_directory] = ReferenceGenerationManifest(reference_directory)
+
+    return generation_manifests[reference_directory]
+
+
+def flush_reference_generation() -> None:
+    """
+    Wait for all queued references generation tasks and save generation manifests.
+    Should be called at session end, e.g. by ``mops.pytest_plugin``, so failed generation can fail the run.
+    Also called automatically at interpreter exit as a fallback
+
+    :return: None
+    """
+    try:
+        reference_generator.flush()
+    finally:
+        for manifest in generation_manifests.values():
+            if manifest.entries:
+                summary = ', '.join(f'{count} {status}' for status, count in manifest.summary.items())
+                autolog(f'References generation: {summary}. Manifest: {manifest.manifest_path}')
+            manifest.save()
+
+
+atexit.register(flush_reference_generation)
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import os
+import json
+import shutil
+import hashlib
+from typing import Optional, Dict, List, Tuple
+
+try:
+    import cv2.cv2 as cv2  # ~cv2@4.5.5.62 + python@3.8/9/10
+except ImportError:
+    import cv2  # ~cv2@4.10.0.84 + python@3.11/12
+import numpy
+
+from mops.utils.reference_storage import get_image_digest, get_reference_index
+
+
+HASH_SIZE = 8  # perceptual hash is HASH_SIZE x HASH_SIZE bits
+
+
+def get_perceptual_hash(image: numpy.ndarray) -> int:
+    """
+    Get difference hash (dHash) of the image: each bit shows whether the brightness
+    grows between neighbour pixels of the downscaled grayscale image.
+    Near-identical images have hashes with small hamming distance
+
+    :param image: BGR or grayscale image
+    :return: 64-bit hash
+    """
+    if image.ndim == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+    small_image = cv2.resize(image, (HASH_SIZE + 1, HASH_SIZE), interpolation=cv2.INTER_AREA)
+    bits = (small_image[:, 1:] > small_image[:, :-1]).flatten()
+    return int(numpy.packbits(bits).view('>u8')[0])
+
+
+def get_hamming_distances(hashes: numpy.ndarray, perceptual_hash: int) -> numpy.ndarray:
+    """
+    Get hamming distances between given hashes and the hash
+
+    :param hashes: array of 64-bit hashes
+    :param perceptual_hash: 64-bit hash
+    :return: array of distances
+    """
+    xor = numpy.bitwise_xor(hashes, numpy.uint64(perceptual_hash))
+    return numpy.unpackbits(xor.view(numpy.uint8)).reshape(-1, 64).sum(axis=1)
+
+
+class ReferenceLibrary:
+    """
+    Deduplicated storage of reference images with perceptual hash index.
+
+    - Each unique file content stored once in ``blobs`` directory, named by its sha256 digest;
+    - Manifest maps reference names (paths relative to the reference directory)
+      to the blob, pixels digest and perceptual hash;
+    - References can be restored to the reference directory as copies of the blobs,
+      with pre-filled reference digest index, so they will not be decoded for the exact-match check.
+      Copies, not hard links: references are written in place on generation, that would change the blob
+      and all references with the same content.
+    """
+
+    manifest_name = 'manifest.json'
+    blobs_directory_name = 'blobs'
+
+    def __init__(self, library_directory: str):
+        self.library_directory = library_directory
+        self.blobs_directory = os.path.join(library_directory, self.blobs_directory_name)
+        self.manifest_path = os.path.join(library_directory, self.manifest_name)
+        self.entries: Dict[str, dict] = self._load()
+        self._blobs: Dict[str, dict] = {entry['blob']: entry for entry in self.entries.values()}
+        self._hashes: Optional[Tuple[List[str], numpy.ndarray]] = None
+
+    @property
+    def blobs_count(self) -> int:
+        """
+        Get count of unique stored files
+
+        :return: blobs count
+        """
+        return len(self._blobs)
+
+    def add(self, name: str, file: str) -> dict:
+        """
+        Add reference file to the library. File content will be stored only if it's not stored yet
+
+        :param name: reference name ~ 'test_screenshot_rubiks_cube_playwright_chromium.png'
+        :param file: reference file path
+        :return: manifest entry of the reference
+        """
+        with open(file, 'rb') as reference_file:
+            data = reference_file.read()
+
+        blob = hashlib.sha256(data).hexdigest()
+        blob_path = self.get_blob_path(blob)
+
+        entry = self._blobs.get(blob)
+        if entry is None:
+            image = cv2.imdecode(numpy.frombuffer(data, dtype=numpy.uint8), cv2.IMREAD_COLOR)
+            if image is None:
+                raise ValueError(f'Cannot decode reference file "{file}"')
+
+            entry = {'blob': blob, 'digest': get_image_digest(image), 'hash': f'{get_perceptual_hash(image):016x}'}
+
+        if not os.path.exists(blob_path):
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            with open(f'{blob_path}.tmp', 'wb') as blob_file:
+                blob_file.write(data)
+            os.replace(f'{blob_path}.tmp', blob_path)
+
+        self.entries[name] = self._blobs[blob] = dict(entry)
+        self._hashes = None
+        return self.entries[name]
+
+    def add_directory(self, reference_directory: str) -> int:
+        """
+        Add all PNG references of given directory, including subdirectories
+
+        :param reference_directory: reference directory path
+        :return: count of added references
+        """
+        count = 0
+
+        for root, _, files in os.walk(reference_directory):
+            for file in sorted(files):
+                if file.endswith('.png'):
+                    path = os.path.join(root, file)
+                    self.add(os.path.relpath(path, reference_directory), path)
+                    count += 1
+
+        return count
+
+    def restore(self, reference_directory: str, names: Optional[List[str]] = None) -> int:
+        """
+        Restore references to the given directory as copies of the blobs and fill the reference digest index
+
+        :param reference_directory: reference directory path
+        :param names: reference names to restore. :obj:`None` - all references
+        :return: count of restored references
+        """
+        reference_index = get_reference_index(reference_directory)
+        names = names if names is not None else list(self.entries)
+
+        for name in names:
+            entry = self.entries[name]
+            path = os.path.join(reference_directory, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            if os.path.exists(path):
+                os.remove(path)
+
+            shutil.copyfile(self.get_blob_path(entry['blob']), path)
+
+            reference_index.set_digest(path, entry['digest'])
+
+        return len(names)
+
+    def find_nearest(
+            self,
+            image: numpy.ndarray,
+            count: int = 1,
+            max_distance: Optional[int] = None,
+    ) -> List[Tuple[str, int]]:
+        """
+        Find references with the closest perceptual hash to the given image
+
+        :param image: BGR or grayscale image
+        :param count: maximum count of references to return
+        :param max_distance: maximum hamming distance between hashes (0-64). :obj:`None` - any distance
+        :return: list of (reference name, hamming distance), sorted by distance
+        """
+        if not self.entries:
+            return []
+
+        if self._hashes is None:
+            names = list(self.entries)
+            hashes = numpy.array([int(self.entries[name]['hash'], 16) for name in names], dtype=numpy.uint64)
+            self._hashes = names, hashes
+
+        names, hashes = self._hashes
+        distances = get_hamming_distances(hashes, get_perceptual_hash(image))
+        nearest = numpy.argsort(distances, kind='stable')[:count]
+
+        return [
+            (names[index], int(distances[index]))
+            for index in nearest
+            if max_distance is None or distances[index] <= max_distance
+        ]
+
+    def get_blob_path(self, blob: str) -> str:
+        """
+        Get path of the blob in the library
+
+        :param blob: sha256 digest of the file content
+        :return: blob path
+        """
+        return os.path.join(self.blobs_directory, blob[:2], f'{blob}.png')
+
+    def save(self) -> None:
+        """
+        Save manifest to the library directory
+
+        :return: None
+        """
+        os.makedirs(self.library_directory, exist_ok=True)
+        temp_path = f'{self.manifest_path}.{os.getpid()}.tmp'
+
+        with open(temp_path, 'w') as manifest_file:
+            json.dump(self.entries, manifest_file, sort_keys=True, indent=1)
+
+        os.replace(temp_path, self.manifest_path)
+
+    def _load(self) -> Dict[str, dict]:
+        """
+        Load manifest from the library directory
+
+        :return: manifest entries
+        """
+        try:
+            with open(self.manifest_path) as manifest_file:
+                return json.load(manifest_file)
+        except (OSError, ValueError):
+            return {}
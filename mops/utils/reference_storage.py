@@ -0,0 +1,414 @@
+from __future__ import annotations
+
+import os
+import glob
+import json
+import atexit
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Dict, Set, Tuple, Union
+
+try:
+    import cv2.cv2 as cv2  # ~cv2@4.5.5.62 + python@3.8/9/10
+except ImportError:
+    import cv2  # ~cv2@4.10.0.84 + python@3.11/12
+import numpy
+
+from mops.utils.logs import autolog
+
+
+def get_image_digest(image: numpy.ndarray) -> str:
+    """
+    Get digest of decoded image pixels, that includes image shape
+
+    :param image: decoded image
+    :return: digest string ~ '1080x1920x3:4f2a...'
+    """
+    shape = 'x'.join(str(item) for item in image.shape)
+    pixels_hash = hashlib.blake2b(numpy.ascontiguousarray(image).data, digest_size=16).hexdigest()
+    return f'{shape}:{pixels_hash}'
+
+
+class ReferenceIndex:
+    """
+    Sidecar index of reference directory, that maps each reference file
+    to the digest of its decoded pixels and the modification time of the file.
+    Outdated entries are rebuilt incrementally, when the reference modification time changes.
+    """
+
+    index_name = '.mops_reference_index.json'
+
+    def __init__(self, reference_directory: str):
+        self.reference_directory = reference_directory
+        self.index_path = os.path.join(reference_directory, self.index_name)
+        self.entries: Dict[str, dict] = self._load()
+        self._removed_keys: Set[str] = set()
+        self._lock = threading.Lock()
+        self._is_changed = False
+
+        atexit.register(self.save)
+
+    def get_digest(self, reference_file: str) -> Optional[str]:
+        """
+        Get digest of given reference file. Reference will be decoded only if index entry is missing or outdated
+
+        :param reference_file: reference file path
+        :return: digest or :obj:`None` if reference file not found or cannot be decoded
+        """
+        try:
+            mtime = os.path.getmtime(reference_file)
+        except OSError:
+            return None
+
+        entry = self.entries.get(self._get_key(reference_file))
+        if entry and entry['mtime'] == mtime:
+            return entry['digest']
+
+        return self.update(reference_file)
+
+    def update(self, reference_file: str, image: Optional[numpy.ndarray] = None) -> Optional[str]:
+        """
+        Update index entry of given reference file
+
+        :param reference_file: reference file path
+        :param image: already decoded reference image (optional). Reference will be decoded if :obj:`None` given
+        :return: digest or :obj:`None` if reference file not found or cannot be decoded
+        """
+        key = self._get_key(reference_file)
+
+        try:
+            mtime = os.path.getmtime(reference_file)
+        except OSError:
+            mtime = None
+
+        image = image if image is not None else reference_cache.get(reference_file)
+
+        with self._lock:
+            if mtime is None or image is None:
+                self._is_changed |= self.entries.pop(key, None) is not None
+                self._removed_keys.add(key)
+                return None
+
+            digest = get_image_digest(image)
+            self.entries[key] = {'digest': digest, 'mtime': mtime}
+            self._removed_keys.discard(key)
+            self._is_changed = True
+
+        return digest
+
+    def set_digest(self, reference_file: str, digest: str) -> None:
+        """
+        Set already known digest of given reference file, without its decoding
+
+        :param reference_file: reference file path
+        :param digest: digest of the reference pixels
+        :return: None
+        """
+        mtime = os.path.getmtime(reference_file)
+
+        key = self._get_key(reference_file)
+
+        with self._lock:
+            self.entries[key] = {'digest': digest, 'mtime': mtime}
+            self._removed_keys.discard(key)
+            self._is_changed = True
+
+    def save(self) -> None:
+        """
+        Save index to the reference directory, if it was changed.
+        Entries, saved by other processes, are kept, except the ones removed by this process.
+        Called automatically at interpreter exit
+
+        :return: None
+        """
+        with self._lock:
+            if not self._is_changed or not os.path.isdir(self.reference_directory):
+                return None
+
+            entries = {**self._load(), **self.entries}
+            for key in self._removed_keys:
+                entries.pop(key, None)
+
+            temp_path = f'{self.index_path}.{os.getpid()}.tmp'
+
+            with open(temp_path, 'w') as index_file:
+                json.dump(entries, index_file, sort_keys=True)
+
+            os.replace(temp_path, self.index_path)
+            self._removed_keys.clear()
+            self._is_changed = False
+
+    def _load(self) -> Dict[str, dict]:
+        """
+        Load index from the reference directory
+
+        :return: index entries
+        """
+        try:
+            with open(self.index_path) as index_file:
+                return json.load(index_file)
+        except (OSError, ValueError):
+            return {}
+
+    def _get_key(self, reference_file: str) -> str:
+        """
+        Get index key of given reference file
+
+        :param reference_file: reference file path
+        :return: path relative to the reference directory
+        """
+        return os.path.relpath(reference_file, self.reference_directory)
+
+
+RAW_DIRECTORY_NAME = '.mops_raw'
+
+
+def get_raw_image_path(file: str, size: Union[int, str]) -> str:
+    """
+    Get path of the raw pixels cache of given image file.
+    Raw file name contains the image file size, so the replaced image doesn't match the raw file of previous one
+
+    :param file: image file path
+    :param size: image file size in bytes or glob pattern of it
+    :return: path ~ 'reference/.mops_raw/test_screenshot.png.10240.npy'
+    """
+    directory, name = os.path.split(file)
+    return os.path.join(directory, RAW_DIRECTORY_NAME, f'{name}.{size}.npy')
+
+
+def read_raw_image(file: str) -> Optional[numpy.ndarray]:
+    """
+    Load raw pixels of given image file as read-only memory map, without decoding.
+    Raw file is valid only if its modification time and the size from its name equal to the image file ones
+
+    :param file: image file path
+    :return: BGR numpy.memmap or :obj:`None` if raw file is missing or outdated
+    """
+    try:
+        stat = os.stat(file)
+        raw_file = get_raw_image_path(file, stat.st_size)
+
+        if os.stat(raw_file).st_mtime_ns != stat.st_mtime_ns:
+            return None
+        return numpy.load(raw_file, mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+
+
+def write_raw_image(file: str, image: numpy.ndarray) -> None:
+    """
+    Write raw pixels of given image file. Raw file gets the modification time of the image file.
+    Raw files of the previous versions of the image file are removed
+
+    :param file: image file path
+    :param image: decoded image
+    :return: None
+    """
+    temp_file = None
+
+    try:
+        stat = os.stat(file)
+        raw_file = get_raw_image_path(file, stat.st_size)
+        temp_file = f'{raw_file}.{os.getpid()}.{threading.get_ident()}.tmp'
+        os.makedirs(os.path.dirname(raw_file), exist_ok=True)
+
+        with open(temp_file, 'wb') as raw:
+            numpy.save(raw, numpy.ascontiguousarray(image), allow_pickle=False)
+
+        os.utime(temp_file, ns=(stat.st_mtime_ns, stat.st_mtime_ns))
+        os.replace(temp_file, raw_file)
+
+        for outdated_file in glob.glob(get_raw_image_path(glob.escape(file), '*')):
+            if outdated_file != raw_file:
+                os.remove(outdated_file)
+    except OSError:
+        if temp_file and os.path.exists(temp_file):
+            os.remove(temp_file)
+
+
+class ReferenceCache:
+    """
+    Process-wide cache of decoded reference images with LRU eviction.
+    Entries are keyed by file path and validated by file modification time and size,
+    so the changed reference will be decoded again.
+    Cached images are read-only to be safely shared between comparisons.
+
+    With :obj:`use_raw_cache` decoded pixels are also stored next to the reference as ``.npy`` file,
+    that is memory-mapped instead of PNG decoding on the next cache miss, including other processes.
+    """
+
+    def __init__(self, max_bytes: int = 512 * 1024 * 1024, use_raw_cache: bool = False):
+        self.max_bytes = max_bytes
+        self.use_raw_cache = use_raw_cache
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, Tuple[Tuple[int, int], numpy.ndarray]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """
+        Get total size of cached images in bytes
+
+        :return: bytes count
+        """
+        return self._size
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics, that can be logged at session end
+
+        :return: dict with hits, misses, evictions, entries and bytes counts
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self._size,
+        }
+
+    def log_stats(self) -> None:
+        """
+        Log cache statistics. Nothing is logged, if the cache wasn't used.
+        Should be called at session end, also called automatically at interpreter exit
+
+        :return: None
+        """
+        if self.hits or self.misses:
+            autolog(f'Reference cache: {", ".join(f"{name}={value}" for name, value in self.stats.items())}')
+
+    def get(self, file: str) -> Optional[numpy.ndarray]:
+        """
+        Get decoded image of given file. File will be decoded only if cache entry is missing or outdated
+
+        :param file: image file path
+        :return: read-only BGR numpy.ndarray or :obj:`None` if file not found or cannot be decoded
+        """
+        version = self._get_version(file)
+        if version is None:
+            self.discard(file)
+            return None
+
+        with self._lock:
+            entry = self._entries.get(file)
+            if entry and entry[0] == version:
+                self._entries.move_to_end(file)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        image = read_raw_image(file) if self.use_raw_cache else None
+
+        if image is None:
+            image = cv2.imread(file)
+            if image is not None and self.use_raw_cache:
+                write_raw_image(file, image)
+
+        if image is not None:
+            self._store(file, version, image)
+
+        return image
+
+    def put(self, file: str, image: numpy.ndarray) -> numpy.ndarray:
+        """
+        Store already decoded image of given file, that was just saved
+
+        :param file: image file path
+        :param image: decoded image
+        :return: read-only copy of the image
+        """
+        image = image.copy()
+        version = self._get_version(file)
+
+        if version is None:
+            self.discard(file)
+        else:
+            if self.use_raw_cache:
+                write_raw_image(file, image)
+            self._store(file, version, image)
+
+        return image
+
+    def discard(self, file: str) -> None:
+        """
+        Remove cache entry of given file
+
+        :param file: image file path
+        :return: None
+        """
+        with self._lock:
+            entry = self._entries.pop(file, None)
+            if entry:
+                self._size -= entry[1].nbytes
+
+    def clear(self) -> None:
+        """
+        Remove all cache entries and reset statistics
+
+        :return: None
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = self.hits = self.misses = self.evictions = 0
+
+    def _store(self, file: str, version: Tuple[int, int], image: numpy.ndarray) -> None:
+        """
+        Store image and evict least recently used entries to fit the bytes budget
+
+        :param file: image file path
+        :param version: file modification time and size
+        :param image: decoded image
+        :return: None
+        """
+        image.flags.writeable = False
+
+        with self._lock:
+            entry = self._entries.pop(file, None)
+            if entry:
+                self._size -= entry[1].nbytes
+
+            if image.nbytes > self.max_bytes:
+                return None
+
+            while self._entries and self._size + image.nbytes > self.max_bytes:
+                self._size -= self._entries.popitem(last=False)[1][1].nbytes
+                self.evictions += 1
+
+            self._entries[file] = (version, image)
+            self._size += image.nbytes
+
+    @staticmethod
+    def _get_version(file: str) -> Optional[Tuple[int, int]]:
+        """
+        Get version of given file
+
+        :param file: file path
+        :return: (modification time in ns, size) or :obj:`None` if file not found
+        """
+        try:
+            stat = os.stat(file)
+        except OSError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size
+
+
+reference_cache = ReferenceCache()
+atexit.register(reference_cache.log_stats)
+
+
+@lru_cache(maxsize=None)
+def get_reference_index(reference_directory: str) -> ReferenceIndex:
+    """
+    Get process-wide index of given reference directory
+
+    :param reference_directory: reference directory path
+    :return: ReferenceIndex
+    """
+    return ReferenceIndex(reference_directory)
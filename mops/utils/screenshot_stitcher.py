@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy
+
+
+MAX_FIXED_ROWS_RATIO = 0.25  # sticky header and footer together can't take more of the viewport
+OFFSET_SEARCH_RADIUS = 3  # rows around expected scroll offset to search for the best overlap
+
+
+def get_rows_hashes(image: numpy.ndarray) -> numpy.ndarray:
+    """
+    Get hash of each image row: weighted sum of row values with overflow
+
+    :param image: image array of shape (height, width) or (height, width, channels)
+    :return: uint64 array of rows hashes
+    """
+    rows = image.reshape(image.shape[0], -1)
+    weights = numpy.random.default_rng(rows.shape[1]).integers(1, 2 ** 63, rows.shape[1], dtype=numpy.uint64)
+    return rows.astype(numpy.uint64) @ weights
+
+
+def get_equal_rows_count(previous_hashes: numpy.ndarray, hashes: numpy.ndarray, reverse: bool = False) -> int:
+    """
+    Get count of leading (or trailing) rows, that are equal on the same positions of two frames
+
+    :param previous_hashes: rows hashes of the previous frame
+    :param hashes: rows hashes of the current frame
+    :param reverse: count trailing rows instead of leading ones
+    :return: rows count
+    """
+    is_different = previous_hashes != hashes
+    is_different = is_different[::-1] if reverse else is_different
+    return int(is_different.argmax()) if is_different.any() else len(is_different)
+
+
+class ScreenshotStitcher:
+    """
+    Streaming stitcher of scrolled viewport frames into a single full page image.
+
+    - The page image is allocated once, and each frame is written into it right away,
+      so only rows hashes of the previous frame are kept between frames;
+    - Scroll offset of each frame is refined with rows hashes of the overlapped area;
+    - Sticky header and footer are detected as rows, that stay on the same position after scroll.
+      They are kept only at the top and at the bottom of the page.
+    """
+
+    def __init__(self, width: int, height: int, channels: int = 3):
+        self.image = numpy.zeros((height, width, channels), dtype=numpy.uint8)
+        self.header_height = 0
+        self.footer_height = 0
+        self._previous_hashes: Optional[numpy.ndarray] = None
+        self._previous_offset = 0
+
+    def get_step(self, frame_height: int) -> int:
+        """
+        Get scroll step in rows for the next frame, that keeps page rows hidden by sticky elements covered.
+        Before the sticky elements are detected, the step is limited to keep room for them
+
+        :param frame_height: viewport frame height
+        :return: rows count
+        """
+        if self._previous_hashes is not None and self.header_height + self.footer_height:
+            return frame_height - self.header_height - self.footer_height
+
+        return max(int(frame_height * (1 - MAX_FIXED_ROWS_RATIO)), 1)
+
+    def add(self, frame: numpy.ndarray, offset: int, is_last: bool = False) -> int:
+        """
+        Write viewport frame into the page image
+
+        :param frame: viewport frame array
+        :param offset: expected frame offset from the page top in rows
+        :param is_last: whether frame is the last one. Sticky footer is kept only for the last frame
+        :return: refined frame offset
+        """
+        height = frame.shape[0]
+        hashes = get_rows_hashes(frame)
+
+        if self._previous_hashes is None:
+            start = 0
+        else:
+            offset = self._get_offset(hashes, offset)
+            shift = offset - self._previous_offset
+
+            if shift > 0:
+                max_fixed_rows = min(height - shift, int(height * MAX_FIXED_ROWS_RATIO))
+                header_height = get_equal_rows_count(self._previous_hashes, hashes)
+                footer_height = get_equal_rows_count(self._previous_hashes, hashes, reverse=True)
+
+                if header_height + footer_height <= max_fixed_rows:
+                    self.header_height, self.footer_height = header_height, footer_height
+
+            start = self.header_height
+
+        end = height if is_last or self._previous_hashes is None else height - self.footer_height
+        end = min(end, self.image.shape[0] - offset)
+
+        if start < end:
+            self.image[offset + start:offset + end] = frame[start:end]
+
+        self._previous_hashes, self._previous_offset = hashes, offset
+        return offset
+
+    def _get_offset(self, hashes: numpy.ndarray, offset: int) -> int:
+        """
+        Refine expected frame offset by the best match of rows in the overlapped area with the previous frame
+
+        :param hashes: rows hashes of the current frame
+        :param offset: expected frame offset from the page top
+        :return: frame offset
+        """
+        height = len(hashes)
+        best_offset, best_ratio = offset, -1.0
+
+        for candidate in range(offset - OFFSET_SEARCH_RADIUS, offset + OFFSET_SEARCH_RADIUS + 1):
+            shift = candidate - self._previous_offset
+            if shift < 0 or shift >= height or candidate < 0:
+                continue
+
+            matches = self._previous_hashes[shift:] == hashes[:height - shift]
+            ratio = float(matches.mean())
+
+            if ratio > best_ratio or (ratio == best_ratio and abs(candidate - offset) < abs(best_offset - offset)):
+                best_offset, best_ratio = candidate, ratio
+
+        return best_offset
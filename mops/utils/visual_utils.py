@@ -0,0 +1,392 @@
+from __future__ import annotations
+
+import os
+import atexit
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Tuple, Optional, List
+
+try:
+    import cv2.cv2 as cv2  # ~cv2@4.5.5.62 + python@3.8/9/10
+except ImportError:
+    import cv2  # ~cv2@4.10.0.84 + python@3.11/12
+import numpy
+from PIL import Image
+from skimage.metrics import structural_similarity
+
+from mops.mixins.objects.diff_region import DiffRegion
+
+
+SSIM_WINDOW = 7  # default structural_similarity window size
+SSIM_PAD = (SSIM_WINDOW - 1) // 2
+SSIM_TILE_HEIGHT = 512
+DIFF_BLOCK_SIZE = 32  # block size of the coarse difference map
+DIFF_DENSE_RATIO = 0.5  # changed area ratio, starting from which SSIM calculated for the whole image
+DIFF_MIN_CONTOUR_AREA = 40  # smaller diff regions are highlighted only if images are different enough
+
+DEFAULT_ENGINE = 'default'
+THREADS_ENGINE = 'threads'
+PROCESSES_ENGINE = 'processes'
+ssim_engines = (DEFAULT_ENGINE, THREADS_ENGINE, PROCESSES_ENGINE)
+
+_ssim_executor: Optional[Tuple[str, int, Executor]] = None  # engine, workers count and pool
+_ssim_executor_lock = threading.Lock()
+
+pil_to_bgr_conversions = {
+    'RGBA': cv2.COLOR_RGBA2BGR,
+    'RGB': cv2.COLOR_RGB2BGR,
+    'L': cv2.COLOR_GRAY2BGR,
+}
+
+
+def get_ssim_score(ssim_map: numpy.ndarray) -> float:
+    """
+    Calculate mean SSIM score from the full SSIM map, same as skimage does:
+    filter radius strip around edges is ignored to avoid edge effects
+
+    :param ssim_map: full SSIM map
+    :return: SSIM score in range [-1, 1]
+    """
+    return float(ssim_map[SSIM_PAD:-SSIM_PAD, SSIM_PAD:-SSIM_PAD].mean(dtype=numpy.float64))
+
+
+def get_ssim_map_image(ssim_map: numpy.ndarray) -> numpy.ndarray:
+    """
+    Convert SSIM map to 8-bit image. Values are rounded, so float rounding of SSIM around 1
+    gives 255, same as the map filled without calculation
+
+    :param ssim_map: SSIM map in range [-1, 1]
+    :return: SSIM map in range [0, 255]
+    """
+    return numpy.clip(numpy.rint(ssim_map * 255), 0, 255).astype(numpy.uint8)
+
+
+def get_ssim_tiles(height: int, tile_height: int = SSIM_TILE_HEIGHT) -> List[Tuple[int, int]]:
+    """
+    Split image rows into horizontal strips for SSIM calculation
+
+    :param height: image height
+    :param tile_height: height of one strip (without overlap)
+    :return: list of (start row, end row) of each strip
+    """
+    tiles = [(start, min(start + tile_height, height)) for start in range(0, height, tile_height)]
+
+    # Too short last strip will be merged with previous one, to stay bigger than SSIM window
+    if len(tiles) > 1 and tiles[-1][1] - tiles[-1][0] < SSIM_WINDOW:
+        last_start, last_end = tiles.pop()
+        tiles[-1] = (tiles[-1][0], last_end)
+
+    return tiles
+
+
+def structural_similarity_full(
+        reference_img: numpy.ndarray,
+        actual_img: numpy.ndarray,
+        engine: str = DEFAULT_ENGINE,
+        workers: Optional[int] = None,
+) -> Tuple[float, numpy.ndarray]:
+    """
+    Compute SSIM score and full SSIM map of two grayscale images
+
+    - ``default`` engine: single ``skimage.metrics.structural_similarity`` call over the whole image;
+    - ``threads``/``processes`` engines: image split into horizontal strips, which are overlapped by
+      SSIM window radius and calculated in the thread/process pool. Overlapped rows are dropped while stitching,
+      so each value of the map calculated from the same pixels as within the ``default`` engine.
+      Difference with ``default`` engine is limited by float rounding (less than 1e-9 for score and map values)
+
+    :param reference_img: grayscale reference image
+    :param actual_img: grayscale actual image
+    :param engine: one of :obj:`ssim_engines`
+    :param workers: count of pool workers. :obj:`None` - cpu count
+    :return: (SSIM score, SSIM map)
+    """
+    if engine not in ssim_engines:
+        raise ValueError(f'Unexpected SSIM engine "{engine}". Provide one of {ssim_engines}')
+
+    height = reference_img.shape[0]
+    tiles = get_ssim_tiles(height)
+
+    if engine == DEFAULT_ENGINE or len(tiles) == 1 or reference_img.shape != actual_img.shape:
+        return structural_similarity(reference_img, actual_img, full=True)
+
+    padded_tiles = [(max(start - SSIM_PAD, 0), min(end + SSIM_PAD, height)) for start, end in tiles]
+    executor = get_ssim_executor(engine, workers)
+    futures = [
+        executor.submit(_ssim_tile_map, reference_img[start:end], actual_img[start:end])
+        for start, end in padded_tiles
+    ]
+
+    ssim_map = numpy.empty(reference_img.shape, dtype=numpy.float64)
+    for (start, end), (padded_start, _), future in zip(tiles, padded_tiles, futures):
+        offset = start - padded_start
+        ssim_map[start:end] = future.result()[offset:offset + end - start]
+
+    return get_ssim_score(ssim_map), ssim_map
+
+
+def get_ssim_executor(engine: str, workers: Optional[int] = None) -> Executor:
+    """
+    Get shared pool for SSIM tiles calculation.
+    Only the pool of the latest engine and workers count is kept: previous one is shut down
+
+    :param engine: ``threads`` or ``processes``
+    :param workers: count of pool workers. :obj:`None` - cpu count
+    :return: executor
+    """
+    global _ssim_executor
+
+    workers = workers or os.cpu_count() or 1
+
+    with _ssim_executor_lock:
+        if _ssim_executor and _ssim_executor[:2] == (engine, workers):
+            return _ssim_executor[2]
+
+        if _ssim_executor:
+            _ssim_executor[2].shutdown(wait=True)
+
+        if engine == PROCESSES_ENGINE:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='mops_ssim')
+
+        _ssim_executor = (engine, workers, executor)
+        return executor
+
+
+def shutdown_ssim_executor() -> None:
+    """
+    Shut down shared pool of SSIM tiles calculation. Called automatically at interpreter exit
+
+    :return: None
+    """
+    global _ssim_executor
+
+    with _ssim_executor_lock:
+        if _ssim_executor:
+            _ssim_executor[2].shutdown(wait=True)
+            _ssim_executor = None
+
+
+atexit.register(shutdown_ssim_executor)
+
+
+def _ssim_tile_map(reference_tile: numpy.ndarray, actual_tile: numpy.ndarray) -> numpy.ndarray:
+    """
+    Compute SSIM map of one tile. Defined on module level to be picklable for process pool
+
+    :param reference_tile: tile of grayscale reference image
+    :param actual_tile: tile of grayscale actual image
+    :return: SSIM map of tile
+    """
+    return structural_similarity(reference_tile, actual_tile, full=True)[1]
+
+
+def get_image_array(image: Image.Image) -> numpy.ndarray:
+    """
+    Convert PIL image to BGR numpy array, same as ``cv2.imread`` returns for the saved image
+
+    :param image: PIL image
+    :return: BGR numpy.ndarray
+    """
+    if image.mode not in pil_to_bgr_conversions:
+        image = image.convert('RGB')
+
+    return cv2.cvtColor(numpy.asarray(image), pil_to_bgr_conversions[image.mode])
+
+
+def get_changed_mask(reference_img: numpy.ndarray, actual_img: numpy.ndarray) -> numpy.ndarray:
+    """
+    Get mask of pixels, that differ between two grayscale images
+
+    :param reference_img: grayscale reference image
+    :param actual_img: grayscale actual image
+    :return: boolean numpy.ndarray
+    """
+    return cv2.absdiff(reference_img, actual_img) > 0
+
+
+def get_ssim_difference_bound(changed_mask: numpy.ndarray) -> float:
+    """
+    Get upper bound of SSIM difference in percents, based on changed pixels only.
+    SSIM of the window without changed pixels is 1, and SSIM of any other window is not less than -1,
+    so each pixel within SSIM window radius from the changed one can decrease the score up to 2
+
+    :param changed_mask: boolean mask of changed pixels
+    :return: maximum possible ``100 - SSIM score * 100`` value
+    """
+    kernel = numpy.ones((SSIM_WINDOW, SSIM_WINDOW), dtype=numpy.uint8)
+    affected = cv2.dilate(changed_mask.view(numpy.uint8), kernel)[SSIM_PAD:-SSIM_PAD, SSIM_PAD:-SSIM_PAD]
+    return 200 * cv2.countNonZero(affected) / affected.size
+
+
+def get_score_pixels_ratio(ignore_mask: numpy.ndarray) -> float:
+    """
+    Get ratio of pixels used for the SSIM score to the not ignored ones among them.
+    Ignored pixels are same on both images, so difference calculated for the whole image
+    multiplied by this ratio is the difference of not ignored pixels only
+
+    :param ignore_mask: boolean mask of ignored pixels
+    :return: pixels ratio. 0 if all pixels are ignored
+    """
+    interior = ignore_mask[SSIM_PAD:-SSIM_PAD, SSIM_PAD:-SSIM_PAD]
+    not_ignored = interior.size - numpy.count_nonzero(interior)
+    return interior.size / not_ignored if not_ignored else 0
+
+
+def get_changed_regions(changed_mask: numpy.ndarray, block_size: int = DIFF_BLOCK_SIZE) -> List[Tuple[int, ...]]:
+    """
+    Get regions of SSIM map, that affected by changed pixels.
+    Changed pixels are searched on the coarse map of ``block_size`` blocks, so regions are aligned to the blocks,
+    expanded by SSIM window radius and merged if they overlap
+
+    :param changed_mask: boolean mask of changed pixels
+    :param block_size: block size of the coarse map
+    :return: list of non overlapped regions (start_x, start_y, end_x, end_y)
+    """
+    height, width = changed_mask.shape
+    padded_mask = numpy.pad(changed_mask, ((0, -height % block_size), (0, -width % block_size)))
+    coarse_height, coarse_width = padded_mask.shape[0] // block_size, padded_mask.shape[1] // block_size
+    coarse_mask = padded_mask.reshape(coarse_height, block_size, coarse_width, block_size).any(axis=(1, 3))
+
+    count, _, stats, _ = cv2.connectedComponentsWithStats(coarse_mask.view(numpy.uint8), connectivity=8)
+    regions = [
+        (
+            max(x * block_size - SSIM_PAD, 0),
+            max(y * block_size - SSIM_PAD, 0),
+            min((x + w) * block_size + SSIM_PAD, width),
+            min((y + h) * block_size + SSIM_PAD, height),
+        )
+        for x, y, w, h, _ in stats[1:count].tolist()
+    ]
+
+    return merge_regions(regions)
+
+
+def merge_regions(regions: List[Tuple[int, ...]]) -> List[Tuple[int, ...]]:
+    """
+    Merge overlapped regions into their bounding regions
+
+    :param regions: list of regions (start_x, start_y, end_x, end_y)
+    :return: list of non overlapped regions
+    """
+    is_merged = True
+
+    while is_merged:
+        is_merged = False
+        merged_regions = []
+
+        for region in regions:
+            for index, other in enumerate(merged_regions):
+                if region[0] < other[2] and other[0] < region[2] and region[1] < other[3] and other[1] < region[3]:
+                    merged_regions[index] = (
+                        min(region[0], other[0]), min(region[1], other[1]),
+                        max(region[2], other[2]), max(region[3], other[3]),
+                    )
+                    is_merged = True
+                    break
+            else:
+                merged_regions.append(region)
+
+        regions = merged_regions
+
+    return regions
+
+
+def structural_similarity_regions(
+        reference_img: numpy.ndarray,
+        actual_img: numpy.ndarray,
+        changed_mask: numpy.ndarray,
+        engine: str = DEFAULT_ENGINE,
+        workers: Optional[int] = None,
+) -> Tuple[float, numpy.ndarray]:
+    """
+    Compute SSIM score and 8-bit SSIM map of two grayscale images of same shape,
+    calculating SSIM only for regions affected by changed pixels.
+    SSIM of the window without changed pixels is 1, so the rest of the map is filled without calculation.
+    Each region calculated with extra SSIM window radius around it, to use same pixels as the whole image calculation.
+    Difference with :func:`structural_similarity_full` is limited by float rounding
+
+    :param reference_img: grayscale reference image
+    :param actual_img: grayscale actual image
+    :param changed_mask: boolean mask of changed pixels
+    :param engine: one of :obj:`ssim_engines`
+    :param workers: count of pool workers. :obj:`None` - cpu count
+    :return: (SSIM score, SSIM map in range [0, 255])
+    """
+    height, width = reference_img.shape
+    regions = get_changed_regions(changed_mask)
+    regions_area = sum((end_x - start_x) * (end_y - start_y) for start_x, start_y, end_x, end_y in regions)
+
+    if regions_area > height * width * DIFF_DENSE_RATIO or min(height, width) <= SSIM_WINDOW + SSIM_PAD * 2:
+        score, ssim_map = structural_similarity_full(reference_img, actual_img, engine=engine, workers=workers)
+        return score, get_ssim_map_image(ssim_map)
+
+    ssim_map = numpy.full(reference_img.shape, 255, dtype=numpy.uint8)
+    score_loss = 0.0
+
+    for start_x, start_y, end_x, end_y in regions:
+        window_start_x, window_start_y = max(start_x - SSIM_PAD, 0), max(start_y - SSIM_PAD, 0)
+        window_end_x, window_end_y = min(end_x + SSIM_PAD, width), min(end_y + SSIM_PAD, height)
+        window = (slice(window_start_y, window_end_y), slice(window_start_x, window_end_x))
+        region = (slice(start_y - window_start_y, end_y - window_start_y),
+                  slice(start_x - window_start_x, end_x - window_start_x))
+
+        region_map = structural_similarity_full(
+            reference_img[window], actual_img[window], engine=engine, workers=workers
+        )[1][region]
+        ssim_map[start_y:end_y, start_x:end_x] = get_ssim_map_image(region_map)
+
+        # Only the map without edges of the whole image is used for the score
+        score_region = region_map[
+            max(SSIM_PAD - start_y, 0):region_map.shape[0] - max(end_y - (height - SSIM_PAD), 0),
+            max(SSIM_PAD - start_x, 0):region_map.shape[1] - max(end_x - (width - SSIM_PAD), 0),
+        ]
+        score_loss += float((1 - score_region).sum(dtype=numpy.float64))
+
+    score = 1 - score_loss / ((height - SSIM_PAD * 2) * (width - SSIM_PAD * 2))
+    return score, ssim_map
+
+
+def fill_holes(mask: numpy.ndarray) -> numpy.ndarray:
+    """
+    Fill holes of the binary mask, same as filled external contours do
+
+    :param mask: 8-bit binary mask
+    :return: 8-bit binary mask without holes
+    """
+    height, width = mask.shape
+    background = cv2.copyMakeBorder(mask, 1, 1, 1, 1, cv2.BORDER_CONSTANT, value=0)
+    flood_mask = numpy.zeros((height + 4, width + 4), dtype=numpy.uint8)
+    cv2.floodFill(background, flood_mask, (0, 0), 255, flags=4)
+    return cv2.bitwise_or(mask, cv2.bitwise_not(background[1:-1, 1:-1]))
+
+
+def get_diff_regions(
+        diff_mask: numpy.ndarray,
+        min_contour_area: float = 0
+) -> Tuple[numpy.ndarray, List[DiffRegion]]:
+    """
+    Extract regions of the binary difference mask with connected components statistics.
+    Regions are the same as filled external contours of the mask.
+    Contour area is always less than pixels count of the region,
+    so the contour is calculated only for regions with pixels count above ``min_contour_area``
+
+    :param diff_mask: 8-bit binary difference mask
+    :param min_contour_area: regions with contour area less or equal to the given one will be skipped
+    :return: (boolean mask of the kept regions, list of kept regions)
+    """
+    count, labels, stats, _ = cv2.connectedComponentsWithStats(fill_holes(diff_mask), connectivity=8)
+    is_kept = stats[:, cv2.CC_STAT_AREA] > min_contour_area
+    is_kept[0] = False  # background
+
+    if min_contour_area:
+        for label in numpy.flatnonzero(is_kept):
+            x, y, width, height, _ = stats[label]
+            component = (labels[y:y + height, x:x + width] == label).astype(numpy.uint8)
+            contours = cv2.findContours(component, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)[-2]
+            is_kept[label] = max(cv2.contourArea(contour) for contour in contours) > min_contour_area
+
+    regions = [DiffRegion(x=x, y=y, width=width, height=height, area=area)
+               for x, y, width, height, area in stats[is_kept].tolist()]
+
+    return is_kept[labels], regions
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Optional, Union
+
+from mops.utils.profiler import profiler
+
+
+WAIT_METHODS_DELAY = 0.1
+MAX_WAIT_DELAY = 1.6  # the longest delay of exponential policies
+BUDGET_CHECKS = 10  # count of checks, that budget policy spreads over the timeout
+
+
+class WaitPolicy(str, Enum):
+    FIXED = 'fixed'
+    EXPONENTIAL = 'exponential'
+    JITTERED = 'jittered'
+    BUDGET = 'budget'
+
+
+wait_policies = tuple(policy.value for policy in WaitPolicy)
+
+
+@dataclass
+class WaitStatistics:
+    timeout: Union[int, float]
+    iterations: int = 0  # count of condition checks
+    total_sleep: float = 0.0  # seconds slept between the checks
+    elapsed: float = 0.0  # seconds from the first check till the end of the wait
+    overshoot: float = 0.0  # seconds spent after the deadline
+    is_successful: bool = False
+
+
+class WaitScheduler:
+    """
+    Scheduler of the condition checks within the wait timeout.
+
+    Delay between the checks is calculated by the given policy:
+
+    - ``fixed`` - the same ``delay`` before each check;
+    - ``exponential`` - ``delay`` multiplied by ``factor`` after each check, up to ``max_delay``;
+    - ``jittered`` - exponential delay, randomly reduced by up to ``jitter`` part of it,
+      so parallel waits don't poll the driver at the same time;
+    - ``budget`` - remaining time evenly spread over the remaining ``checks``, but not less than ``delay``.
+
+    Each delay is clamped to the time remaining till the deadline, so the last check is made right at the deadline.
+    Statistics of the latest wait of the current thread is kept in :attr:`last_statistics`
+    and passed to the ``statistics_handler``, if given.
+    """
+
+    def __init__(
+            self,
+            policy: Union[WaitPolicy, str] = WaitPolicy.FIXED,
+            delay: Union[int, float] = WAIT_METHODS_DELAY,
+            max_delay: Union[int, float] = MAX_WAIT_DELAY,
+            factor: Union[int, float] = 2,
+            jitter: float = 0.5,
+            checks: int = BUDGET_CHECKS,
+            statistics_handler: Optional[Callable[[WaitStatistics], Any]] = None,
+    ):
+        if policy not in wait_policies:
+            raise ValueError(f'Unknown wait policy "{policy}". Available policies: {", ".join(wait_policies)}')
+
+        if delay <= 0 or max_delay < delay:
+            raise ValueError('The `delay` must be a positive number, that not greater than `max_delay`')
+
+        if not 0 <= jitter < 1:
+            raise ValueError('The `jitter` must be in range [0, 1)')
+
+        self.policy = WaitPolicy(policy)
+        self.delay = delay
+        self.max_delay = max_delay
+        self.factor = factor
+        self.jitter = jitter
+        self.checks = checks
+        self.statistics_handler = statistics_handler
+        self._local = threading.local()
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(policy={self.policy.value}, delay={self.delay})'
+
+    @property
+    def last_statistics(self) -> Optional[WaitStatistics]:
+        """
+        Statistics of the latest wait, made by the current thread
+
+        :return: :class:`WaitStatistics` or :obj:`None` if the thread didn't wait with this scheduler yet
+        """
+        return getattr(self._local, 'statistics', None)
+
+    def get_delay(self, iteration: int, remaining: float) -> float:
+        """
+        Get delay before the next check
+
+        :param iteration: count of already made checks
+        :param remaining: seconds remaining till the deadline
+        :return: delay in seconds, clamped to the remaining time
+        """
+        if self.policy == WaitPolicy.FIXED:
+            delay = self.delay
+        elif self.policy == WaitPolicy.BUDGET:
+            delay = max(remaining / max(self.checks - iteration, 1), self.delay)
+        else:
+            delay = min(self.delay * self.factor ** (iteration - 1), self.max_delay)
+            if self.policy == WaitPolicy.JITTERED:
+                delay *= 1 - self.jitter * random.random()
+
+        return max(min(delay, remaining), 0)
+
+    def run(self, check: Callable[[], bool], timeout: Union[int, float]) -> bool:
+        """
+        Call the check until it succeeds or the timeout is reached
+
+        :param check: condition check, that returns :obj:`True` when the condition is met
+        :param timeout: wait timeout in seconds
+        :return: :obj:`bool` - result of the last check
+        """
+        statistics = WaitStatistics(timeout=timeout)
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+
+        while True:
+            statistics.is_successful = bool(check())
+            statistics.iterations += 1
+            remaining = deadline - time.monotonic()
+
+            if statistics.is_successful or remaining <= 0:
+                break
+
+            delay = self.get_delay(statistics.iterations, remaining)
+            time.sleep(delay)
+            statistics.total_sleep += delay
+
+        end_time = time.monotonic()
+        statistics.elapsed = end_time - start_time
+        statistics.overshoot = max(end_time - deadline, 0)
+
+        self._local.statistics = statistics
+        if profiler.enabled:
+            profiler.add_iterations(statistics.iterations)
+        if self.statistics_handler:
+            self.statistics_handler(statistics)
+
+        return statistics.is_successful
+
+
+default_wait_scheduler = WaitScheduler()
+appium_wait_scheduler = WaitScheduler(WaitPolicy.EXPONENTIAL)
+
+
+def get_wait_scheduler(driver_wrapper: Any, scheduler: Optional[WaitScheduler] = None) -> WaitScheduler:
+    """
+    Get scheduler of the wait: given one, the scheduler of driver wrapper or the default one for the platform
+
+    :param driver_wrapper: DriverWrapper of the waiting object
+    :param scheduler: scheduler of the specific wait
+    :return: :class:`WaitScheduler`
+    """
+    scheduler = scheduler or getattr(driver_wrapper, 'wait_scheduler', None)
+
+    if scheduler:
+        return scheduler
+
+    return appium_wait_scheduler if driver_wrapper.is_appium else default_wait_scheduler
@@ -2,14 +2,15 @@ from __future__ import annotations
 
 import os
 import re
-import shutil
 import time
 import math
 import json
 import base64
 import importlib
+from concurrent.futures import Future
+from dataclasses import replace
 from urllib.parse import urljoin
-from typing import Union, List, Any, Tuple, Optional
+from typing import Union, List, Any, Tuple, Optional, Callable
 from string import punctuation
 
 try:
@@ -18,14 +19,38 @@ except ImportError:
     import cv2  # ~cv2@4.10.0.84 + python@3.11/12
 import numpy
 from skimage._shared.utils import check_shape_equality  # noqa
-from skimage.metrics import structural_similarity
 from PIL import Image
 
 from mops.exceptions import DriverWrapperException, TimeoutException
-from mops.js_scripts import add_element_over_js, delete_element_over_js
+from mops.js_scripts import add_visual_mask_js, delete_visual_mask_js, get_visual_ignore_rects_js
+from mops.mixins.objects.box import Box
 from mops.mixins.objects.cut_box import CutBox
-from mops.utils.logs import autolog
+from mops.mixins.objects.diff_region import DiffRegion
+from mops.shared_utils import get_image
+from mops.utils.logs import autolog, LogLevel
 from mops.mixins.internal_mixin import get_element_info
+from mops.playwright.play_utils import get_elements_rects as get_play_elements_rects
+from mops.selenium.sel_utils import get_elements_rects
+from mops.utils.visual_utils import (
+    structural_similarity_full,
+    structural_similarity_regions,
+    get_changed_mask,
+    get_ssim_difference_bound,
+    get_ssim_map_image,
+    get_score_pixels_ratio,
+    get_image_array,
+    get_diff_regions,
+    DIFF_MIN_CONTOUR_AREA,
+)
+from mops.utils.reference_storage import get_reference_index, get_image_digest, reference_cache
+from mops.utils.artifact_writer import artifact_writer, move_file, remove_files, write_png
+from mops.utils.reference_generation import (
+    reference_generator,
+    get_generation_manifest,
+    CREATED,
+    CHANGED,
+    UNCHANGED,
+)
 
 
 class VisualComparison:
@@ -33,14 +58,27 @@ class VisualComparison:
     visual_regression_path = ''
     test_item = None
     attach_diff_image_path = False
+    keep_passed_artifacts = False
+    background_artifacts = False
     skip_screenshot_comparison = False
     visual_reference_generation = False
     hard_visual_reference_generation = False
     soft_visual_reference_generation = False
     default_delay = 0.75
     default_threshold = 0
+    ssim_engine = 'default'
+    ssim_workers = None
+    ssim_prefilter = True
+    reference_cache_size = 512 * 1024 * 1024
+    reference_raw_cache = False
+    reference_compression_level = None
+    parallel_reference_generation = False
     dynamic_threshold_factor = 0
     diff_color_scheme = (0, 255, 0)
+    stable_frame_capture = False
+    stable_frames_count = 2
+    native_screenshot = True
+    screenshot_resample = Image.Resampling.LANCZOS
 
     __initialized = False
 
@@ -48,6 +86,13 @@ class VisualComparison:
         self.driver_wrapper = driver_wrapper
         self.element_wrapper = element
         self.screenshot_name = 'default'
+        self._captured_screenshot = None
+        self.diff_regions: List[DiffRegion] = []
+        self.ignore_mask: Optional[numpy.ndarray] = None
+        self._screenshot_size: Optional[Tuple[int, int]] = None
+        self._full_page = False
+        self.stable_frames = 0
+        self.stabilization_time = 0.0
 
         if self.dynamic_threshold_factor and self.default_threshold:
             raise Exception('Provide only one argument for threshold of visual comparison')
@@ -73,31 +118,150 @@ class VisualComparison:
 
         self.__initialized = True
 
-    def _save_screenshot(
+    def _take_screenshot(
             self,
-            screenshot_name: str,
             delay: Union[int, float],
             remove: list,
             fill_background: bool,
             cut_box: Optional[CutBox],
-    ):
-        time.sleep(delay)
+    ) -> Image.Image:
+        """
+        Take screenshot of the element or driver, without saving it to the disk
+
+        :param delay: delay before taking screenshot
+        :param remove: remove elements from screenshot
+        :param fill_background: fill background with given color or black color by default
+        :param cut_box: custom coordinates, that will be cut from original image (left, top, right, bottom)
+        :return: PIL.Image
+        """
+        if self._captured_screenshot:
+            return self._captured_screenshot
+
+        is_native = self.native_screenshot and self.driver_wrapper.is_playwright
+
+        def take_image() -> Image.Image:
+            if is_native:
+                screenshot = self._take_native_screenshot(remove)
+            elif self._full_page:
+                screenshot = self.driver_wrapper.full_page_screenshot_image()
+            else:
+                screenshot = self._desired_object.screenshot_image()
 
-        self._fill_background(fill_background)
-        self._appends_dummy_elements(remove)
+            self._screenshot_size = screenshot.size
+            return screenshot.crop(cut_box.get_box(screenshot.size)) if cut_box else screenshot
+
+        if is_native:
+            # Removed elements are masked by the screenshot itself, so only background is changed on the page
+            if fill_background:
+                self._apply_mask([], fill_background)
+
+            image = self._wait_stable_frame(take_image, delay)
+            return image if image is not None else take_image()
+
+        image = self._wait_stable_frame(take_image, delay)
 
         if fill_background or remove:
-            time.sleep(0.1)
+            self._apply_mask(remove, fill_background)
+            image = take_image()
+
+            if remove:
+                self._remove_mask()
+
+        return image if image is not None else take_image()
+
+    def _take_native_screenshot(self, remove: list) -> Image.Image:
+        """
+        Playwright only: take screenshot of the element or page with disabled animations and hidden caret,
+        in device pixels. Removed elements are masked with black color by Playwright, without changes of the page
+
+        :param remove: elements to be masked
+        :return: PIL.Image
+        """
+        options = dict(animations='disabled', caret='hide', scale='device')
+
+        if remove:
+            options.update(mask=[obj.element for obj in remove], mask_color='#000')
+
+        if self._full_page:
+            screenshot_base = self.driver_wrapper.driver.screenshot(full_page=True, **options)
+        elif self._desired_object is self.driver_wrapper:
+            screenshot_base = self.driver_wrapper.driver.screenshot(**options)
+        else:
+            screenshot_base = self._desired_object.element.first.screenshot(**options)
 
-        desired_obj = self.element_wrapper or self.driver_wrapper.anchor or self.driver_wrapper
-        image = desired_obj.screenshot_image()
+        return get_image(screenshot_base)
 
-        if cut_box:
-            image = image.crop(cut_box.get_box(image.size))
+    def _wait_stable_frame(
+            self,
+            take_image: Callable[[], Image.Image],
+            delay: Union[int, float],
+    ) -> Optional[Image.Image]:
+        """
+        Wait for the given delay. If :obj:`stable_frame_capture` enabled, screenshots are taken back to back
+        until :obj:`stable_frames_count` consecutive of them are identical, with the delay as an upper bound.
+        Count of taken frames and stabilization time are stored to ``stable_frames`` and ``stabilization_time``
+
+        :param take_image: function for taking screenshot
+        :param delay: delay before taking screenshot
+        :return: last taken frame or :obj:`None` if :obj:`stable_frame_capture` disabled
+        """
+        if not self.stable_frame_capture:
+            time.sleep(delay)
+            return None
+
+        start_time = time.time()
+        image, digest, identical_frames = None, None, 0
+        self.stable_frames = 0
+
+        while True:
+            image = take_image()
+            previous_digest, digest = digest, get_image_digest(numpy.asarray(image))
+            identical_frames = identical_frames + 1 if digest == previous_digest else 1
+            self.stable_frames += 1
+            self.stabilization_time = time.time() - start_time
 
-        desired_obj.save_screenshot(screenshot_name, screenshot_base=image)
+            if identical_frames >= self.stable_frames_count or self.stabilization_time >= delay:
+                break
+
+        status = 'stabilized' if identical_frames >= self.stable_frames_count else 'not stabilized'
+        autolog(f'Screenshot {status} after {self.stable_frames} frames in {self.stabilization_time:.2f}s',
+                level=LogLevel.DEBUG)
+        return image
+
+    def _save_screenshot(
+            self,
+            screenshot_name: str,
+            delay: Union[int, float],
+            remove: list,
+            fill_background: bool,
+            cut_box: Optional[CutBox],
+    ) -> Image.Image:
+        """
+        Take screenshot of the element or driver and save it to the disk
 
-        self._remove_dummy_elements()
+        :param screenshot_name: screenshot file path
+        :param delay: delay before taking screenshot
+        :param remove: remove elements from screenshot
+        :param fill_background: fill background with given color or black color by default
+        :param cut_box: custom coordinates, that will be cut from original image (left, top, right, bottom)
+        :return: PIL.Image
+        """
+        image = self._take_screenshot(delay=delay, remove=remove, fill_background=fill_background, cut_box=cut_box)
+
+        if self.reference_compression_level is None:
+            return self._desired_object.save_screenshot(screenshot_name, screenshot_base=image)
+
+        image.save(screenshot_name, compress_level=self.reference_compression_level)
+        return image
+
+    @property
+    def _desired_object(self) -> Any:
+        """
+        Get object for taking screenshot: element, page anchor or driver
+
+        :return: Element or DriverWrapper
+        """
+        return self.element_wrapper or self.driver_wrapper.anchor or self.driver_wrapper
 
     def assert_screenshot(
             self,
@@ -109,7 +273,10 @@ class VisualComparison:
             scroll: bool,
             remove: List[Any],
             fill_background: Union[str, bool],
-            cut_box: Optional[CutBox]
+            cut_box: Optional[CutBox],
+            screenshot: Optional[Image.Image] = None,
+            ignore: Optional[List[Any]] = None,
+            full_page: bool = False,
     ) -> VisualComparison:
         """
         Assert given (by name) and taken screenshot equals
@@ -123,11 +290,16 @@ class VisualComparison:
         :param remove: remove elements from screenshot
         :param fill_background: fill background with given color or black color by default
         :param cut_box: custom coordinates, that will be cut from original image (left, top, right, bottom)
+        :param screenshot: already captured screenshot, that will be used instead of taking a new one
+        :param ignore: elements, :class:`Box` or :class:`CutBox` regions to be excluded from the comparison
+        :param full_page: take screenshot of the whole page instead of the viewport
         :return: self
         """
         if self.skip_screenshot_comparison:
             return self
 
+        self._captured_screenshot = screenshot
+        self._full_page = full_page
         remove = remove if remove else []
         screenshot_params = dict(delay=delay, remove=remove, fill_background=fill_background, cut_box=cut_box)
 
@@ -145,13 +317,32 @@ class VisualComparison:
         if scroll:
             self.element_wrapper.scroll_into_view()
 
+        reference_cache.max_bytes = self.reference_cache_size
+        reference_cache.use_raw_cache = self.reference_raw_cache
+        reference_index = get_reference_index(self.reference_directory)
+
+        is_generation = self.hard_visual_reference_generation or self.soft_visual_reference_generation
+        if self.parallel_reference_generation and is_generation:
+            output_image = get_image_array(self._take_screenshot(**screenshot_params))
+
+            if ignore:
+                self.ignore_mask = self._get_ignore_mask(ignore, output_image.shape[:2], cut_box)
+
+            reference_generator.submit(
+                self._generate_reference, output_image, output_file, reference_file, threshold,
+                paths=(output_file, reference_file), nbytes=output_image.nbytes,
+            )
+            return self
+
         if self.hard_visual_reference_generation:
             self._save_screenshot(reference_file, **screenshot_params)
+            reference_index.update(reference_file)
             return self
 
-        image = cv2.imread(reference_file)
-        if isinstance(image, type(None)):
+        reference_digest = reference_index.get_digest(reference_file)
+        if reference_digest is None:
             self._save_screenshot(reference_file, **screenshot_params)
+            reference_index.update(reference_file)
 
             if self.visual_reference_generation or self.soft_visual_reference_generation:
                 return self
@@ -165,125 +356,305 @@ class VisualComparison:
         if self.visual_reference_generation and not self.soft_visual_reference_generation:
             return self
 
-        self._save_screenshot(output_file, **screenshot_params)
+        output_image = get_image_array(self._take_screenshot(**screenshot_params))
+
+        # Exact match fast path: pixels are identical, so there is nothing to compare
+        if get_image_digest(output_image) == reference_digest:
+            self._finalize_passed_comparison(output_image, output_file, diff_file)
+            return self
+
+        if ignore:
+            self.ignore_mask = self._get_ignore_mask(ignore, output_image.shape[:2], cut_box)
 
         try:
-            self._assert_same_images(output_file, reference_file, diff_file, threshold)
-            for file_path in (output_file, diff_file):
-                if os.path.exists(file_path):
-                    os.remove(file_path)
+            self._assert_same_images(output_image, output_file, reference_file, diff_file, threshold)
+            self._finalize_passed_comparison(output_image, output_file, diff_file)
         except AssertionError as exc:
             if self.soft_visual_reference_generation:
-                if os.path.exists(reference_file):
-                    os.remove(reference_file)
-                shutil.move(output_file, reference_file)
+                replace_args = (output_file, reference_file, output_image)
+                if self.background_artifacts:
+                    artifact_writer.submit(self._replace_reference, *replace_args, paths=replace_args[:2])
+                else:
+                    self._replace_reference(*replace_args)
             else:
                 raise exc
 
         return self
 
+    def assert_screenshots(
+            self,
+            elements: List[Any],
+            test_name: str,
+            name_suffix: str,
+            threshold: Union[int, float],
+            delay: Union[int, float],
+            remove: List[Any],
+    ) -> VisualComparison:
+        """
+        Assert screenshots of given elements, cropped from the single viewport screenshot.
+        Each element compared with its own reference, and all mismatches are reported together
+
+        :param elements: elements to be compared. Should be visible within the viewport
+        :param test_name: test name for custom filename. Will try to find it automatically if empty string given
+        :param name_suffix: filename suffix. Good to use for same element with positive/negative case
+        :param threshold: possible threshold
+        :param delay: delay before taking screenshot
+        :param remove: remove elements from screenshot
+        :return: self
+        """
+        if self.skip_screenshot_comparison:
+            return self
+
+        screenshot = self._wait_stable_frame(self.driver_wrapper.screenshot_image, delay)
+
+        if remove:
+            self._apply_mask(remove)
+            screenshot = self.driver_wrapper.screenshot_image()
+            self._remove_mask()
+
+        screenshot = screenshot if screenshot is not None else self.driver_wrapper.screenshot_image()
+
+        scale = screenshot.size[0] / self.driver_wrapper.get_inner_window_size().width
+        errors = []
+
+        for element, rect in zip(elements, self._get_elements_rects(elements)):
+            visual_comparison = VisualComparison(self.driver_wrapper, element)
+
+            try:
+                visual_comparison.assert_screenshot(
+                    filename='', test_name=test_name, name_suffix=name_suffix, threshold=threshold, delay=0,
+                    scroll=False, remove=[], fill_background=False, cut_box=None,
+                    screenshot=self._crop_element(screenshot, element, rect, scale),
+                )
+            except AssertionError as exc:
+                errors.append(str(exc))
+
+        if errors:
+            raise AssertionError(f'↓\nVisual mismatch found for {len(errors)} of {len(elements)} elements:\n'
+                                 + '\n'.join(errors))
+
+        return self
+
+    def _get_elements_rects(self, elements: List[Any]) -> List[dict]:
+        """
+        Get viewport rects of given elements within a single script call,
+        if all element locators are supported by the browser
+
+        :param elements: elements to be measured
+        :return: list of {'x', 'y', 'width', 'height'} dicts
+        """
+        if self.driver_wrapper.is_playwright:
+            rects = get_play_elements_rects(self.driver_wrapper, elements)
+        else:
+            rects = get_elements_rects(self.driver_wrapper, elements)
+
+        if rects is not None:
+            return rects
+
+        return [element.get_rect() for element in elements]
+
+    def _crop_element(self, screenshot: Image.Image, element: Any, rect: dict, scale: float) -> Image.Image:
+        """
+        Crop element from the viewport screenshot.
+        The rect is rounded the same way as the element screenshot of the driver does,
+        so the crop matches references taken by :meth:`assert_screenshot`
+
+        :param screenshot: viewport screenshot
+        :param element: element to be cropped
+        :param rect: viewport rect of the element
+        :param scale: ratio of screenshot pixels to the viewport pixels
+        :return: PIL.Image
+        """
+        width, height = screenshot.size
+
+        if self.driver_wrapper.is_playwright:
+            # Playwright clips the element screenshot by the enclosing integer rect
+            start_x, start_y = math.floor(rect['x'] + 1e-3), math.floor(rect['y'] + 1e-3)
+            end_x = math.ceil(rect['x'] + rect['width'] - 1e-3)
+            end_y = math.ceil(rect['y'] + rect['height'] - 1e-3)
+        else:
+            # Selenium element is measured by rounded position and size, see :meth:`CoreElement.get_rect`
+            start_x, start_y = math.floor(rect['x'] + 0.5), math.floor(rect['y'] + 0.5)
+            end_x = start_x + math.floor(rect['width'] + 0.5)
+            end_y = start_y + math.floor(rect['height'] + 0.5)
+
+        box = tuple(round(value * scale) for value in (start_x, start_y, end_x, end_y))
+
+        if box[0] < 0 or box[1] < 0 or box[2] > width or box[3] > height or box[0] >= box[2] or box[1] >= box[3]:
+            raise AssertionError(f'↓\n"{element.name}" is not fully visible within the viewport: '
+                                 f'{rect} with viewport {width / scale}x{height / scale}')
+
+        return screenshot.crop(box)
+
     @staticmethod
-    def calculate_threshold(file: str, dynamic_threshold_factor: int = None) -> Tuple:
+    def calculate_threshold(
+            file: str,
+            dynamic_threshold_factor: int = None,
+            ignore_mask: Optional[numpy.ndarray] = None,
+    ) -> Tuple:
         """
         Calculate possible threshold, based on dynamic_threshold_factor
 
         :param file: image file path for calculation
         :param dynamic_threshold_factor: use provided threshold factor
+        :param ignore_mask: boolean mask of ignored pixels, that are not counted
         :return: tuple of calculated threshold and additional data
         """
         factor = VisualComparison.dynamic_threshold_factor or dynamic_threshold_factor
-        img = Image.open(file)
-        width, height = img.size
+        reference_image = reference_cache.get(file)
+
+        if reference_image is None:
+            raise FileNotFoundError(f'Reference image "{file}" is not found or cannot be decoded')
+
+        height, width = reference_image.shape[:2]
         pixels_grid = height * width
+
+        if ignore_mask is not None:
+            pixels_grid = max(pixels_grid - int(numpy.count_nonzero(ignore_mask)), 1)
         calculated_threshold = factor / math.sqrt(pixels_grid)
         pixels_allowed = int(pixels_grid / 100 * calculated_threshold)
         return calculated_threshold, \
             f'\nAdditional info: {width}x{height}; {calculated_threshold=}; {pixels_allowed=} from {pixels_grid}'
 
-    def _appends_dummy_elements(self, remove_data: list) -> VisualComparison:
+    def _get_ignore_mask(self, ignore: List[Any], shape: Tuple[int, int], cut_box: Optional[CutBox]) -> numpy.ndarray:
+        """
+        Get boolean mask of ignored pixels of the compared image.
+        Rects of all given elements are resolved within single script call
+
+        :param ignore: elements, :class:`Box` in pixels of the image or :class:`CutBox` margins of the image
+        :param shape: (height, width) of the compared image
+        :param cut_box: custom coordinates, that were cut from original image
+        :return: boolean numpy.ndarray
+        """
+        height, width = shape
+        ignore_mask = numpy.zeros(shape, dtype=bool)
+        boxes = []
+
+        elements = [obj for obj in ignore if not isinstance(obj, (Box, CutBox))]
+        if elements:
+            is_page = self._full_page or self._desired_object is self.driver_wrapper
+            origin = None if is_page else self._desired_object
+            rects = self.driver_wrapper.execute_async_script(
+                get_visual_ignore_rects_js, origin, elements, self._full_page
+            )
+            origin_x, origin_y, origin_width, _ = rects['origin']
+
+            screenshot_size = self._screenshot_size or (width, height)
+            scale = screenshot_size[0] / origin_width if origin_width else 1
+            offset_x, offset_y = cut_box.get_box(screenshot_size)[:2] if cut_box else (0, 0)
+
+            for x, y, rect_width, rect_height in rects['rects']:
+                left = (x - origin_x) * scale - offset_x
+                top = (y - origin_y) * scale - offset_y
+                boxes.append((left, top, left + rect_width * scale, top + rect_height * scale))
+
+        for obj in ignore:
+            if isinstance(obj, Box):
+                left, top = obj.x or 0, obj.y or 0
+                boxes.append((left, top, left + (obj.width or 0), top + (obj.height or 0)))
+            elif isinstance(obj, CutBox):
+                # Copy is used, because CutBox fills its empty values while getting the box
+                left, top, right, bottom = replace(obj).get_box((width, height))
+                boxes.extend((
+                    (0, 0, width, top), (0, bottom, width, height),
+                    (0, 0, left, height), (right, 0, width, height),
+                ))
+
+        for left, top, right, bottom in boxes:
+            left, top = max(math.floor(left), 0), max(math.floor(top), 0)
+            right, bottom = min(math.ceil(right), width), min(math.ceil(bottom), height)
+
+            if left < right and top < bottom:
+                ignore_mask[top:bottom, left:right] = True
+
+        return ignore_mask
+
+    def _apply_mask(self, remove_data: list, fill_background_data: Union[bool, str] = False) -> VisualComparison:
         """
-        Placed an element above each from given list and paints it black
+        Place a black element above each from given list and fill background of the element within single script.
+        Script returns only after the changes are painted
 
         :param remove_data: list of elements to be fake removed
+        :param fill_background_data: fill background with given color or black color by default
         :return: VisualComparison
         """
-        for obj in remove_data:
+        if not remove_data and not fill_background_data:
+            return self
 
+        fill_element, color = None, None
+        if fill_background_data:
+            fill_element = self.element_wrapper.wait_visibility(silent=True)
+            color = fill_background_data if type(fill_background_data) is str else 'black'
+
+        hidden_indexes = self.driver_wrapper.execute_async_script(add_visual_mask_js, remove_data, fill_element, color)
+        hidden_objects = [remove_data[index] for index in hidden_indexes or []]
+
+        # Not yet visible elements are waited separately, before placing of the black elements above them
+        for obj in hidden_objects:
             try:
                 obj.wait_visibility(silent=True)
             except TimeoutException:
                 msg = f'Cannot find {obj.name} while removing background from screenshot. {get_element_info(obj)}'
                 raise TimeoutException(msg)
 
-            obj.execute_script(add_element_over_js)
-        return self
+        if hidden_objects:
+            self.driver_wrapper.execute_async_script(add_visual_mask_js, hidden_objects, None, None)
 
-    def _remove_dummy_elements(self) -> VisualComparison:
-        """
-        Remove all dummy elements from DOM
-
-        :return: VisualComparison
-        """
-        self.driver_wrapper.execute_script(delete_element_over_js)
         return self
 
-    def _fill_background(self, fill_background_data: Union[bool, str]) -> VisualComparison:
+    def _remove_mask(self) -> VisualComparison:
         """
-        Fill background of element
+        Remove all black elements from DOM. Script returns only after the changes are painted
 
-        :param fill_background_data: fill background with given color or black color by default
         :return: VisualComparison
         """
-        if not fill_background_data:
-            return self
-
-        element_wrapper = self.element_wrapper
-
-        color = fill_background_data if type(fill_background_data) is str else 'black'
-        element_wrapper\
-            .wait_visibility(silent=True)\
-            .execute_script(f'arguments[0].style.background = "{color}";')
-
+        self.driver_wrapper.execute_async_script(delete_visual_mask_js)
         return self
 
-    def _assert_same_images(self, actual_file: str, reference_file: str, diff_file: str,
-                            threshold: Union[int, float]) -> VisualComparison:
+    def _assert_same_images(self, output_image: numpy.ndarray, actual_file: str, reference_file: str,
+                            diff_file: str, threshold: Union[int, float]) -> VisualComparison:
         """
-        Assert that given images are equal to each other
+        Assert that given images are equal to each other.
+        Actual and diff images will be saved only in case of mismatch
 
+        :param output_image: actual image, BGR numpy.ndarray
         :param actual_file: actual image path
         :param reference_file: reference image path
         :param diff_file: difference image name
         :param threshold: possible difference in percents
         :return: VisualComparison
         """
-        reference_image = cv2.imread(reference_file)
-        output_image = cv2.imread(actual_file)
+        reference_image = reference_cache.get(reference_file)
         threshold = threshold if threshold is not None else self.default_threshold
 
         additional_data = ''
         if not threshold:
-            threshold, additional_data = self.calculate_threshold(reference_file)
+            threshold, additional_data = self.calculate_threshold(reference_file, ignore_mask=self.ignore_mask)
 
         try:
             check_shape_equality(reference_image, output_image)
         except ValueError:
-            self._attach_allure_diff(actual_file, reference_file, actual_file)
+            actual_artifact = self._write_artifact(actual_file, output_image)
+            self._attach_allure_diff(actual_artifact, reference_file, actual_artifact)
             # todo: watermark / fill size difference with color on diff image is better, but need more time
             # rescale output image to the size of reference image, and save it as diff image
             height, width, _ = reference_image.shape
             scaled_image = cv2.resize(output_image, (width, height))
-            cv2.imwrite(diff_file, scaled_image)
+            self._write_artifact(diff_file, scaled_image)
             raise AssertionError(f"↓\nImage size (width, height) is not same for '{self.screenshot_name}':"
                                  f"\nExpected: {reference_image.shape[0:2]};"
                                  f"\nActual: {output_image.shape[0:2]}.")
 
-        diff, actual_threshold = self._get_difference(reference_image, output_image, threshold)
+        diff, actual_threshold = self._get_difference(*self._get_compared_images(reference_image, output_image),
+                                                      threshold)
         is_different = actual_threshold > threshold
 
         if is_different:
-            cv2.imwrite(diff_file, diff)
-            self._attach_allure_diff(actual_file, reference_file, diff_file)
+            self._attach_allure_diff(
+                self._write_artifact(actual_file, output_image),
+                reference_file,
+                self._write_artifact(diff_file, diff),
+            )
 
         diff_data = ""
         if self.attach_diff_image_path:
@@ -299,6 +670,68 @@ class VisualComparison:
 
         return self
 
+    def _get_compared_images(
+            self,
+            reference_image: numpy.ndarray,
+            output_image: numpy.ndarray,
+    ) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Get images for the comparison. Ignored pixels are filled with same color on both images,
+        so they are not different
+
+        :param reference_image: reference image, BGR numpy.ndarray
+        :param output_image: actual image, BGR numpy.ndarray
+        :return: (reference image, actual image)
+        """
+        if self.ignore_mask is None:
+            return reference_image, output_image
+
+        reference_image, output_image = reference_image.copy(), output_image.copy()
+        reference_image[self.ignore_mask] = 0
+        output_image[self.ignore_mask] = 0
+        return reference_image, output_image
+
+    def _generate_reference(
+            self,
+            output_image: numpy.ndarray,
+            output_file: str,
+            reference_file: str,
+            threshold: Union[int, float],
+    ) -> str:
+        """
+        Compare captured image with the existing reference and replace the reference if it's changed.
+        Executed in the references generation pool: hard generation replaces any changed pixels,
+        soft generation replaces only references, that are different over the threshold
+
+        :param output_image: actual image, BGR numpy.ndarray
+        :param output_file: actual image path, used as temporary file of the new reference
+        :param reference_file: reference image path
+        :param threshold: possible difference in percents
+        :return: ``created``, ``changed`` or ``unchanged``
+        """
+        reference_image = reference_cache.get(reference_file)
+
+        if reference_image is None:
+            status = CREATED
+        elif get_image_digest(reference_image) == get_image_digest(output_image):
+            status = UNCHANGED
+        elif self.hard_visual_reference_generation or reference_image.shape != output_image.shape:
+            status = CHANGED
+        else:
+            threshold = threshold if threshold is not None else self.default_threshold
+            if not threshold:
+                threshold, _ = self.calculate_threshold(reference_file, ignore_mask=self.ignore_mask)
+
+            compared_images = self._get_compared_images(reference_image, output_image)
+            status = CHANGED if self._get_difference(*compared_images, threshold)[1] > threshold else UNCHANGED
+
+        if status != UNCHANGED:
+            write_png(output_file, output_image, self.reference_compression_level)
+            self._replace_reference(output_file, reference_file, output_image)
+
+        get_generation_manifest(self.reference_directory).record(reference_file, status)
+        return status
+
     def _get_screenshot_name(self, test_function_name: str = '', name_suffix: str = '') -> str:
         """
         Get screenshot name
@@ -359,58 +792,78 @@ class VisualComparison:
             possible_threshold: Union[int, float]
     ) -> tuple[numpy.ndarray, float]:
         """
-        Calculate difference between two images
+        Calculate difference between two images.
+        If :attr:`ssim_prefilter` finds, that the difference fits the threshold without SSIM calculation,
+        the upper bound of the difference is returned as the diff value, and no diff regions are highlighted
 
         :param reference_img: image 1, numpy.ndarray
         :param actual_img: image 2, numpy.ndarray
+        :param possible_threshold: possible difference in percents
         :return: (diff image, diff float value )
         """
         # Convert images to grayscale
         reference_img_gray = cv2.cvtColor(reference_img, cv2.COLOR_BGR2GRAY)
         actual_img_gray = cv2.cvtColor(actual_img, cv2.COLOR_BGR2GRAY)
 
-        # Compute SSIM between the two images
-        score, diff = structural_similarity(reference_img_gray, actual_img_gray, full=True)
-        score *= 100
+        # Difference is calculated for the whole image, and then scaled to the not ignored pixels count
+        pixels_ratio = get_score_pixels_ratio(self.ignore_mask) if self.ignore_mask is not None else 1
+
+        if self.ssim_prefilter:
+            # Coarse pass: SSIM differs from 1 only around changed pixels,
+            # so comparison is skipped if even the worst SSIM of these pixels fits the threshold
+            changed_mask = get_changed_mask(reference_img_gray, actual_img_gray)
+            difference_bound = get_ssim_difference_bound(changed_mask) * pixels_ratio
+
+            if difference_bound <= possible_threshold:
+                # Upper bound of the difference is returned, that is enough for the threshold check
+                self.diff_regions = []
+                return actual_img.copy(), difference_bound
+
+            # Compute SSIM only for regions around changed pixels
+            score, diff = structural_similarity_regions(
+                reference_img_gray, actual_img_gray, changed_mask, engine=self.ssim_engine, workers=self.ssim_workers
+            )
+        else:
+            # Compute SSIM between the two images
+            score, diff = structural_similarity_full(
+                reference_img_gray, actual_img_gray, engine=self.ssim_engine, workers=self.ssim_workers
+            )
 
-        # The diff image contains the actual image differences between the two images
-        # and is represented as a floating point data type in the range [0,1]
-        # so we must convert the array to 8-bit unsigned integers in the range
-        # [0,255] before we can use it with OpenCV
-        diff = (diff * 255).astype("uint8")
-        diff_box = cv2.merge([diff, diff, diff])
+            # The diff image contains the actual image differences between the two images
+            # and is represented as a floating point data type in the range [0,1]
+            # so we must convert the array to 8-bit unsigned integers in the range
+            # [0,255] before we can use it with OpenCV
+            diff = get_ssim_map_image(diff)
 
-        # Threshold the difference image, followed by finding contours to
-        # obtain the regions of the two input images that differ
+        score *= 100
+
+        # Threshold the difference image, followed by extracting regions
+        # of the two input images that differ
         thresh = cv2.threshold(diff, 0, 255, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU)[1]
-        contours = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        contours = contours[0] if len(contours) == 2 else contours[1]
 
-        mask = numpy.zeros(reference_img.shape, dtype='uint8')
-        filled_after = actual_img.copy()
-        percent_diff = 100 - score
+        percent_diff = (100 - score) * pixels_ratio
         is_different_enough = percent_diff > possible_threshold
+        min_contour_area = 0 if is_different_enough else DIFF_MIN_CONTOUR_AREA
 
-        for c in contours:
-            if is_different_enough or cv2.contourArea(c) > 40:
-                x, y, w, h = cv2.boundingRect(c)
-                cv2.rectangle(reference_img, (x, y), (x + w, y + h), self.diff_color_scheme, 2)
-                cv2.rectangle(actual_img, (x, y), (x + w, y + h), self.diff_color_scheme, 2)
-                cv2.rectangle(diff_box, (x, y), (x + w, y + h), self.diff_color_scheme, 2)
-                cv2.drawContours(mask, [c], 0, (255, 255, 255), -1)
-                cv2.drawContours(filled_after, [c], 0, self.diff_color_scheme, -1)
+        regions_mask, self.diff_regions = get_diff_regions(thresh, min_contour_area)
+        filled_after = actual_img.copy()
+        filled_after[regions_mask] = self.diff_color_scheme
 
-        diff_image, percent_diff = filled_after, 100 - score
-        return diff_image, percent_diff
+        return filled_after, percent_diff
 
-    def _attach_allure_diff(self, actual_path: str, expected_path: str, diff_path: str = None) -> None:
+    def _attach_allure_diff(
+            self,
+            actual_path: Union[str, Future],
+            expected_path: Union[str, Future],
+            diff_path: Union[str, Future] = None
+    ) -> None:
         """
         Attach screenshots to allure screen diff plugin
         https://github.com/allure-framework/allure2/blob/master/plugins/screen-diff-plugin/README.md
 
-        :param actual_path: path of actual image
-        :param expected_path: path of expected image
-        :param diff_path: path of diff image
+        :param actual_path: path of actual image or Future of its PNG bytes
+        :param expected_path: path of expected image or Future of its PNG bytes
+        :param diff_path: path of diff image or Future of its PNG bytes
         :return: None
         """
         allure = None
@@ -428,8 +881,8 @@ class VisualComparison:
                 data.append(('diff', diff_path))
 
             for name, path in data:
-                with open(path, 'rb') as image:
-                    diff_dict.update({name: f'data:image/png;base64,{base64.b64encode(image.read()).decode("ascii")}'})
+                image = self._read_artifact(path)
+                diff_dict.update({name: f'data:image/png;base64,{base64.b64encode(image).decode("ascii")}'})
 
             allure.attach(
                 name=f'diff_for_{self.screenshot_name}',
@@ -451,6 +904,75 @@ class VisualComparison:
         if hasattr(self.test_item, 'execution_count'):
             self.test_item.execution_count = pytest_rerun.get_reruns_count(self.test_item) + 1
 
+    def _finalize_passed_comparison(self, actual_image: numpy.ndarray, actual_file: str, diff_file: str) -> None:
+        """
+        Clean up artifacts of previous runs after passed comparison,
+        or save actual image if artifacts requested by :obj:`keep_passed_artifacts`
+
+        :param actual_image: actual image, BGR numpy.ndarray
+        :param actual_file: actual image path
+        :param diff_file: difference image path
+        :return: None
+        """
+        if self.keep_passed_artifacts:
+            self._write_artifact(actual_file, actual_image)
+            self._remove_artifacts(diff_file)
+        else:
+            self._remove_artifacts(actual_file, diff_file)
+
+    def _write_artifact(self, file: str, image: numpy.ndarray) -> Union[str, Future]:
+        """
+        Save image to the given file. Saving will be queued if :obj:`background_artifacts` enabled
+
+        :param file: image file path
+        :param image: BGR numpy.ndarray
+        :return: file path or Future of PNG bytes, if saving queued
+        """
+        if self.background_artifacts:
+            return artifact_writer.write_image(file, image)
+
+        cv2.imwrite(file, image)
+        return file
+
+    def _remove_artifacts(self, *files: str) -> None:
+        """
+        Remove given files if they exist. Removing will be queued if :obj:`background_artifacts` enabled
+
+        :param files: file paths
+        :return: None
+        """
+        if self.background_artifacts:
+            artifact_writer.remove_files(*files)
+        else:
+            remove_files(*files)
+
+    def _replace_reference(self, output_file: str, reference_file: str, output_image: numpy.ndarray) -> None:
+        """
+        Replace reference with the output image and update reference cache and index
+
+        :param output_file: output image path
+        :param reference_file: reference image path
+        :param output_image: output image, BGR numpy.ndarray
+        :return: None
+        """
+        move_file(output_file, reference_file)
+        reference_image = reference_cache.put(reference_file, output_image)
+        get_reference_index(self.reference_directory).update(reference_file, reference_image)
+
+    @staticmethod
+    def _read_artifact(artifact: Union[str, Future]) -> bytes:
+        """
+        Read PNG bytes of the given artifact. Blocks until queued artifact is encoded
+
+        :param artifact: image file path or Future of its PNG bytes
+        :return: PNG bytes
+        """
+        if isinstance(artifact, Future):
+            return artifact.result()
+
+        with open(artifact, 'rb') as image:
+            return image.read()
+
     @staticmethod
     def _remove_unexpected_underscores(text) -> str:
         """
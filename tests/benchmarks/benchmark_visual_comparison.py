@@ -0,0 +1,260 @@
+"""
+Headless benchmarks of visual comparison and image scaling hot paths. Browser is not required.
+
+Usage (from the repository root):
+    python tests/benchmarks/benchmark_visual_comparison.py --output benchmark.json
+    python tests/benchmarks/benchmark_visual_comparison.py --quick --compare benchmark.json
+"""
+from __future__ import annotations
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import statistics
+import shutil
+import subprocess
+import tempfile
+from typing import Callable, Optional
+
+import cv2
+import numpy
+import skimage
+from PIL import Image
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from mops.mixins.objects.cut_box import CutBox  # noqa: E402
+from mops.shared_utils import _scaled_screenshot, rescale_image  # noqa: E402
+from mops.utils.reference_storage import read_raw_image, reference_cache, write_raw_image  # noqa: E402
+from mops.visual_comparison import VisualComparison  # noqa: E402
+
+
+RESOLUTIONS = ((800, 600), (1920, 1080), (1920, 5000))
+QUICK_RESOLUTIONS = ((800, 600),)
+DIFFS = (('none', 0), ('local', 0.001), ('local', 0.05), ('noise', 0.001), ('noise', 0.05))
+QUICK_DIFFS = (('none', 0), ('local', 0.001), ('noise', 0.05))
+
+
+def get_image_pair(width: int, height: int, diff_kind: str, density: float, seed: int = 0) -> tuple:
+    """
+    Generate synthetic page-like BGR image pair
+
+    :param width: image width
+    :param height: image height
+    :param diff_kind: 'none' - same images, 'local' - single changed rectangle, 'noise' - changed random pixels
+    :param density: ratio of changed pixels
+    :param seed: random seed
+    :return: (reference image, actual image)
+    """
+    generator = numpy.random.default_rng(seed)
+    reference = numpy.full((height, width, 3), 245, dtype=numpy.uint8)
+
+    for _ in range(height // 40):
+        x, y = int(generator.integers(0, width - 200)), int(generator.integers(0, height - 30))
+        color = tuple(int(value) for value in generator.integers(0, 200, 3))
+        cv2.rectangle(reference, (x, y), (x + int(generator.integers(20, 200)), y + 20), color, -1)
+        cv2.putText(reference, 'mops', (x, y + 15), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+
+    actual = reference.copy()
+    changed_pixels = int(width * height * density)
+
+    if diff_kind == 'local' and changed_pixels:
+        side = max(int(changed_pixels ** 0.5), 1)
+        x, y = (width - side) // 2, (height - side) // 2
+        actual[y:y + side, x:x + side] = 255 - actual[y:y + side, x:x + side]
+    elif diff_kind == 'noise' and changed_pixels:
+        indexes = generator.choice(width * height, changed_pixels, replace=False)
+        actual.reshape(-1, 3)[indexes] = generator.integers(0, 255, (changed_pixels, 3), dtype=numpy.uint8)
+
+    return reference, actual
+
+
+def measure(func: Callable, repeat: int, setup: Optional[Callable] = None) -> dict:
+    """
+    Measure execution time of the function. Setup is called before each run and is not measured
+
+    :param func: function to be measured
+    :param repeat: count of measured runs, after one warm up run
+    :param setup: function to be called before each run
+    :return: timings in seconds
+    """
+    timings = []
+
+    for index in range(repeat + 1):
+        if setup:
+            setup()
+
+        start = time.perf_counter()
+        func()
+        duration = time.perf_counter() - start
+
+        if index:
+            timings.append(duration)
+
+    return {
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.mean(timings),
+        'repeat': repeat,
+    }
+
+
+def get_png(image: numpy.ndarray) -> bytes:
+    """
+    Encode BGR image to PNG bytes
+
+    :param image: BGR image
+    :return: PNG bytes
+    """
+    return cv2.imencode('.png', image)[1].tobytes()
+
+
+def run_benchmarks(resolutions: tuple, diffs: tuple, repeat: int) -> list:
+    """
+    Run all benchmarks
+
+    :param resolutions: image resolutions (width, height)
+    :param diffs: diff kinds and densities
+    :param repeat: count of measured runs
+    :return: list of benchmark results
+    """
+    results = []
+    work_directory = tempfile.mkdtemp(prefix='mops_benchmark_')
+    VisualComparison.visual_regression_path = work_directory
+    visual_comparison = VisualComparison(None, None)
+
+    def add_result(name: str, params: dict, timings: dict):
+        results.append({'name': name, 'params': params, **timings})
+        print(f'{name:<24} {json.dumps(params):<60} median {timings["median"] * 1000:10.2f} ms')
+
+    for width, height in resolutions:
+        for diff_kind, density in diffs:
+            params = {'width': width, 'height': height, 'diff': diff_kind, 'density': density}
+            reference, actual = get_image_pair(width, height, diff_kind, density)
+            reference_file = os.path.join(work_directory, f'reference_{width}x{height}.png')
+            cv2.imwrite(reference_file, reference)
+
+            add_result(
+                '_get_difference', params,
+                measure(lambda: visual_comparison._get_difference(reference, actual, 0), repeat),
+            )
+
+            def assert_same_images():
+                try:
+                    visual_comparison._assert_same_images(
+                        actual,
+                        os.path.join(visual_comparison.output_directory, 'actual.png'),
+                        reference_file,
+                        os.path.join(visual_comparison.diff_directory, 'diff.png'),
+                        threshold=0.01,
+                    )
+                except AssertionError:
+                    pass
+
+            add_result('_assert_same_images', params, measure(assert_same_images, repeat, reference_cache.clear))
+
+        reference_file = os.path.join(work_directory, f'reference_{width}x{height}.png')
+        params = {'width': width, 'height': height}
+        add_result(
+            'calculate_threshold', params,
+            measure(lambda: VisualComparison.calculate_threshold(reference_file, 10), repeat, reference_cache.clear),
+        )
+
+        # Pixels are summed to include reading of memory-mapped pages into the timing
+        write_raw_image(reference_file, cv2.imread(reference_file))
+        add_result('reference_load', {**params, 'format': 'png'}, measure(
+            lambda: cv2.imread(reference_file).sum(), repeat
+        ))
+        add_result('reference_load', {**params, 'format': 'npy_mmap'}, measure(
+            lambda: read_raw_image(reference_file).sum(), repeat
+        ))
+
+        screenshot = get_png(cv2.resize(get_image_pair(width, height, 'none', 0)[0], (width * 2, height * 2)))
+        add_result('_scaled_screenshot', {**params, 'scale': 2},
+                   measure(lambda: _scaled_screenshot(screenshot, width), repeat))
+        add_result('_scaled_screenshot', {**params, 'scale': 2, 'resample': 'box'}, measure(
+            lambda: _scaled_screenshot(screenshot, scale=2, resample=Image.Resampling.BOX), repeat
+        ))
+        add_result('rescale_image', {**params, 'scale': 2}, measure(lambda: rescale_image(screenshot), repeat))
+
+    cut_boxes = (CutBox(10, 20, 30, 40), CutBox(5, 5, 5, 5, is_percents=True))
+    add_result('CutBox.get_box', {'boxes': len(cut_boxes), 'calls': 10000}, measure(
+        lambda: [cut_box.get_box((1920, 1080)) for _ in range(5000) for cut_box in cut_boxes], repeat
+    ))
+
+    shutil.rmtree(work_directory, ignore_errors=True)
+    return results
+
+
+def get_environment() -> dict:
+    """
+    Get environment description for the benchmark results
+
+    :return: environment data
+    """
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': numpy.__version__,
+        'opencv': cv2.__version__,
+        'scikit-image': skimage.__version__,
+        'pillow': Image.__version__,
+        'ssim_engine': VisualComparison.ssim_engine,
+        'ssim_prefilter': VisualComparison.ssim_prefilter,
+    }
+
+
+def compare_results(results: list, baseline_file: str) -> None:
+    """
+    Print median time ratio of each benchmark to the baseline one
+
+    :param results: current benchmark results
+    :param baseline_file: baseline results file path
+    :return: None
+    """
+    with open(baseline_file) as file:
+        baseline = json.load(file)
+
+    baseline_results = {(item['name'], json.dumps(item['params'])): item for item in baseline['results']}
+    print(f'\nComparison with {baseline_file} (commit {baseline["environment"]["commit"]}):')
+
+    for item in results:
+        baseline_item = baseline_results.get((item['name'], json.dumps(item['params'])))
+        if baseline_item:
+            ratio = item['median'] / baseline_item['median']
+            print(f'{item["name"]:<24} {json.dumps(item["params"]):<60} x{ratio:.2f}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', default='benchmark_results.json', help='JSON results file path')
+    parser.add_argument('--repeat', type=int, default=5, help='count of measured runs for each benchmark')
+    parser.add_argument('--quick', action='store_true', help='run benchmarks for the smallest resolution only')
+    parser.add_argument('--compare', help='baseline JSON results file to compare with')
+    args = parser.parse_args()
+
+    resolutions, diffs = (QUICK_RESOLUTIONS, QUICK_DIFFS) if args.quick else (RESOLUTIONS, DIFFS)
+    results = run_benchmarks(resolutions, diffs, args.repeat)
+
+    with open(args.output, 'w') as file:
+        json.dump({'environment': get_environment(), 'results': results}, file, indent=1)
+
+    if args.compare:
+        compare_results(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
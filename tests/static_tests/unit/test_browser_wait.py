@@ -0,0 +1,179 @@
+import time
+from types import SimpleNamespace
+from typing import Union
+from unittest.mock import MagicMock
+
+import pytest
+
+from mops.exceptions import TimeoutException, UnexpectedTextException
+from mops.js_scripts import wait_element_condition_js
+from mops.mixins.objects.size import Size
+from mops.mixins.objects.wait_result import Result
+from mops.selenium import sel_utils
+from mops.selenium.sel_utils import browser_wait_condition, get_browser_locators, wait_in_browser
+from mops.utils.internal_utils import wait_condition
+from mops.utils.logs import autolog
+
+
+def get_element(locator_type='css selector', locator='.item', parent=None, element=None, is_native=False):
+    driver_wrapper = SimpleNamespace(is_appium=is_native, is_native_context=is_native)
+    return SimpleNamespace(
+        locator_type=locator_type, locator=locator, parent=parent, _element=element,
+        driver_wrapper=driver_wrapper, driver=MagicMock(),
+    )
+
+
+class MockElement:
+
+    def __init__(self, is_met: bool, is_displayed: bool):
+        self.driver_wrapper = SimpleNamespace(is_appium=False, is_native_context=False)
+        self.driver = MagicMock()
+        self.driver.execute_async_script.return_value = is_met
+        self.locator_type, self.locator, self.parent, self._element = 'xpath', '//div', None, None
+        self.is_displayed = is_displayed
+        self.checks = 0
+
+    def log(self, *args, **kwargs):
+        return autolog(*args, **kwargs)
+
+    @browser_wait_condition('size', expected_arg='expected_size')
+    @wait_condition
+    def wait_for_size(self, expected_size: Size, *, timeout: Union[int, float] = 1, silent: bool = False):  # noqa
+        self.checks += 1
+        return Result(  # noqa
+            execution_result=self.is_displayed,
+            log='wait for size',
+            exc=TimeoutException('unexpected size'),
+        )
+
+    @browser_wait_condition('text', expected_arg='expected_text')
+    @wait_condition
+    def wait_for_text(self, expected_text: str = None, *, timeout: Union[int, float] = 1, silent: bool = False):  # noqa
+        self.checks += 1
+        return Result(  # noqa
+            execution_result=self.is_displayed,
+            log='wait for text',
+            exc=UnexpectedTextException('unexpected text', 'actual', expected_text),
+        )
+
+
+def test_browser_locators_chain():
+    parent = get_element('xpath', '//main')
+    element = get_element(parent=get_element(parent=parent))
+
+    assert get_browser_locators(element) == [
+        {'by': 'xpath', 'value': '//main'},
+        {'by': 'css selector', 'value': '.item'},
+        {'by': 'css selector', 'value': '.item'},
+    ]
+
+
+def test_browser_locators_chain_with_found_element():
+    found_element = object()
+    element = get_element(parent=get_element(element=found_element, parent=get_element('xpath', '//main')))
+
+    assert get_browser_locators(element) == [{'element': found_element}, {'by': 'css selector', 'value': '.item'}]
+
+
+def test_browser_locators_chain_unsupported():
+    assert get_browser_locators(get_element(parent=get_element('accessibility id', 'item'))) is None
+
+
+def test_wait_in_browser_native_context():
+    element = get_element(is_native=True)
+
+    assert not wait_in_browser(element, 'visible', None, 1)
+    element.driver.execute_async_script.assert_not_called()
+
+
+def test_wait_in_browser_single_call():
+    element = get_element(parent=get_element('xpath', '//main'))
+    element.driver.execute_async_script.return_value = True
+
+    assert wait_in_browser(element, 'text', 'expected', 2)
+    element.driver.execute_async_script.assert_called_once()
+    script, locators, condition, expected, timeout = element.driver.execute_async_script.call_args.args
+    assert (script, locators[-1], condition, expected) == (
+        wait_element_condition_js, {'by': 'css selector', 'value': '.item'}, 'text', 'expected'
+    )
+    assert 1900 < timeout <= 2000
+
+
+def test_browser_wait_condition_confirmed_by_python():
+    element = MockElement(is_met=True, is_displayed=True)
+
+    assert element.wait_for_size(Size(width=10), timeout=1) is element
+    assert element.checks == 1
+    assert element.driver.execute_async_script.call_args.args[3] == {'width': 10, 'height': None}
+
+
+def test_browser_wait_condition_timeout():
+    element = MockElement(is_met=False, is_displayed=False)
+    element.driver.execute_async_script.side_effect = lambda *args: time.sleep(args[-1] / 1000)
+
+    with pytest.raises(TimeoutException) as exc:
+        element.wait_for_size(Size(width=10), timeout=0.2, silent=True)
+
+    assert exc.value._timeout == 0.2
+    assert element.checks <= 2
+
+
+def test_browser_wait_condition_not_confirmed_by_python():
+    element = MockElement(is_met=True, is_displayed=False)
+
+    with pytest.raises(TimeoutException):
+        element.wait_for_size(Size(width=10), timeout=0.3, silent=True)
+
+    assert element.checks > 1
+    element.driver.execute_async_script.assert_called_once()
+
+
+def test_browser_wait_condition_met_by_python_after_chunk(monkeypatch):
+    monkeypatch.setattr(sel_utils, 'BROWSER_WAIT_CHUNK', 0.1)
+    element = MockElement(is_met=False, is_displayed=True)
+    element.driver.execute_async_script.side_effect = lambda *args: time.sleep(args[-1] / 1000)
+    start_time = time.monotonic()
+
+    assert element.wait_for_size(Size(width=10), timeout=5) is element
+    assert time.monotonic() - start_time < 1
+    assert element.checks == 1
+    assert 0 < element.driver.execute_async_script.call_args.args[-1] <= 100
+
+
+def test_browser_wait_condition_checked_between_chunks(monkeypatch):
+    monkeypatch.setattr(sel_utils, 'BROWSER_WAIT_CHUNK', 0.05)
+    element = MockElement(is_met=False, is_displayed=False)
+    element.driver.execute_async_script.side_effect = lambda *args: time.sleep(args[-1] / 1000)
+
+    with pytest.raises(TimeoutException) as exc:
+        element.wait_for_size(Size(width=10), timeout=0.3, silent=True)
+
+    assert exc.value._timeout == 0.3
+    assert 4 <= element.driver.execute_async_script.call_count <= 7
+    assert element.checks >= element.driver.execute_async_script.call_count
+
+
+def test_browser_wait_condition_expected_value_by_keyword():
+    element = MockElement(is_met=True, is_displayed=True)
+
+    element.wait_for_size(silent=True, expected_size=Size(height=5))
+
+    assert element.driver.execute_async_script.call_args.args[3] == {'width': None, 'height': 5}
+
+
+def test_browser_wait_condition_default_expected_value():
+    element = MockElement(is_met=True, is_displayed=True)
+
+    element.wait_for_text(timeout=5)
+
+    assert element.driver.execute_async_script.call_args.args[3] is None
+
+
+def test_browser_wait_condition_exception_keeps_type():
+    element = MockElement(is_met=True, is_displayed=False)
+
+    with pytest.raises(UnexpectedTextException) as exc:
+        element.wait_for_text('expected', timeout=0.1, silent=True)
+
+    assert element.driver.execute_async_script.call_args.args[3] == 'expected'
+    assert exc.value.msg == 'unexpected text after 0.1 seconds. Actual: "actual"; Expected: "expected".'
@@ -0,0 +1,94 @@
+import io
+from types import MethodType
+from unittest.mock import MagicMock
+
+import pytest
+from PIL import Image
+
+from mops.base.element import Element
+from mops.selenium.driver import mobile_driver
+from mops.selenium.driver.mobile_driver import MobileDriver
+from mops.selenium.elements.mobile_element import MobileElement
+
+
+def get_png(size):
+    buffer = io.BytesIO()
+    Image.new('RGB', size).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+# Driver wrapper methods are bound to the class by the first created session, so mobile methods are called directly
+@pytest.fixture
+def ios_driver(mocked_ios_driver):
+    mocked_ios_driver.caps.update(deviceName='iPhone 15', platformVersion='17.0')
+    mocked_ios_driver.native_safari = MagicMock()
+    mocked_ios_driver.native_safari.top_bar.size.height = 50
+    mocked_ios_driver.native_safari.get_bottom_bar_height.return_value = 80
+    mocked_ios_driver.switch_to_native = MagicMock()
+    mocked_ios_driver.switch_to_web = MagicMock()
+    mocked_ios_driver.driver.execute_script = MagicMock(return_value=1)
+    mocked_ios_driver.driver.get_screenshot_as_png = MagicMock(return_value=get_png((390, 844)))
+    mocked_ios_driver.driver.get_window_size = MagicMock(return_value={'width': 390, 'height': 844})
+    mocked_ios_driver._window_heights = {}
+    mocked_ios_driver._get_window_height = MethodType(MobileDriver._get_window_height, mocked_ios_driver)
+    yield mocked_ios_driver
+    mobile_driver.safari_bars_cache.clear()
+
+
+def test_safari_bars_cached_per_device_and_orientation(ios_driver):
+    assert MobileDriver.screenshot_image(ios_driver).size == (390, 714)
+    assert MobileDriver.screenshot_image(ios_driver).size == (390, 714)
+    assert ios_driver.top_bar_height == 50
+    ios_driver.switch_to_native.assert_called_once()
+
+    ios_driver.driver.get_screenshot_as_png.return_value = get_png((844, 390))
+    ios_driver.native_safari.top_bar.size.height = 20
+    ios_driver.native_safari.get_bottom_bar_height.return_value = 30
+
+    assert MobileDriver.screenshot_image(ios_driver).size == (844, 340)
+    assert ios_driver.switch_to_native.call_count == 2
+    assert list(mobile_driver.safari_bars_cache.values()) == [(50, 80), (20, 30)]
+
+
+def test_ios_element_screenshot_single_geometry_call(ios_driver):
+    element = Element('element', driver_wrapper=ios_driver)
+    element.execute_script = MagicMock(return_value={
+        'x': 10, 'y': 20, 'width': 100, 'height': 40, 'innerWidth': 390, 'innerHeight': 714,
+    })
+
+    image = MobileElement.screenshot_image(element)
+
+    assert image.size == (100, 40)
+    element.execute_script.assert_called_once()
+
+
+
+def test_ios_element_screenshot_window_height_cached(ios_driver):
+    element = Element('element', driver_wrapper=ios_driver)
+    element.execute_script = MagicMock(return_value={
+        'x': 10, 'y': 20, 'width': 100, 'height': 40, 'innerWidth': 390, 'innerHeight': 714,
+    })
+
+    MobileElement.screenshot_image(element)
+    MobileElement.screenshot_image(element)
+
+    ios_driver.driver.get_window_size.assert_called_once()
+
+
+def test_ios_element_screenshot_taller_than_viewport_cropped(ios_driver):
+    """ Element fits the native window, but not the viewport: it is cropped by the window height rule """
+    element = Element('element', driver_wrapper=ios_driver)
+    element.execute_script = MagicMock(return_value={
+        'x': 0, 'y': 0, 'width': 300, 'height': 800, 'innerWidth': 390, 'innerHeight': 714,
+    })
+
+    assert MobileElement.screenshot_image(element).size == (300, 800)
+
+
+def test_ios_element_screenshot_taller_than_window_not_cropped(ios_driver):
+    element = Element('element', driver_wrapper=ios_driver)
+    element.execute_script = MagicMock(return_value={
+        'x': 0, 'y': 0, 'width': 300, 'height': 900, 'innerWidth': 390, 'innerHeight': 714,
+    })
+
+    assert MobileElement.screenshot_image(element).size == ios_driver.screenshot_image().size
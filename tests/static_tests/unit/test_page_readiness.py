@@ -0,0 +1,118 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from mops.base.page import Page
+from mops.exceptions import TimeoutException
+from mops.js_scripts import get_elements_visibility_js, play_get_elements_visibility_js
+from mops.playwright.play_utils import get_elements_visibility as get_play_elements_visibility
+from mops.selenium.sel_utils import get_elements_visibility
+from mops.utils.wait_scheduler import WaitScheduler
+
+
+def get_element(name, wait=None):
+    return SimpleNamespace(name=name, wait=wait, locator_type='css selector', locator=f'.{name}', parent=None,
+                           _element=None)
+
+
+@pytest.fixture
+def page():
+    page = MagicMock()
+    page.name = 'Home page'
+    page.driver_wrapper.is_appium = False
+    page.driver_wrapper.is_playwright = False
+    page.driver_wrapper.wait_scheduler = None
+    page.anchor = get_element('anchor')
+    page.page_elements = [get_element('header', wait=True), get_element('loader', wait=False), get_element('other')]
+    return page
+
+
+def test_wait_page_loaded_single_query_per_tick(page):
+    page._get_elements_visibility.side_effect = [[True, False, True], [True, True, False]]
+
+    assert Page.wait_page_loaded(page, silent=True, timeout=1) is page
+    assert page._get_elements_visibility.call_count == 2
+    assert page._get_elements_visibility.call_args.args[0] == [page.anchor, *page.page_elements[:2]]
+
+
+def test_wait_page_loaded_reports_not_ready_elements(page):
+    page._get_elements_visibility.return_value = [True, False, True]
+
+    with pytest.raises(TimeoutException) as exc:
+        Page.wait_page_loaded(page, silent=True, timeout=0.2)
+
+    assert '"header" (not visible), "loader" (still visible)' in exc.value.msg
+    assert exc.value._timeout == 0.2
+
+
+def test_is_page_opened_single_query(page):
+    page._get_elements_visibility.return_value = [True, True]
+
+    assert Page.is_page_opened(page, with_elements=True)
+    page._get_elements_visibility.assert_called_once_with([page.page_elements[0], page.anchor])
+
+
+def test_is_page_opened_not_displayed_element(page):
+    page._get_elements_visibility.return_value = [False, True]
+
+    assert not Page.is_page_opened(page, with_elements=True)
+
+
+def test_get_elements_visibility_script():
+    driver_wrapper = MagicMock(is_appium=False)
+    driver_wrapper.driver.execute_script.return_value = [True, False]
+    elements = [get_element('anchor'), get_element('header')]
+
+    assert get_elements_visibility(driver_wrapper, elements) == [True, False]
+    driver_wrapper.driver.execute_script.assert_called_once_with(
+        get_elements_visibility_js,
+        [[{'by': 'css selector', 'value': '.anchor'}], [{'by': 'css selector', 'value': '.header'}]],
+    )
+
+
+def test_get_elements_visibility_unsupported_locator():
+    driver_wrapper = MagicMock(is_appium=False)
+    elements = [get_element('anchor'), SimpleNamespace(locator_type='id', locator='a', parent=None, _element=None)]
+
+    assert get_elements_visibility(driver_wrapper, elements) is None
+    driver_wrapper.driver.execute_script.assert_not_called()
+
+
+def test_wait_page_loaded_call_scheduler(page):
+    scheduler = WaitScheduler(delay=0.01)
+    page._get_elements_visibility.side_effect = [[True, False, True], [True, True, False]]
+
+    assert Page.wait_page_loaded(page, silent=True, timeout=1, scheduler=scheduler) is page
+    assert scheduler.last_statistics.iterations == 2
+
+
+def test_play_elements_visibility_single_evaluate():
+    driver_wrapper = MagicMock()
+    driver_wrapper.driver.evaluate.return_value = [True, None, False]
+    parent = SimpleNamespace(locator='xpath=//main', parent=None, _element=None)
+    elements = [
+        SimpleNamespace(locator='.anchor', parent=parent, _element=None),
+        SimpleNamespace(locator='id=shadow', parent=None, _element=None, is_displayed=MagicMock(return_value=True)),
+        SimpleNamespace(locator='div[data-state="closed"]', parent=None, _element=None),
+    ]
+
+    assert get_play_elements_visibility(driver_wrapper, elements) == [True, True, False]
+    driver_wrapper.driver.evaluate.assert_called_once_with(
+        play_get_elements_visibility_js,
+        [
+            [{'by': 'xpath', 'value': '//main'}, {'by': 'css selector', 'value': '.anchor'}],
+            [{'by': 'css selector', 'value': '[id="shadow"]'}],
+            [{'by': 'css selector', 'value': 'div[data-state="closed"]'}],
+        ],
+    )
+    elements[1].is_displayed.assert_called_once_with(silent=True)
+
+
+@pytest.mark.parametrize('locator', ['text=Submit', '.item >> nth=1'])
+def test_play_elements_visibility_unsupported_locator(locator):
+    driver_wrapper = MagicMock()
+    element = SimpleNamespace(locator=locator, parent=None, _element=None)
+
+    assert get_play_elements_visibility(driver_wrapper, [element]) is None
+    driver_wrapper.driver.evaluate.assert_not_called()
@@ -0,0 +1,105 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mops.exceptions import (
+    TimeoutException,
+    UnexpectedElementsCountException,
+    UnexpectedElementSizeException,
+    UnexpectedTextException,
+)
+from mops.mixins.objects.size import Size
+from mops.playwright.play_element import PlayElement, any_text_pattern, get_exact_match_pattern
+from mops.utils.wait_scheduler import WaitScheduler
+
+
+@pytest.fixture
+def element():
+    element = MagicMock()
+    element.name = 'card'
+    element.text = 'actual  text'
+    element.is_available.return_value = True
+    return element
+
+
+@pytest.fixture
+def expect():
+    with patch('mops.playwright.play_element.expect') as expect:
+        yield expect
+
+
+def test_exact_match_pattern():
+    pattern = get_exact_match_pattern('a  (b)\nc?')
+
+    assert pattern.search('a  (b)\nc?')
+    assert not pattern.search('a (b) c?')
+    assert not pattern.search('a  (b)\nc? d')
+    assert any_text_pattern.search(' ')
+    assert not any_text_pattern.search('')
+
+
+def test_wait_for_text_native(element, expect):
+    assert PlayElement.wait_for_text(element, 'text', timeout=2, silent=True) is element
+
+    expect.assert_called_once_with(element._first_element)
+    pattern = expect.return_value.to_have_text.call_args.args[0]
+    assert pattern.pattern == get_exact_match_pattern('text').pattern
+    assert expect.return_value.to_have_text.call_args.kwargs == {'use_inner_text': True, 'timeout': 2000}
+
+
+def test_wait_for_text_native_error(element, expect):
+    expect.return_value.to_have_text.side_effect = AssertionError('timeout')
+
+    with pytest.raises(UnexpectedTextException) as exc:
+        PlayElement.wait_for_text(element, 'text', timeout=1, silent=True)
+
+    assert 'Actual: "actual  text"; Expected: "text"' in exc.value.msg
+    assert 'after 1 seconds' in exc.value.msg
+
+
+def test_wait_enabled_native_error(element, expect):
+    expect.return_value.to_be_enabled.side_effect = AssertionError('timeout')
+
+    with pytest.raises(TimeoutException):
+        PlayElement.wait_enabled(element, timeout=1, silent=True)
+
+
+def test_wait_elements_count_native_error(element, expect):
+    expect.return_value.to_have_count.side_effect = AssertionError('timeout')
+    element.get_elements_count.return_value = 2
+
+    with pytest.raises(UnexpectedElementsCountException) as exc:
+        PlayElement.wait_elements_count(element, 3, timeout=1, silent=True)
+
+    expect.assert_called_once_with(element.element)
+    assert 'Actual: 2; Expected: 3' in exc.value.msg
+
+
+def test_wait_for_size_native(element):
+    element._first_element.evaluate.return_value = True
+    assert PlayElement.wait_for_size(element, Size(width=10), timeout=1, silent=True) is element
+    assert element._first_element.evaluate.call_args.args[1] == [10, None, 1000]
+
+    element._first_element.evaluate.return_value = False
+    element.size = Size(width=5, height=5)
+    with pytest.raises(UnexpectedElementSizeException):
+        PlayElement.wait_for_size(element, Size(width=10), timeout=1, silent=True)
+
+
+@pytest.mark.parametrize('wait, args', [
+    (PlayElement.wait_visibility, ()),
+    (PlayElement.wait_hidden, ()),
+    (PlayElement.wait_availability, ()),
+    (PlayElement.wait_for_text, ('text', )),
+    (PlayElement.wait_for_value, ('value', )),
+    (PlayElement.wait_enabled, ()),
+    (PlayElement.wait_disabled, ()),
+    (PlayElement.wait_for_size, (Size(width=10), )),
+    (PlayElement.wait_elements_count, (3, )),
+])
+def test_wait_scheduler_not_supported(element, expect, wait, args):
+    with pytest.raises(ValueError):
+        wait(element, *args, timeout=1, silent=True, scheduler=WaitScheduler())
+
+    assert not element.mock_calls
+    expect.assert_not_called()
@@ -0,0 +1,175 @@
+import json
+from types import SimpleNamespace
+from typing import Union
+from unittest.mock import MagicMock
+
+import pytest
+
+from selenium.webdriver.remote.webdriver import WebDriver as SeleniumWebDriver
+from selenium.webdriver.remote.webelement import WebElement as SeleniumWebElement
+
+from mops.exceptions import TimeoutException
+from mops.mixins.objects.wait_result import Result
+from mops.selenium.core.core_driver import CoreDriver
+from mops.utils.internal_utils import wait_condition
+from mops.utils.profiler import profile, profile_commands, profiler
+from mops.utils.wait_scheduler import WaitScheduler
+
+
+class MockDriverWrapper:
+    label = '1_driver'
+    is_appium = False
+    wait_scheduler = WaitScheduler(delay=0.01)
+
+    @profile(is_round_trip=True)
+    def execute_script(self, script: str, *args):
+        return script
+
+
+class MockElement:
+
+    def __init__(self, name: str, locator: str, driver_wrapper: MockDriverWrapper, call_count: int = 0):
+        self.name, self.locator, self.driver_wrapper = name, locator, driver_wrapper
+        self.call_count = call_count
+
+    @wait_condition
+    def wait_something(self, *, timeout: Union[int, float] = 1, silent: bool = False):  # noqa
+        self.driver_wrapper.execute_script('return 1;')
+        self.call_count -= 1
+        return Result(  # noqa
+            execution_result=self.call_count < 0,
+            log='wait some condition',
+            exc=TimeoutException('wait some condition failed!'),
+        )
+
+
+@pytest.fixture
+def enabled_profiler():
+    profiler.enable()
+    profiler.current_test = 'test_case'
+    yield profiler
+    profiler.disable()
+    profiler.current_test = None
+    profiler.reset()
+
+
+def test_profiler_disabled():
+    element = MockElement('button', '.button', MockDriverWrapper(), call_count=2)
+
+    assert element.wait_something(silent=True) is element
+    assert profiler.records == {}
+
+
+def test_profiler_wait_and_round_trips(enabled_profiler):
+    driver_wrapper = MockDriverWrapper()
+    MockElement('button', '.button', driver_wrapper, call_count=2).wait_something(silent=True)
+    driver_wrapper.execute_script('return document.title;')
+
+    wait = profiler.records[('test_case', 'button', '.button', 'wait_something')]
+    script = profiler.records[('test_case', 'button', '.button', 'execute_script')]
+    driver_script = profiler.records[('test_case', '1_driver', '', 'execute_script')]
+
+    assert (wait.calls, wait.iterations, wait.round_trips) == (1, 3, 0)
+    assert wait.top_elapsed == wait.elapsed >= 0.02
+    assert (script.calls, script.round_trips, script.top_elapsed) == (3, 3, 0)
+    assert (driver_script.calls, driver_script.round_trips) == (1, 1)
+
+
+def get_selenium_driver() -> SeleniumWebDriver:
+    driver = SeleniumWebDriver.__new__(SeleniumWebDriver)
+    driver.session_id = 'session'
+    driver.command_executor = MagicMock()
+    driver.command_executor.execute.return_value = {'value': None}
+    driver.error_handler = MagicMock()
+    profile_commands(driver)
+    return driver
+
+
+def test_profiler_element_argument(enabled_profiler):
+    driver_wrapper = SimpleNamespace(driver=get_selenium_driver())
+    element = SimpleNamespace(name='card', locator='//div', element=None)
+
+    CoreDriver.execute_script(driver_wrapper, 'arguments[0].click();', element)
+
+    assert profiler.records[('test_case', 'card', '//div', 'execute_script')].round_trips == 0
+    assert profiler.records[('test_case', 'card', '//div', 'w3cExecuteScript')].round_trips == 1
+    driver_wrapper.driver.command_executor.execute.assert_called_once()
+
+
+def test_profiler_driver_commands(enabled_profiler):
+    driver = get_selenium_driver()
+    web_element = SeleniumWebElement(driver, 'element-id')
+    element = MockElement('button', '.button', MockDriverWrapper(), call_count=2)
+    element.driver_wrapper.execute_script = lambda *args: web_element.text
+
+    element.wait_something(silent=True)
+    driver.execute('getTitle')
+
+    wait = profiler.records[('test_case', 'button', '.button', 'wait_something')]
+    command = profiler.records[('test_case', 'button', '.button', 'getElementText')]
+    driver_command = profiler.records[('test_case', 'WebDriver', '', 'getTitle')]
+
+    assert (wait.calls, wait.round_trips) == (1, 0)
+    assert (command.calls, command.round_trips, command.top_elapsed) == (3, 3, 0)
+    assert (driver_command.calls, driver_command.round_trips) == (1, 1)
+    assert profiler.get_report()['total']['round_trips'] == 4
+
+
+def test_profiler_driver_commands_disabled():
+    driver = get_selenium_driver()
+    driver.execute('getTitle')
+
+    assert profiler.records == {}
+    driver.command_executor.execute.assert_called_once()
+
+
+def test_profiler_test_name_from_pytest(enabled_profiler):
+    profiler.current_test = None
+    MockDriverWrapper().execute_script('return 1;')
+
+    (test, *_), = profiler.records.keys()
+    assert test.endswith('test_profiler.py::test_profiler_test_name_from_pytest')
+
+
+def test_profiler_report(enabled_profiler, tmp_path):
+    driver_wrapper = MockDriverWrapper()
+    MockElement('fast', '.fast', driver_wrapper).wait_something(silent=True)
+    MockElement('slow', '.slow', driver_wrapper, call_count=3).wait_something(silent=True)
+
+    path = profiler.save_report(str(tmp_path / 'profile.json'))
+
+    with open(path) as report_file:
+        report = json.load(report_file)
+
+    assert [element['name'] for element in report['elements']] == ['slow', 'fast']
+    assert report['elements'][0]['calls'] == {'wait_something': 1, 'execute_script': 4}
+    assert (report['elements'][0]['round_trips'], report['elements'][0]['iterations']) == (4, 4)
+    assert report['total']['round_trips'] == 5
+    assert report['tests'][0]['test'] == 'test_case'
+    assert report['calls'][0]['kind'] == 'wait_something'
+
+    summary = (tmp_path / 'profile.txt').read_text()
+    assert summary.index('"slow" (.slow)') < summary.index('"fast" (.fast)')
+    assert 'Profiled:' in summary and '5 round trips' in summary
+
+
+def test_profiler_save_report_without_records(tmp_path):
+    assert profiler.save_report(str(tmp_path / 'profile.json')) is None
+    assert not (tmp_path / 'profile.json').exists()
+
+
+def test_profiler_selenium_driver_class_untouched():
+    driver = get_selenium_driver()
+    profile_commands(driver)
+
+    assert not hasattr(SeleniumWebDriver.execute, '__wrapped__')
+    assert 'execute' not in vars(SeleniumWebDriver.__new__(SeleniumWebDriver))
+    assert driver.execute.__wrapped__ is SeleniumWebDriver.execute
+
+
+def test_profiler_core_driver_commands(enabled_profiler):
+    driver = get_selenium_driver()
+    del driver.execute
+    CoreDriver.__init__(CoreDriver.__new__(CoreDriver), driver)
+
+    assert profiler.records[('test_case', 'WebDriver', '', 'setTimeouts')].round_trips == 1
@@ -0,0 +1,32 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from mops import pytest_plugin
+
+
+def test_session_finish_failed_flush(monkeypatch):
+    flush = MagicMock(side_effect=OSError('disk is full'))
+    monkeypatch.setattr(pytest_plugin, 'session_flushes', (flush, flush))
+    session = SimpleNamespace(exitstatus=pytest.ExitCode.OK)
+
+    pytest_plugin.pytest_sessionfinish(session)  # noqa
+
+    assert session.exitstatus == pytest.ExitCode.TESTS_FAILED
+    assert flush.call_count == 2
+
+
+def test_session_finish_successful_flush(monkeypatch):
+    flush = MagicMock()
+    monkeypatch.setattr(pytest_plugin, 'session_flushes', (flush, ))
+    session = SimpleNamespace(exitstatus=pytest.ExitCode.OK)
+
+    pytest_plugin.pytest_sessionfinish(session)  # noqa
+
+    assert session.exitstatus == pytest.ExitCode.OK
+    flush.assert_called_once()
+
+
+def test_plugin_registered(pytestconfig):
+    assert pytestconfig.pluginmanager.has_plugin('mops.pytest_plugin')
@@ -0,0 +1,41 @@
+from unittest.mock import MagicMock
+
+from mops.mixins.objects.size import Size
+
+
+def mock_viewport(driver_wrapper):
+    driver_wrapper.driver.execute_script = MagicMock(return_value={'width': 1024, 'height': 768})
+    return driver_wrapper.driver.execute_script
+
+
+def test_viewport_size_cached(mocked_selenium_driver):
+    execute_script = mock_viewport(mocked_selenium_driver)
+
+    size = mocked_selenium_driver.get_inner_window_size()
+    size.width = 0
+
+    assert mocked_selenium_driver.get_inner_window_size() == Size(width=1024, height=768)
+    execute_script.assert_called_once()
+
+
+def test_viewport_size_invalidated(mocked_selenium_driver):
+    execute_script = mock_viewport(mocked_selenium_driver)
+    mocked_selenium_driver.driver.set_window_size = MagicMock()
+    mocked_selenium_driver.driver.refresh = MagicMock()
+
+    mocked_selenium_driver.get_inner_window_size()
+    mocked_selenium_driver.set_window_size(800, 600)
+    mocked_selenium_driver.get_inner_window_size()
+    mocked_selenium_driver.refresh()
+    mocked_selenium_driver.get_inner_window_size()
+
+    assert execute_script.call_count == 3
+
+
+def test_viewport_size_not_cached_for_mobile(mocked_selenium_mobile_driver):
+    execute_script = mock_viewport(mocked_selenium_mobile_driver)
+
+    mocked_selenium_mobile_driver.get_inner_window_size()
+    mocked_selenium_mobile_driver.get_inner_window_size()
+
+    assert execute_script.call_count == 2
@@ -0,0 +1,145 @@
+import threading
+from types import SimpleNamespace
+from typing import Union
+
+import pytest
+
+from mops.exceptions import TimeoutException
+from mops.mixins.objects.wait_result import Result
+from mops.utils.internal_utils import wait_condition
+from mops.utils.logs import autolog
+from mops.utils.wait_scheduler import (
+    WaitPolicy,
+    WaitScheduler,
+    appium_wait_scheduler,
+    default_wait_scheduler,
+    get_wait_scheduler,
+)
+
+
+class MockNamespace:
+
+    def __init__(self, call_count: int, wait_scheduler: WaitScheduler = None):
+        self.call_count = call_count
+        self.actual_call_count = 0
+        self.driver_wrapper = SimpleNamespace(is_appium=False, wait_scheduler=wait_scheduler)
+
+    def log(self, *args, **kwargs):
+        return autolog(*args, **kwargs)
+
+    @wait_condition
+    def wait_something(self, *, timeout: Union[int, float] = 1, silent: bool = False):  # noqa
+        self.actual_call_count += 1
+        return Result(  # noqa
+            execution_result=self.actual_call_count > self.call_count,
+            log='wait some condition',
+            exc=TimeoutException('wait some condition failed!'),
+        )
+
+
+@pytest.mark.parametrize('policy, delays', [
+    (WaitPolicy.FIXED, [0.1, 0.1, 0.1, 0.1]),
+    (WaitPolicy.EXPONENTIAL, [0.1, 0.2, 0.4, 0.8]),
+])
+def test_scheduler_delays(policy, delays):
+    scheduler = WaitScheduler(policy)
+    assert [scheduler.get_delay(iteration, 10) for iteration in range(1, 5)] == pytest.approx(delays)
+
+
+def test_scheduler_exponential_max_delay():
+    assert WaitScheduler(WaitPolicy.EXPONENTIAL).get_delay(10, 10) == pytest.approx(1.6)
+
+
+def test_scheduler_jittered_delays():
+    scheduler = WaitScheduler(WaitPolicy.JITTERED, jitter=0.5)
+
+    for iteration in range(1, 5):
+        assert 0.1 * 2 ** (iteration - 1) * 0.5 <= scheduler.get_delay(iteration, 10) <= 0.1 * 2 ** (iteration - 1)
+
+
+def test_scheduler_budget_delays():
+    scheduler = WaitScheduler(WaitPolicy.BUDGET, checks=5)
+
+    assert scheduler.get_delay(1, 2) == pytest.approx(0.5)
+    assert scheduler.get_delay(10, 2) == pytest.approx(2)
+    assert scheduler.get_delay(1, 0.2) == pytest.approx(0.1)
+
+
+@pytest.mark.parametrize('policy', [WaitPolicy.FIXED, WaitPolicy.EXPONENTIAL, WaitPolicy.BUDGET])
+def test_scheduler_delay_clamped_to_deadline(policy):
+    assert WaitScheduler(policy, delay=1, max_delay=1).get_delay(3, 0.05) == pytest.approx(0.05)
+
+
+def test_scheduler_statistics_negative():
+    statistics = []
+    scheduler = WaitScheduler(WaitPolicy.EXPONENTIAL, delay=0.2, statistics_handler=statistics.append)
+
+    assert not scheduler.run(lambda: False, 0.3)
+    assert statistics == [scheduler.last_statistics]
+    assert scheduler.last_statistics.iterations == 3
+    assert scheduler.last_statistics.total_sleep == pytest.approx(0.3, abs=0.01)
+    assert scheduler.last_statistics.overshoot < 0.05
+    assert not scheduler.last_statistics.is_successful
+
+
+def test_scheduler_statistics_positive():
+    results = iter([False, False, True])
+    scheduler = WaitScheduler()
+
+    assert scheduler.run(lambda: next(results), 1)
+    assert scheduler.last_statistics.iterations == 3
+    assert scheduler.last_statistics.total_sleep == pytest.approx(0.2)
+    assert scheduler.last_statistics.overshoot == 0
+    assert scheduler.last_statistics.is_successful
+
+
+@pytest.mark.parametrize('kwargs', [dict(policy='linear'), dict(delay=0), dict(delay=2, max_delay=1), dict(jitter=1)])
+def test_scheduler_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        WaitScheduler(**kwargs)
+
+
+def test_scheduler_policy_by_name():
+    assert WaitScheduler('budget').policy is WaitPolicy.BUDGET
+    assert repr(WaitScheduler(WaitPolicy.JITTERED)) == 'WaitScheduler(policy=jittered, delay=0.1)'
+
+
+def test_scheduler_statistics_per_thread():
+    scheduler = WaitScheduler(delay=0.01)
+    thread = threading.Thread(target=scheduler.run, args=(lambda: False, 0.05))
+    thread.start()
+    thread.join()
+
+    assert scheduler.last_statistics is None
+    scheduler.run(lambda: True, 1)
+    assert scheduler.last_statistics.iterations == 1
+
+
+def test_get_wait_scheduler():
+    scheduler, call_scheduler = WaitScheduler(), WaitScheduler()
+
+    assert get_wait_scheduler(SimpleNamespace(is_appium=False)) is default_wait_scheduler
+    assert get_wait_scheduler(SimpleNamespace(is_appium=True)) is appium_wait_scheduler
+    assert get_wait_scheduler(SimpleNamespace(is_appium=True, wait_scheduler=scheduler)) is scheduler
+    assert get_wait_scheduler(SimpleNamespace(wait_scheduler=scheduler), call_scheduler) is call_scheduler
+
+
+def test_wait_condition_driver_wrapper_scheduler():
+    scheduler = WaitScheduler(delay=0.01)
+    namespace = MockNamespace(call_count=3, wait_scheduler=scheduler)
+
+    assert namespace.wait_something(silent=True) is namespace
+    assert scheduler.last_statistics.iterations == 4
+    assert scheduler.last_statistics.total_sleep == pytest.approx(0.03)
+
+
+def test_wait_condition_call_scheduler_timeout():
+    scheduler = WaitScheduler(WaitPolicy.EXPONENTIAL, delay=1, max_delay=1)
+    namespace = MockNamespace(call_count=10, wait_scheduler=WaitScheduler())
+
+    with pytest.raises(TimeoutException) as exc:
+        namespace.wait_something(timeout=0.2, silent=True, scheduler=scheduler)
+
+    assert exc.value._timeout == 0.2
+    assert namespace.actual_call_count == 2
+    assert scheduler.last_statistics.elapsed < 0.25
@@ -0,0 +1,34 @@
+import pytest
+
+from mops.utils.reference_generation import generation_manifests
+from mops.utils.reference_storage import reference_cache
+from mops.visual_comparison import VisualComparison
+
+
+def get_class_settings() -> dict:
+    return {
+        name: value for name, value in vars(VisualComparison).items()
+        if not name.startswith('_') and not callable(value) and not isinstance(value, (classmethod, staticmethod))
+    }
+
+
+@pytest.fixture
+def visual_settings(tmp_path):
+    """
+    VisualComparison class with visual regression path in the temporary directory.
+    All class settings, changed by the test, are restored, and shared caches are cleared after it
+    """
+    settings = get_class_settings()
+    VisualComparison.visual_regression_path = str(tmp_path)
+    yield VisualComparison
+    for name in get_class_settings().keys() - settings.keys():
+        delattr(VisualComparison, name)
+    for name, value in settings.items():
+        setattr(VisualComparison, name, value)
+    generation_manifests.clear()
+    reference_cache.clear()
+
+
+@pytest.fixture
+def visual_comparison(visual_settings):
+    return VisualComparison(None, None)
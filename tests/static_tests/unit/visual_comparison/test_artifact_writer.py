@@ -0,0 +1,89 @@
+import os
+import threading
+from unittest.mock import MagicMock
+
+import cv2
+import numpy
+import pytest
+from PIL import Image
+
+from mops.utils.artifact_writer import ArtifactWriter, artifact_writer
+from mops.utils.reference_storage import reference_cache
+from mops.visual_comparison import VisualComparison
+
+
+@pytest.fixture
+def image():
+    return numpy.random.default_rng(0).integers(0, 255, (40, 60, 3), dtype=numpy.uint8)
+
+
+@pytest.fixture
+def visual_comparison(visual_settings):
+    visual_settings.background_artifacts = True
+    return VisualComparison(None, None)
+
+
+def test_artifact_writer_same_path_order(tmp_path, image):
+    writer = ArtifactWriter(workers=4)
+    file = str(tmp_path / 'image.png')
+    release = threading.Event()
+
+    writer.submit(release.wait, paths=(file,))
+    writer.write_image(file, image)
+    removing = writer.remove_files(file)
+    release.set()
+    writer.flush()
+
+    assert removing.done()
+    assert not os.path.exists(file)
+    assert writer.pending == 0
+
+
+def test_artifact_writer_memory_bound(image):
+    writer = ArtifactWriter(workers=2, max_pending_bytes=image.nbytes)
+    release = threading.Event()
+
+    writer.submit(release.wait, nbytes=image.nbytes)
+    submitting = threading.Thread(target=writer.encode_image, args=(image,))
+    submitting.start()
+    submitting.join(0.2)
+
+    assert submitting.is_alive()
+
+    release.set()
+    submitting.join(1)
+    writer.flush()
+
+    assert not submitting.is_alive()
+    assert writer.pending_bytes == 0
+
+
+def test_artifact_writer_flush_raises_error(tmp_path, image):
+    writer = ArtifactWriter()
+    writer.write_image(str(tmp_path / 'missed' / 'image.png'), image)
+
+    with pytest.raises(OSError):
+        writer.flush()
+
+    writer.flush()
+
+
+def test_background_artifacts_of_failed_comparison(visual_comparison, image):
+    reference_file = f'{visual_comparison.reference_directory}failed.png'
+    cv2.imwrite(reference_file, image)
+    visual_comparison._take_screenshot = MagicMock(return_value=Image.fromarray(255 - image))
+
+    with pytest.raises(AssertionError):
+        visual_comparison.assert_screenshot('failed', '', '', None, 0, False, [], False, None)
+    artifact_writer.flush()
+
+    assert os.path.exists(f'{visual_comparison.output_directory}failed.png')
+    assert os.path.exists(f'{visual_comparison.diff_directory}diff_failed.png')
+
+    VisualComparison.soft_visual_reference_generation = True
+    visual_comparison.assert_screenshot('failed', '', '', None, 0, False, [], False, None)
+    artifact_writer.flush()
+
+    assert not os.path.exists(f'{visual_comparison.output_directory}failed.png')
+    assert (cv2.imread(reference_file) == reference_cache.get(reference_file)).all()
+    assert not (cv2.imread(reference_file) == image).all()
@@ -0,0 +1,126 @@
+import io
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import cv2
+import numpy
+import pytest
+from PIL import Image
+
+from mops.js_scripts import get_elements_rects_js, play_get_elements_rects_js
+from mops.mixins.objects.size import Size
+from mops.selenium.core.core_driver import CoreDriver
+from mops.selenium.core.core_element import CoreElement
+from mops.visual_comparison import VisualComparison
+
+
+@pytest.fixture
+def screenshot():
+    return numpy.random.default_rng(0).integers(0, 255, (200, 300, 3), dtype=numpy.uint8)
+
+
+@pytest.fixture
+def driver_wrapper(screenshot):
+    driver_wrapper = MagicMock(
+        is_android=False, is_ios=False, is_selenium=False, is_playwright=True,
+        is_mobile_resolution=False, browser_name='chromium',
+    )
+    driver_wrapper.screenshot_image.return_value = Image.fromarray(cv2.cvtColor(screenshot, cv2.COLOR_BGR2RGB))
+    driver_wrapper.get_inner_window_size.return_value = Size(width=150, height=100)
+    return driver_wrapper
+
+
+@pytest.fixture
+def visual_comparison(visual_settings, driver_wrapper):
+    return VisualComparison(driver_wrapper)
+
+
+def get_element(name, x, y, width, height):
+    element = MagicMock(locator=f'.{name}', locator_type='css selector', _element=None)
+    element.name, element.parent = name, None
+    element.get_rect.return_value = {'x': x, 'y': y, 'width': width, 'height': height}
+    return element
+
+
+def get_png(image: numpy.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(image).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def test_batch_comparison_single_capture(visual_comparison, driver_wrapper, screenshot):
+    elements = [
+        get_element('same', 10, 10, 40, 20),
+        get_element('changed', 60, 30, 50, 50),
+        get_element('hidden', 120, 90, 40, 40),
+    ]
+    driver_wrapper.driver.evaluate.return_value = [element.get_rect.return_value for element in elements]
+    reference_directory = visual_comparison.reference_directory
+    cv2.imwrite(f'{reference_directory}test_batch_same_playwright_chromium.png', screenshot[20:60, 20:100])
+    cv2.imwrite(f'{reference_directory}test_batch_changed_playwright_chromium.png', 255 - screenshot[60:160, 120:220])
+
+    with pytest.raises(AssertionError) as exc:
+        visual_comparison.assert_screenshots(elements, 'test_batch', '', None, 0, [])
+
+    assert 'found for 2 of 3 elements' in str(exc.value)
+    assert "'test_batch_changed_playwright_chromium'" in str(exc.value)
+    assert '"hidden" is not fully visible' in str(exc.value)
+    driver_wrapper.screenshot_image.assert_called_once()
+    driver_wrapper.driver.evaluate.assert_called_once()
+    assert driver_wrapper.driver.evaluate.call_args.args == (
+        play_get_elements_rects_js, [[{'by': 'css selector', 'value': f'.{element.name}'}] for element in elements]
+    )
+    assert not any(element.get_rect.called for element in elements)
+
+
+def test_batch_rects_fallback(visual_comparison, driver_wrapper):
+    found_element, missed_element = get_element('found', 1, 2, 3, 4), get_element('missed', 5, 6, 7, 8)
+    driver_wrapper.driver.evaluate.return_value = [{'x': 1, 'y': 2, 'width': 3, 'height': 4}, None]
+
+    rects = visual_comparison._get_elements_rects([found_element, missed_element])
+
+    assert rects == [found_element.get_rect.return_value, missed_element.get_rect.return_value]
+    found_element.get_rect.assert_not_called()
+    missed_element.get_rect.assert_called_once()
+
+
+def test_batch_crop_playwright_enclosing_rect(visual_comparison, driver_wrapper):
+    image = Image.new('RGB', (300, 200))
+
+    crop = visual_comparison._crop_element(image, None, {'x': 10.5, 'y': 20.2, 'width': 30.1, 'height': 10}, 2)
+
+    assert crop.size == (2 * (41 - 10), 2 * (31 - 20))
+
+
+@pytest.mark.parametrize('resample, device_pixel_ratio', [
+    (Image.Resampling.LANCZOS, 1), (Image.Resampling.BOX, 2), (Image.Resampling.LANCZOS, 2),
+])
+@pytest.mark.parametrize('rect', [
+    {'x': 10, 'y': 20, 'width': 40, 'height': 30},
+    {'x': 10.2, 'y': 19.6, 'width': 39.8, 'height': 30.4},
+])
+def test_batch_crop_matches_element_screenshot(visual_settings, resample, device_pixel_ratio, rect):
+    visual_settings.screenshot_resample = resample
+    size = (100 * device_pixel_ratio, 150 * device_pixel_ratio, 3)
+    device_screenshot = numpy.random.default_rng(0).integers(0, 255, size, dtype=numpy.uint8)
+    core_driver = CoreDriver.__new__(CoreDriver)
+    core_driver._device_pixel_ratio = device_pixel_ratio
+    driver_wrapper = MagicMock(is_playwright=False, is_appium=False)
+    driver_wrapper.driver.execute_script.return_value = [rect]
+    driver_wrapper.get_inner_window_size.return_value = Size(width=150, height=100)
+    visual_comparison = VisualComparison(driver_wrapper)
+    element = get_element('element', **rect)
+
+    viewport = CoreDriver.screenshot_image(core_driver, get_png(device_screenshot))
+    [batch_rect] = visual_comparison._get_elements_rects([element])
+    crop = visual_comparison._crop_element(viewport, element, batch_rect, viewport.size[0] / 150)
+
+    x, y, width, height = (round(rect[key]) * device_pixel_ratio for key in ('x', 'y', 'width', 'height'))
+    element_screenshot = CoreElement.screenshot_image(
+        SimpleNamespace(driver_wrapper=core_driver), get_png(device_screenshot[y:y + height, x:x + width])
+    )
+
+    assert driver_wrapper.driver.execute_script.call_args.args[0] == get_elements_rects_js
+    assert crop.size == element_screenshot.size
+    if resample == Image.Resampling.BOX or device_pixel_ratio == 1:
+        assert (numpy.asarray(crop) == numpy.asarray(element_screenshot)).all()
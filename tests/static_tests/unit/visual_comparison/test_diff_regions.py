@@ -0,0 +1,38 @@
+import cv2
+import numpy
+import pytest
+
+from mops.mixins.objects.diff_region import DiffRegion
+from mops.utils.visual_utils import get_diff_regions, fill_holes
+
+
+def get_contours_mask(diff_mask, min_contour_area):
+    image = numpy.zeros(diff_mask.shape, dtype=numpy.uint8)
+    for contour in cv2.findContours(diff_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)[-2]:
+        if not min_contour_area or cv2.contourArea(contour) > min_contour_area:
+            cv2.drawContours(image, [contour], 0, 255, -1)
+    return image > 0
+
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('min_contour_area', [0, 40])
+def test_diff_regions_match_filled_contours(seed, min_contour_area):
+    generator = numpy.random.default_rng(seed)
+    diff_mask = (generator.random((120, 160)) < 0.15).astype(numpy.uint8) * 255
+    diff_mask = cv2.dilate(diff_mask, numpy.ones((2, 2), dtype=numpy.uint8))
+
+    regions_mask, _ = get_diff_regions(diff_mask, min_contour_area)
+    assert (regions_mask == get_contours_mask(diff_mask, min_contour_area)).all()
+
+
+def test_diff_regions_statistics():
+    diff_mask = numpy.zeros((60, 80), dtype=numpy.uint8)
+    cv2.rectangle(diff_mask, (10, 10), (29, 29), 255, 1)
+    diff_mask[40:43, 60:63] = 255
+
+    regions_mask, regions = get_diff_regions(diff_mask, 40)
+
+    assert regions == [DiffRegion(x=10, y=10, width=20, height=20, area=400)]
+    assert regions_mask.sum() == 400
+    assert len(get_diff_regions(diff_mask)[1]) == 2
+    assert (fill_holes(diff_mask)[10:30, 10:30] == 255).all()
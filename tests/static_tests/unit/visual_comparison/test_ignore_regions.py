@@ -0,0 +1,99 @@
+from unittest.mock import MagicMock
+
+import cv2
+import numpy
+import pytest
+from PIL import Image
+
+from mops.js_scripts import get_visual_ignore_rects_js
+from mops.mixins.objects.box import Box
+from mops.mixins.objects.cut_box import CutBox
+from mops.visual_comparison import VisualComparison
+
+
+@pytest.fixture
+def image():
+    image = numpy.full((100, 200, 3), 240, dtype=numpy.uint8)
+    cv2.rectangle(image, (20, 20), (180, 80), (30, 60, 90), -1)
+    return image
+
+
+@pytest.fixture
+def visual_comparison(visual_settings):
+    return VisualComparison(MagicMock(), MagicMock())
+
+
+def assert_screenshot(visual_comparison, reference, actual, ignore):
+    visual_comparison._take_screenshot = MagicMock(
+        return_value=Image.fromarray(cv2.cvtColor(actual, cv2.COLOR_BGR2RGB))
+    )
+    cv2.imwrite(f'{visual_comparison.reference_directory}ignore.png', reference)
+    visual_comparison.assert_screenshot('ignore', '', '', 0.01, 0, False, [], False, None, ignore=ignore)
+
+
+def test_ignore_mask_boxes(visual_comparison):
+    cut_box = CutBox(top=10, right=5)
+    mask = visual_comparison._get_ignore_mask([Box(10.5, 20, 5, 10), cut_box], (100, 200), None)
+
+    expected = numpy.zeros((100, 200), dtype=bool)
+    expected[20:30, 10:16] = True
+    expected[:10] = True
+    expected[:, 195:] = True
+    assert (mask == expected).all()
+    assert cut_box.left is None
+    visual_comparison.driver_wrapper.execute_async_script.assert_not_called()
+
+
+def test_ignore_mask_elements_within_single_call(visual_comparison):
+    visual_comparison._screenshot_size = (200, 100)
+    execute_async_script = visual_comparison.driver_wrapper.execute_async_script
+    execute_async_script.return_value = {'origin': [10, 10, 100, 50], 'rects': [[20, 20, 10, 5], [100, 10, 50, 50]]}
+    elements = [MagicMock(), MagicMock()]
+
+    mask = visual_comparison._get_ignore_mask(elements, (90, 190), CutBox(10, 10))
+
+    execute_async_script.assert_called_once_with(
+        get_visual_ignore_rects_js, visual_comparison.element_wrapper, elements, False
+    )
+    expected = numpy.zeros((90, 190), dtype=bool)
+    expected[10:20, 10:30] = True
+    expected[:, 170:] = True
+    assert (mask == expected).all()
+
+
+def test_ignored_difference_passes(visual_comparison, image):
+    actual = image.copy()
+    actual[30:50, 40:80] = 0
+
+    with pytest.raises(AssertionError):
+        assert_screenshot(visual_comparison, image, actual, None)
+
+    assert_screenshot(visual_comparison, image, actual, [Box(35, 25, 50, 30)])
+    assert visual_comparison.ignore_mask.sum() == 50 * 30
+
+
+def test_ignored_pixels_excluded_from_score(visual_comparison, image):
+    actual = image.copy()
+    actual[30:35, 40:45] = 0
+
+    visual_comparison.ignore_mask = None
+    percent = visual_comparison._get_difference(image, actual, 0)[1]
+
+    visual_comparison.ignore_mask = numpy.zeros(image.shape[:2], dtype=bool)
+    visual_comparison.ignore_mask[:, 100:] = True
+    ignored_percent = visual_comparison._get_difference(image, actual, 0)[1]
+
+    assert ignored_percent == pytest.approx(percent * (94 * 194) / (94 * 97))
+
+
+def test_ignored_pixels_excluded_from_threshold(tmp_path, image):
+    reference_file = str(tmp_path / 'reference.png')
+    cv2.imwrite(reference_file, image)
+    ignore_mask = numpy.zeros(image.shape[:2], dtype=bool)
+    ignore_mask[:, 100:] = True
+
+    threshold = VisualComparison.calculate_threshold(reference_file, 10)[0]
+    ignored_threshold, additional_data = VisualComparison.calculate_threshold(reference_file, 10, ignore_mask)
+
+    assert ignored_threshold == pytest.approx(threshold * 2 ** 0.5)
+    assert 'from 10000' in additional_data
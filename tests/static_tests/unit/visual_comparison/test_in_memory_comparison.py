@@ -0,0 +1,62 @@
+import os
+from unittest.mock import MagicMock
+
+import cv2
+import numpy
+import pytest
+from PIL import Image
+
+from mops.utils.visual_utils import get_image_array
+from mops.visual_comparison import VisualComparison
+
+
+@pytest.fixture
+def image():
+    image = numpy.full((60, 80, 3), 255, dtype=numpy.uint8)
+    image[10:50, 10:70] = (40, 120, 200)
+    return image
+
+
+def pil_image(image):
+    return Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+
+
+@pytest.mark.parametrize('mode', ['RGBA', 'RGB', 'L'])
+def test_image_array_matches_decoded_file(tmp_path, image, mode):
+    file = str(tmp_path / 'image.png')
+    converted_image = pil_image(image).convert(mode)
+    converted_image.save(file)
+    assert (get_image_array(converted_image) == cv2.imread(file)).all()
+
+
+def test_passed_comparison_writes_nothing(visual_comparison, image):
+    changed_image = image.copy()
+    changed_image[0, 0] = 0
+    cv2.imwrite(f'{visual_comparison.reference_directory}passed.png', image)
+    visual_comparison._take_screenshot = MagicMock(return_value=pil_image(changed_image))
+
+    visual_comparison.assert_screenshot('passed', '', '', 5, 0, False, [], False, None)
+
+    assert not os.listdir(visual_comparison.output_directory)
+    assert not os.listdir(visual_comparison.diff_directory)
+
+
+def test_passed_comparison_keeps_artifacts(visual_comparison, image):
+    VisualComparison.keep_passed_artifacts = True
+    cv2.imwrite(f'{visual_comparison.reference_directory}kept.png', image)
+    visual_comparison._take_screenshot = MagicMock(return_value=pil_image(image))
+
+    visual_comparison.assert_screenshot('kept', '', '', None, 0, False, [], False, None)
+
+    assert os.listdir(visual_comparison.output_directory) == ['kept.png']
+
+
+def test_failed_comparison_writes_artifacts(visual_comparison, image):
+    cv2.imwrite(f'{visual_comparison.reference_directory}failed.png', image)
+    visual_comparison._take_screenshot = MagicMock(return_value=pil_image(255 - image))
+
+    with pytest.raises(AssertionError):
+        visual_comparison.assert_screenshot('failed', '', '', None, 0, False, [], False, None)
+
+    assert (cv2.imread(f'{visual_comparison.output_directory}failed.png') == 255 - image).all()
+    assert os.path.exists(f'{visual_comparison.diff_directory}diff_failed.png')
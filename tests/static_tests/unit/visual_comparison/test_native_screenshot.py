@@ -0,0 +1,68 @@
+import io
+from unittest.mock import MagicMock
+
+import pytest
+from PIL import Image
+
+from mops.js_scripts import add_visual_mask_js
+from mops.mixins.objects.cut_box import CutBox
+from mops.visual_comparison import VisualComparison
+
+
+def get_png(size=(30, 20)):
+    buffer = io.BytesIO()
+    Image.new('RGB', size, (10, 20, 30)).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def driver_wrapper(visual_settings):
+    driver_wrapper = MagicMock(is_playwright=True, anchor=None)
+    driver_wrapper.driver.screenshot.return_value = get_png()
+    driver_wrapper.execute_async_script.return_value = []
+    return driver_wrapper
+
+
+def test_native_page_screenshot(driver_wrapper):
+    remove = [MagicMock(), MagicMock()]
+
+    image = VisualComparison(driver_wrapper)._take_screenshot(
+        delay=0, remove=remove, fill_background=False, cut_box=CutBox(5, 5)
+    )
+
+    driver_wrapper.driver.screenshot.assert_called_once_with(
+        animations='disabled', caret='hide', scale='device',
+        mask=[element.element for element in remove], mask_color='#000',
+    )
+    driver_wrapper.execute_async_script.assert_not_called()
+    driver_wrapper.screenshot_image.assert_not_called()
+    assert image.size == (25, 15)
+
+
+def test_native_element_screenshot(driver_wrapper):
+    element = MagicMock()
+    element.element.first.screenshot.return_value = get_png((10, 10))
+
+    image = VisualComparison(driver_wrapper, element)._take_screenshot(
+        delay=0, remove=[], fill_background='red', cut_box=None
+    )
+
+    element.element.first.screenshot.assert_called_once_with(animations='disabled', caret='hide', scale='device')
+    driver_wrapper.execute_async_script.assert_called_once_with(
+        add_visual_mask_js, [], element.wait_visibility.return_value, 'red'
+    )
+    element.screenshot_image.assert_not_called()
+    assert image.size == (10, 10)
+
+
+def test_native_screenshot_disabled(driver_wrapper):
+    VisualComparison.native_screenshot = False
+    driver_wrapper.screenshot_image.return_value = Image.new('RGB', (30, 20))
+
+    try:
+        VisualComparison(driver_wrapper)._take_screenshot(delay=0, remove=[], fill_background=False, cut_box=None)
+    finally:
+        VisualComparison.native_screenshot = True
+
+    driver_wrapper.screenshot_image.assert_called_once()
+    driver_wrapper.driver.screenshot.assert_not_called()
@@ -0,0 +1,136 @@
+import os
+
+import cv2
+import numpy
+import pytest
+
+from mops.utils.reference_storage import ReferenceCache, get_raw_image_path, read_raw_image
+from mops.visual_comparison import VisualComparison
+
+
+@pytest.fixture
+def image():
+    return numpy.random.default_rng(0).integers(0, 255, (40, 60, 3), dtype=numpy.uint8)
+
+
+@pytest.fixture
+def files(tmp_path, image):
+    paths = []
+    for index in range(3):
+        path = str(tmp_path / f'reference_{index}.png')
+        cv2.imwrite(path, image)
+        paths.append(path)
+    return paths
+
+
+def test_reference_cache_hit(files, image):
+    cache = ReferenceCache()
+    first, second = cache.get(files[0]), cache.get(files[0])
+
+    assert first is second
+    assert (first == image).all()
+    assert not first.flags.writeable
+    assert cache.stats == {'hits': 1, 'misses': 1, 'evictions': 0, 'entries': 1, 'bytes': image.nbytes}
+
+
+def test_reference_cache_outdated_entry(files, image):
+    cache = ReferenceCache()
+    cache.get(files[0])
+
+    cv2.imwrite(files[0], 255 - image)
+    os.utime(files[0], ns=(0, 0))
+
+    assert (cache.get(files[0]) == 255 - image).all()
+    assert cache.misses == 2
+    assert cache.size == image.nbytes
+
+
+def test_reference_cache_lru_eviction(files, image):
+    cache = ReferenceCache(max_bytes=image.nbytes * 2)
+    cache.get(files[0])
+    cache.get(files[1])
+    cache.get(files[0])
+    cache.get(files[2])
+
+    assert cache.evictions == 1
+    assert cache.size == image.nbytes * 2
+
+    cache.get(files[0])
+    cache.get(files[1])
+    assert cache.stats['hits'] == 2
+    assert cache.stats['misses'] == 4
+
+
+def test_reference_cache_oversized_image(files, image):
+    cache = ReferenceCache(max_bytes=image.nbytes - 1)
+
+    assert (cache.get(files[0]) == image).all()
+    assert cache.stats['entries'] == 0
+
+
+def test_reference_cache_missed_file(tmp_path, files):
+    cache = ReferenceCache()
+    cache.get(files[0])
+    os.remove(files[0])
+
+    assert cache.get(files[0]) is None
+    assert cache.get(str(tmp_path / 'missed.png')) is None
+    assert cache.size == 0
+
+
+def test_reference_cache_log_stats(caplog, files):
+    cache = ReferenceCache()
+    cache.log_stats()
+    assert caplog.messages == []
+
+    cache.get(files[0])
+    cache.log_stats()
+    assert caplog.messages[-1].startswith('Reference cache: hits=0, misses=1, evictions=0, entries=1')
+
+
+def test_calculate_threshold_missed_reference(tmp_path):
+    with pytest.raises(FileNotFoundError, match='missed.png'):
+        VisualComparison.calculate_threshold(str(tmp_path / 'missed.png'), 10)
+
+
+def test_reference_raw_cache_written_and_loaded(files, image):
+    ReferenceCache(use_raw_cache=True).get(files[0])
+    raw_file = get_raw_image_path(files[0], os.stat(files[0]).st_size)
+
+    assert os.stat(raw_file).st_mtime_ns == os.stat(files[0]).st_mtime_ns
+
+    loaded = ReferenceCache(use_raw_cache=True).get(files[0])
+    assert isinstance(loaded, numpy.memmap)
+    assert not loaded.flags.writeable
+    assert (loaded == image).all()
+
+
+def test_reference_raw_cache_outdated(files, image):
+    ReferenceCache(use_raw_cache=True).get(files[0])
+
+    cv2.imwrite(files[0], 255 - image)
+    os.utime(files[0], ns=(0, 0))
+
+    assert read_raw_image(files[0]) is None
+    assert (ReferenceCache(use_raw_cache=True).get(files[0]) == 255 - image).all()
+    assert (read_raw_image(files[0]) == 255 - image).all()
+
+
+def test_reference_raw_cache_disabled(files):
+    ReferenceCache().get(files[0])
+
+    assert not os.path.exists(get_raw_image_path(files[0], os.stat(files[0]).st_size))
+
+
+def test_reference_raw_cache_replaced_with_same_mtime(files, image):
+    ReferenceCache(use_raw_cache=True).get(files[0])
+    outdated_raw_file = get_raw_image_path(files[0], os.stat(files[0]).st_size)
+    mtime_ns = os.stat(files[0]).st_mtime_ns
+
+    cv2.imwrite(files[0], image[:20])
+    os.utime(files[0], ns=(mtime_ns, mtime_ns))
+
+    assert read_raw_image(files[0]) is None
+    assert (ReferenceCache(use_raw_cache=True).get(files[0]) == image[:20]).all()
+    assert (read_raw_image(files[0]) == image[:20]).all()
+    assert not os.path.exists(outdated_raw_file)
@@ -0,0 +1,77 @@
+import json
+import os
+from unittest.mock import MagicMock
+
+import cv2
+import numpy
+import pytest
+from PIL import Image
+
+from mops.utils.reference_generation import flush_reference_generation
+from mops.visual_comparison import VisualComparison
+
+
+@pytest.fixture
+def image():
+    image = numpy.full((60, 80, 3), 255, dtype=numpy.uint8)
+    image[10:50, 10:70] = (40, 120, 200)
+    return image
+
+
+@pytest.fixture
+def visual_comparison(visual_settings):
+    visual_settings.parallel_reference_generation = True
+    return VisualComparison(None, None)
+
+
+def generate(visual_comparison, name, image):
+    visual_comparison._take_screenshot = MagicMock(
+        return_value=Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+    )
+    visual_comparison.assert_screenshot(name, '', '', 5, 0, False, [], False, None)
+
+
+def get_manifest(visual_comparison):
+    with open(f'{visual_comparison.reference_directory}.mops_generation_manifest.json') as manifest_file:
+        return json.load(manifest_file)
+
+
+@pytest.mark.parametrize('mode', ['hard', 'soft'])
+def test_parallel_reference_generation(visual_comparison, image, mode):
+    setattr(VisualComparison, f'{mode}_visual_reference_generation', True)
+    slightly_changed, changed = image.copy(), 255 - image
+    slightly_changed[0, 0] = 0
+
+    for name in ('unchanged', 'slightly_changed', 'changed'):
+        cv2.imwrite(f'{visual_comparison.reference_directory}{name}.png', image)
+
+    generate(visual_comparison, 'created', image)
+    generate(visual_comparison, 'unchanged', image)
+    generate(visual_comparison, 'slightly_changed', slightly_changed)
+    generate(visual_comparison, 'changed', changed)
+    flush_reference_generation()
+
+    assert get_manifest(visual_comparison) == {
+        'created.png': 'created',
+        'unchanged.png': 'unchanged',
+        'slightly_changed.png': 'changed' if mode == 'hard' else 'unchanged',
+        'changed.png': 'changed',
+    }
+    assert (cv2.imread(f'{visual_comparison.reference_directory}created.png') == image).all()
+    assert (cv2.imread(f'{visual_comparison.reference_directory}changed.png') == changed).all()
+    assert not os.listdir(visual_comparison.output_directory)
+
+
+def test_parallel_reference_generation_disabled(visual_comparison, image):
+    VisualComparison.parallel_reference_generation = False
+    VisualComparison.hard_visual_reference_generation = True
+    visual_comparison.driver_wrapper = MagicMock()
+    visual_comparison._desired_object.save_screenshot.side_effect = lambda name, screenshot_base: (
+        screenshot_base.save(name)
+    )
+
+    generate(visual_comparison, 'created', image)
+    flush_reference_generation()
+
+    assert os.path.exists(f'{visual_comparison.reference_directory}created.png')
+    assert not os.path.exists(f'{visual_comparison.reference_directory}.mops_generation_manifest.json')
@@ -0,0 +1,77 @@
+import os
+from unittest.mock import MagicMock
+
+import cv2
+import numpy
+import pytest
+from PIL import Image
+
+from mops.utils.reference_storage import ReferenceIndex, get_image_digest
+
+
+@pytest.fixture
+def image():
+    return numpy.random.default_rng(0).integers(0, 255, (40, 60, 3), dtype=numpy.uint8)
+
+
+def take_screenshot_mock(image):
+    return MagicMock(return_value=Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB)))
+
+
+def test_reference_index_rebuilds_outdated_entry(tmp_path, image):
+    reference_file = str(tmp_path / 'reference.png')
+    cv2.imwrite(reference_file, image)
+    index = ReferenceIndex(str(tmp_path))
+
+    assert index.get_digest(reference_file) == get_image_digest(image)
+
+    changed_image = 255 - image
+    cv2.imwrite(reference_file, changed_image)
+    os.utime(reference_file, (0, 0))
+    assert index.get_digest(reference_file) == get_image_digest(changed_image)
+
+    index.save()
+    assert ReferenceIndex(str(tmp_path)).entries == index.entries
+
+
+def test_reference_index_removed_entry_not_restored(tmp_path, image):
+    reference_file, other_file = str(tmp_path / 'reference.png'), str(tmp_path / 'other.png')
+    cv2.imwrite(reference_file, image)
+    cv2.imwrite(other_file, image)
+    first_index = ReferenceIndex(str(tmp_path))
+    first_index.get_digest(reference_file)
+    first_index.save()
+
+    index, other_index = ReferenceIndex(str(tmp_path)), ReferenceIndex(str(tmp_path))
+    other_index.get_digest(other_file)
+    other_index.save()
+    os.remove(reference_file)
+    assert index.update(reference_file) is None
+    index.save()
+
+    assert ReferenceIndex(str(tmp_path)).entries.keys() == {'other.png'}
+
+
+def test_reference_index_missed_reference(tmp_path):
+    assert ReferenceIndex(str(tmp_path)).get_digest(str(tmp_path / 'missed.png')) is None
+
+
+def test_exact_match_skips_comparison(visual_comparison, image):
+    visual_comparison._take_screenshot = take_screenshot_mock(image)
+    visual_comparison._assert_same_images = MagicMock()
+    cv2.imwrite(f'{visual_comparison.reference_directory}same.png', image)
+
+    visual_comparison.assert_screenshot('same', '', '', None, 0, False, [], False, None)
+
+    visual_comparison._assert_same_images.assert_not_called()
+    assert not os.listdir(visual_comparison.output_directory)
+
+
+def test_different_images_compared(visual_comparison, image):
+    visual_comparison._take_screenshot = take_screenshot_mock(255 - image)
+    visual_comparison._assert_same_images = MagicMock()
+    cv2.imwrite(f'{visual_comparison.reference_directory}different.png', image)
+
+    visual_comparison.assert_screenshot('different', '', '', None, 0, False, [], False, None)
+
+    visual_comparison._assert_same_images.assert_called_once()
@@ -0,0 +1,81 @@
+import os
+import hashlib
+from unittest.mock import patch
+
+import cv2
+import numpy
+import pytest
+
+from mops.utils.reference_library import ReferenceLibrary, get_perceptual_hash
+from mops.utils.reference_storage import get_image_digest, get_reference_index, reference_cache
+
+
+@pytest.fixture
+def images():
+    generator = numpy.random.default_rng(0)
+    return [cv2.resize(generator.integers(0, 255, (8, 8, 3), dtype=numpy.uint8), (160, 120)) for _ in range(3)]
+
+
+@pytest.fixture
+def reference_directory(tmp_path, images):
+    directory = tmp_path / 'reference'
+    (directory / 'chrome').mkdir(parents=True)
+    cv2.imwrite(str(directory / 'first.png'), images[0])
+    cv2.imwrite(str(directory / 'chrome' / 'first.png'), images[0])
+    cv2.imwrite(str(directory / 'second.png'), images[1])
+    return str(directory)
+
+
+def test_reference_library_deduplication(tmp_path, reference_directory):
+    library = ReferenceLibrary(str(tmp_path / 'library'))
+
+    assert library.add_directory(reference_directory) == 3
+    assert library.blobs_count == 2
+    assert library.entries['first.png'] == library.entries[os.path.join('chrome', 'first.png')]
+
+    library.save()
+    assert ReferenceLibrary(str(tmp_path / 'library')).entries == library.entries
+
+
+def test_reference_library_restore(tmp_path, reference_directory, images):
+    library = ReferenceLibrary(str(tmp_path / 'library'))
+    library.add_directory(reference_directory)
+    restored_directory = str(tmp_path / 'restored')
+
+    assert library.restore(restored_directory) == 3
+
+    restored_file = os.path.join(restored_directory, 'chrome', 'first.png')
+    assert (cv2.imread(restored_file) == images[0]).all()
+    with patch.object(reference_cache, 'get') as decoding:
+        assert get_reference_index(restored_directory).get_digest(restored_file) == get_image_digest(images[0])
+        decoding.assert_not_called()
+
+
+def test_reference_library_restored_reference_rewrite(tmp_path, reference_directory, images):
+    library = ReferenceLibrary(str(tmp_path / 'library'))
+    library.add_directory(reference_directory)
+    restored_directory = str(tmp_path / 'restored')
+    library.restore(restored_directory)
+
+    cv2.imwrite(os.path.join(restored_directory, 'first.png'), images[2])
+
+    blob_path = library.get_blob_path(library.entries['first.png']['blob'])
+    with open(blob_path, 'rb') as blob_file:
+        assert hashlib.sha256(blob_file.read()).hexdigest() == library.entries['first.png']['blob']
+    assert (cv2.imread(os.path.join(restored_directory, 'chrome', 'first.png')) == images[0]).all()
+
+
+def test_reference_library_find_nearest(tmp_path, reference_directory, images):
+    library = ReferenceLibrary(str(tmp_path / 'library'))
+    library.add_directory(reference_directory)
+
+    changed_image = images[1].copy()
+    changed_image[:4, :4] = 0
+
+    assert library.find_nearest(changed_image, max_distance=4) == [('second.png', 0)]
+    assert len(library.find_nearest(images[2], count=5)) == 3
+    assert library.find_nearest(images[2], max_distance=0) == []
+
+
+def test_perceptual_hash_of_grayscale_image(images):
+    assert get_perceptual_hash(images[0]) == get_perceptual_hash(cv2.cvtColor(images[0], cv2.COLOR_BGR2GRAY))
@@ -0,0 +1,117 @@
+import io
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy
+import pytest
+from PIL import Image
+
+from mops.selenium.core.core_driver import CoreDriver
+from mops.selenium.core.core_element import CoreElement
+from mops.selenium.driver.mobile_driver import MobileDriver
+from mops.shared_utils import _scaled_screenshot
+
+
+@pytest.fixture
+def screenshot():
+    image = numpy.random.default_rng(0).integers(0, 255, (101, 203, 3), dtype=numpy.uint8)
+    buffer = io.BytesIO()
+    Image.fromarray(image).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def test_scaled_screenshot_by_width(screenshot):
+    image = _scaled_screenshot(screenshot, 100)
+    expected = Image.open(io.BytesIO(screenshot)).resize((100, 49), Image.Resampling.LANCZOS)
+
+    assert (numpy.asarray(image) == numpy.asarray(expected)).all()
+
+
+def test_scaled_screenshot_without_scale(screenshot):
+    assert _scaled_screenshot(screenshot, scale=1).size == (203, 101)
+
+
+def test_scaled_screenshot_integer_reduce(screenshot):
+    image = _scaled_screenshot(screenshot, scale=2, resample=Image.Resampling.BOX)
+    expected = Image.open(io.BytesIO(screenshot)).crop((0, 0, 202, 100)).resize((101, 50), Image.Resampling.BOX)
+
+    assert image.size == (101, 50)
+    assert numpy.abs(numpy.asarray(image, dtype=int) - numpy.asarray(expected)).max() <= 1
+
+
+def get_core_driver(device_pixel_ratio, inner_width: int = 100) -> CoreDriver:
+    core_driver = CoreDriver.__new__(CoreDriver)
+    core_driver.driver = MagicMock()
+    core_driver._device_pixel_ratio = None
+    core_driver.execute_script = MagicMock(return_value=device_pixel_ratio)
+    core_driver.get_inner_window_size = MagicMock(return_value=SimpleNamespace(width=inner_width))
+    return core_driver
+
+
+def get_screenshot(width: int, height: int) -> bytes:
+    buffer = io.BytesIO()
+    Image.new('RGB', (width, height)).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def test_device_pixel_ratio_cached():
+    core_driver = get_core_driver(2)
+
+    for _ in range(3):
+        image = CoreDriver.screenshot_image(core_driver, get_screenshot(202, 100))
+
+    assert image.size == (101, 50)
+    core_driver.execute_script.assert_called_once()
+    core_driver.get_inner_window_size.assert_not_called()
+
+
+@pytest.mark.parametrize('device_pixel_ratio', [2.75, None])
+def test_screenshot_scaled_to_window_width(device_pixel_ratio):
+    core_driver = get_core_driver(device_pixel_ratio, inner_width=393)
+
+    image = CoreDriver.screenshot_image(core_driver, get_screenshot(1080, 2340))
+
+    assert image.size[0] == 393
+    core_driver.get_inner_window_size.assert_called_once()
+
+
+def test_device_pixel_ratio_stale():
+    core_driver = get_core_driver(2, inner_width=100)
+    CoreDriver.screenshot_image(core_driver, get_screenshot(200, 100))
+
+    image = CoreDriver.screenshot_image(core_driver, get_screenshot(251, 125))
+
+    assert image.size == (100, 49)
+    assert core_driver._device_pixel_ratio is None
+
+
+@pytest.mark.parametrize('method', [MobileDriver.switch_to_web, MobileDriver.switch_to_native])
+def test_viewport_cache_reset_on_context_switch(method):
+    mobile_driver = MobileDriver.__new__(MobileDriver)
+    mobile_driver.driver = MagicMock()
+    mobile_driver.web_context_name, mobile_driver.native_context_name = 'WEBVIEW_1', 'NATIVE_APP'
+    mobile_driver._inner_window_size, mobile_driver._device_pixel_ratio = SimpleNamespace(width=100), 3
+
+    method(mobile_driver)
+
+    assert (mobile_driver._inner_window_size, mobile_driver._device_pixel_ratio) == (None, None)
+
+
+def test_element_screenshot_scaled_by_device_pixel_ratio():
+    core_driver = get_core_driver(2)
+    element = MagicMock(driver_wrapper=core_driver)
+
+    image = CoreElement.screenshot_image(element, get_screenshot(120, 60))
+
+    assert image.size == (60, 30)
+    assert not element.mock_calls
+
+
+def test_element_screenshot_scaled_to_element_width():
+    core_driver = get_core_driver(2.75)
+    element = MagicMock(driver_wrapper=core_driver, size=SimpleNamespace(width=40))
+
+    image = CoreElement.screenshot_image(element, get_screenshot(110, 55))
+
+    assert image.size == (40, 20)
+    core_driver.get_inner_window_size.assert_not_called()
@@ -0,0 +1,120 @@
+from unittest.mock import MagicMock
+
+import numpy
+import pytest
+from PIL import Image
+
+from mops.selenium.core.core_driver import CoreDriver
+from mops.utils.screenshot_stitcher import ScreenshotStitcher, get_equal_rows_count, get_rows_hashes
+
+
+WIDTH, VIEWPORT_HEIGHT, PAGE_HEIGHT = 60, 100, 430
+HEADER_HEIGHT, FOOTER_HEIGHT = 10, 7
+
+
+@pytest.fixture
+def page():
+    return numpy.random.default_rng(0).integers(0, 255, (PAGE_HEIGHT, WIDTH, 3), dtype=numpy.uint8)
+
+
+def get_frame(page, scroll_y, sticky=True):
+    frame = page[scroll_y:scroll_y + VIEWPORT_HEIGHT].copy()
+    if sticky:
+        frame[:HEADER_HEIGHT] = 50
+        frame[-FOOTER_HEIGHT:] = 200
+    return frame
+
+
+def get_expected_page(page):
+    expected = page.copy()
+    expected[:HEADER_HEIGHT] = 50
+    expected[-FOOTER_HEIGHT:] = 200
+    return expected
+
+
+def test_rows_hashes_and_equal_rows():
+    image = numpy.zeros((5, 4, 3), dtype=numpy.uint8)
+    changed = image.copy()
+    changed[2, 1, 0] = 1
+    hashes, changed_hashes = get_rows_hashes(image), get_rows_hashes(changed)
+
+    assert hashes.dtype == numpy.uint64
+    assert get_equal_rows_count(hashes, changed_hashes) == 2
+    assert get_equal_rows_count(hashes, changed_hashes, reverse=True) == 2
+    assert get_equal_rows_count(hashes, hashes) == 5
+
+
+def test_stitch_without_sticky_elements(page):
+    stitcher = ScreenshotStitcher(WIDTH, PAGE_HEIGHT)
+    scroll_y, max_scroll = 0, PAGE_HEIGHT - VIEWPORT_HEIGHT
+
+    while True:
+        is_last = scroll_y >= max_scroll
+        stitcher.add(get_frame(page, scroll_y, sticky=False), scroll_y, is_last=is_last)
+        if is_last:
+            break
+        scroll_y = min(scroll_y + stitcher.get_step(VIEWPORT_HEIGHT), max_scroll)
+
+    assert (stitcher.image == page).all()
+    assert stitcher.header_height == stitcher.footer_height == 0
+
+
+def test_stitch_with_sticky_header_and_footer(page):
+    stitcher = ScreenshotStitcher(WIDTH, PAGE_HEIGHT)
+    scroll_y, max_scroll = 0, PAGE_HEIGHT - VIEWPORT_HEIGHT
+
+    while True:
+        is_last = scroll_y >= max_scroll
+        stitcher.add(get_frame(page, scroll_y), scroll_y, is_last=is_last)
+        if is_last:
+            break
+        scroll_y = min(scroll_y + stitcher.get_step(VIEWPORT_HEIGHT), max_scroll)
+
+    assert (stitcher.header_height, stitcher.footer_height) == (HEADER_HEIGHT, FOOTER_HEIGHT)
+    assert (stitcher.image == get_expected_page(page)).all()
+
+
+def test_stitch_refines_inaccurate_offset(page):
+    stitcher = ScreenshotStitcher(WIDTH, PAGE_HEIGHT)
+
+    stitcher.add(get_frame(page, 0, sticky=False), 0)
+    assert stitcher.add(get_frame(page, 72, sticky=False), 70) == 72
+
+
+def test_core_driver_full_page_screenshot(page):
+    expected = get_expected_page(page)
+    state = {'scroll_y': 0}
+
+    def execute_async_script(script, scroll_x, scroll_y):
+        state['scroll_y'] = min(int(scroll_y), PAGE_HEIGHT - VIEWPORT_HEIGHT)
+        return state['scroll_y']
+
+    def screenshot_image():
+        return Image.fromarray(get_frame(page, state['scroll_y']))
+
+    core_driver = MagicMock()
+    core_driver.execute_script.side_effect = [
+        dict(scrollHeight=PAGE_HEIGHT, innerWidth=WIDTH, innerHeight=VIEWPORT_HEIGHT, scrollX=0, scrollY=25), None,
+    ]
+    core_driver.execute_async_script.side_effect = execute_async_script
+    core_driver.screenshot_image.side_effect = screenshot_image
+
+    image = CoreDriver.full_page_screenshot_image(core_driver)
+
+    assert (numpy.asarray(image) == expected).all()
+    assert core_driver.execute_async_script.call_count <= 6
+    core_driver.execute_script.assert_called_with('window.scrollTo(arguments[0], arguments[1]);', 0, 25)
+
+
+def test_core_driver_full_page_screenshot_restores_scroll_on_error():
+    core_driver = MagicMock()
+    core_driver.execute_script.side_effect = [
+        dict(scrollHeight=PAGE_HEIGHT, innerWidth=WIDTH, innerHeight=VIEWPORT_HEIGHT, scrollX=3, scrollY=4), None,
+    ]
+    core_driver.screenshot_image.side_effect = RuntimeError('no screenshot')
+
+    with pytest.raises(RuntimeError):
+        CoreDriver.full_page_screenshot_image(core_driver)
+
+    core_driver.execute_script.assert_called_with('window.scrollTo(arguments[0], arguments[1]);', 3, 4)
+
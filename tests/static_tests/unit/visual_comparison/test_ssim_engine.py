@@ -0,0 +1,55 @@
+import numpy
+import pytest
+from skimage.metrics import structural_similarity
+
+from mops.utils.visual_utils import (
+    SSIM_TILE_HEIGHT,
+    SSIM_WINDOW,
+    get_ssim_executor,
+    get_ssim_tiles,
+    shutdown_ssim_executor,
+    structural_similarity_full,
+)
+
+
+@pytest.fixture(scope='module')
+def images():
+    generator = numpy.random.default_rng(0)
+    reference = generator.integers(0, 255, (SSIM_TILE_HEIGHT * 3 + 100, 300), dtype=numpy.uint8)
+    actual = reference.copy()
+    actual[SSIM_TILE_HEIGHT - 20:SSIM_TILE_HEIGHT + 20, 50:150] = 0
+    return reference, actual
+
+
+@pytest.mark.parametrize('engine', ['threads', 'processes'])
+def test_tiled_ssim_matches_default(images, engine):
+    reference, actual = images
+    expected_score, expected_map = structural_similarity(reference, actual, full=True)
+    score, ssim_map = structural_similarity_full(reference, actual, engine=engine, workers=2)
+    assert ssim_map.shape == expected_map.shape
+    assert numpy.allclose(ssim_map, expected_map, rtol=0, atol=1e-9)
+    assert abs(score - expected_score) < 1e-9
+
+
+def test_ssim_tiles_last_tile_merged():
+    tiles = get_ssim_tiles(SSIM_TILE_HEIGHT * 2 + SSIM_WINDOW - 1)
+    assert tiles == [(0, SSIM_TILE_HEIGHT), (SSIM_TILE_HEIGHT, SSIM_TILE_HEIGHT * 2 + SSIM_WINDOW - 1)]
+
+
+def test_unexpected_ssim_engine(images):
+    with pytest.raises(ValueError):
+        structural_similarity_full(*images, engine='gpu')
+
+
+def test_ssim_executor_replaced_and_shut_down():
+    executor = get_ssim_executor('threads', 2)
+    assert get_ssim_executor('threads', 2) is executor
+
+    other_executor = get_ssim_executor('threads', 3)
+    assert other_executor is not executor
+    with pytest.raises(RuntimeError):
+        executor.submit(int)
+
+    shutdown_ssim_executor()
+    with pytest.raises(RuntimeError):
+        other_executor.submit(int)
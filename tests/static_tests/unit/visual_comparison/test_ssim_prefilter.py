@@ -0,0 +1,98 @@
+import numpy
+import pytest
+from skimage.metrics import structural_similarity
+
+from mops.utils.visual_utils import (
+    structural_similarity_regions,
+    get_changed_mask,
+    get_changed_regions,
+    get_ssim_difference_bound,
+    get_ssim_map_image,
+    merge_regions,
+)
+from mops.visual_comparison import VisualComparison
+
+
+@pytest.fixture(scope='module')
+def reference():
+    return numpy.random.default_rng(0).integers(0, 255, (700, 500), dtype=numpy.uint8)
+
+
+def change(image, *boxes):
+    image = image.copy()
+    for start_x, start_y, end_x, end_y in boxes:
+        image[start_y:end_y, start_x:end_x] = 255 - image[start_y:end_y, start_x:end_x]
+    return image
+
+
+@pytest.mark.parametrize('boxes', [
+    [(100, 100, 105, 103)],
+    [(0, 0, 2, 2), (495, 690, 500, 700)],
+    [(60, 300, 70, 330), (90, 310, 120, 320), (400, 31, 401, 33)],
+    [(0, 0, 500, 500)],
+])
+def test_regions_ssim_matches_full(reference, boxes):
+    actual = change(reference, *boxes)
+    expected_score, expected_map = structural_similarity(reference, actual, full=True)
+    score, ssim_map = structural_similarity_regions(reference, actual, get_changed_mask(reference, actual))
+
+    assert abs(score - expected_score) < 1e-9
+    assert (numpy.abs(ssim_map.astype(int) - get_ssim_map_image(expected_map)) <= 1).all()
+    assert (ssim_map[get_ssim_map_image(expected_map) == 255] == 255).all()
+
+
+def test_changed_regions_merged(reference):
+    actual = change(reference, (60, 300, 70, 330), (90, 310, 120, 320), (400, 31, 401, 33))
+    regions = get_changed_regions(get_changed_mask(reference, actual))
+    assert sorted(regions) == [(29, 285, 131, 355), (381, 0, 419, 67)]
+    assert merge_regions([(0, 0, 10, 10), (20, 0, 30, 10), (5, 5, 25, 8)]) == [(0, 0, 30, 10)]
+
+
+def test_difference_bound(reference):
+    actual = change(reference, (100, 100, 105, 103))
+    expected_score = structural_similarity(reference, actual)
+    bound = get_ssim_difference_bound(get_changed_mask(reference, actual))
+
+    assert bound == 200 * 11 * 9 / (694 * 494)
+    assert 100 - expected_score * 100 <= bound
+    assert get_ssim_difference_bound(get_changed_mask(reference, reference)) == 0
+
+
+def test_prefilter_skips_ssim_within_threshold(reference):
+    actual = numpy.dstack([change(reference, (100, 100, 105, 103))] * 3)
+    visual_comparison = VisualComparison.__new__(VisualComparison)
+    visual_comparison.ignore_mask = None
+
+    diff, percent = visual_comparison._get_difference(numpy.dstack([reference] * 3), actual, 0.1)
+    assert percent == get_ssim_difference_bound(get_changed_mask(reference, actual[:, :, 0]))
+    assert (diff == actual).all()
+
+    diff, percent = visual_comparison._get_difference(numpy.dstack([reference] * 3), actual, 0)
+    assert abs(percent - (100 - structural_similarity(reference, actual[:, :, 0]) * 100)) < 1e-7
+
+
+def test_prefilter_clears_diff_regions(reference):
+    actual = numpy.dstack([change(reference, (100, 100, 105, 103))] * 3)
+    visual_comparison = VisualComparison.__new__(VisualComparison)
+    visual_comparison.ignore_mask = None
+
+    visual_comparison._get_difference(numpy.dstack([reference] * 3), actual, 0)
+    assert visual_comparison.diff_regions
+
+    visual_comparison._get_difference(numpy.dstack([reference] * 3), actual, 0.1)
+    assert visual_comparison.diff_regions == []
+
+
+def test_prefilter_diff_matches_full(reference, monkeypatch):
+    actual = numpy.dstack([change(reference, (60, 300, 70, 330), (90, 310, 120, 320))] * 3)
+    visual_comparison = VisualComparison.__new__(VisualComparison)
+    visual_comparison.ignore_mask = None
+
+    diff, percent = visual_comparison._get_difference(numpy.dstack([reference] * 3), actual, 0)
+    regions = visual_comparison.diff_regions
+    monkeypatch.setattr(visual_comparison, 'ssim_prefilter', False)
+    full_diff, full_percent = visual_comparison._get_difference(numpy.dstack([reference] * 3), actual, 0)
+
+    assert abs(percent - full_percent) < 1e-7
+    assert visual_comparison.diff_regions == regions
+    assert (diff == full_diff).all()
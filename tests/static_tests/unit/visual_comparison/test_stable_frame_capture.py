@@ -0,0 +1,53 @@
+import itertools
+import time
+from unittest.mock import MagicMock
+
+import numpy
+import pytest
+from PIL import Image
+
+from mops.visual_comparison import VisualComparison
+
+
+def get_frame(value):
+    return Image.fromarray(numpy.full((20, 30, 3), value, dtype=numpy.uint8))
+
+
+@pytest.fixture
+def visual_comparison(visual_settings):
+    visual_settings.stable_frame_capture = True
+    return VisualComparison(MagicMock(is_playwright=False), MagicMock())
+
+
+def test_stable_frame_capture_returns_first_stable_frame(visual_comparison):
+    frames = [get_frame(0), get_frame(1), get_frame(2), get_frame(2), get_frame(3)]
+    visual_comparison.element_wrapper.screenshot_image.side_effect = frames
+
+    start_time = time.time()
+    image = visual_comparison._take_screenshot(delay=5, remove=[], fill_background=False, cut_box=None)
+
+    assert time.time() - start_time < 1
+    assert image is frames[3]
+    assert visual_comparison.stable_frames == 4
+    assert visual_comparison.stabilization_time < 1
+
+
+def test_stable_frame_capture_limited_by_delay(visual_comparison):
+    frames = (get_frame(value % 256) for value in itertools.count())
+    visual_comparison.element_wrapper.screenshot_image.side_effect = frames
+
+    visual_comparison._take_screenshot(delay=0.2, remove=[], fill_background=False, cut_box=None)
+
+    assert 0.2 <= visual_comparison.stabilization_time < 0.5
+    assert visual_comparison.stable_frames > 2
+
+
+def test_stable_frame_capture_count(visual_comparison):
+    VisualComparison.stable_frames_count = 3
+    frames = [get_frame(0), get_frame(0), get_frame(1), get_frame(1), get_frame(1)]
+    visual_comparison.element_wrapper.screenshot_image.side_effect = frames
+
+    image = visual_comparison._take_screenshot(delay=5, remove=[], fill_background=False, cut_box=None)
+
+    assert image is frames[4]
+    assert visual_comparison.stable_frames == 5
@@ -0,0 +1,75 @@
+import time
+from unittest.mock import MagicMock
+
+import numpy
+import pytest
+from PIL import Image
+
+from mops.exceptions import TimeoutException
+from mops.js_scripts import add_visual_mask_js, delete_visual_mask_js
+from mops.visual_comparison import VisualComparison
+
+
+@pytest.fixture
+def visual_comparison(visual_settings):
+    visual_comparison = VisualComparison(MagicMock(is_playwright=False), MagicMock())
+    visual_comparison.element_wrapper.screenshot_image.return_value = Image.fromarray(
+        numpy.zeros((20, 30, 3), dtype=numpy.uint8)
+    )
+    return visual_comparison
+
+
+def test_mask_applied_within_single_script(visual_comparison):
+    execute_async_script = visual_comparison.driver_wrapper.execute_async_script
+    execute_async_script.return_value = []
+    remove = [MagicMock(), MagicMock()]
+
+    start_time = time.time()
+    visual_comparison._take_screenshot(delay=0, remove=remove, fill_background='red', cut_box=None)
+
+    assert time.time() - start_time < 0.1
+    fill_element = visual_comparison.element_wrapper.wait_visibility.return_value
+    assert [call.args for call in execute_async_script.call_args_list] == [
+        (add_visual_mask_js, remove, fill_element, 'red'),
+        (delete_visual_mask_js, ),
+    ]
+    for element in remove:
+        element.wait_visibility.assert_not_called()
+
+
+def test_mask_removal_skipped_for_background_only(visual_comparison):
+    execute_async_script = visual_comparison.driver_wrapper.execute_async_script
+    execute_async_script.return_value = []
+
+    visual_comparison._take_screenshot(delay=0, remove=[], fill_background=True, cut_box=None)
+
+    fill_element = visual_comparison.element_wrapper.wait_visibility.return_value
+    execute_async_script.assert_called_once_with(add_visual_mask_js, [], fill_element, 'black')
+
+
+def test_mask_not_applied_without_remove_and_background(visual_comparison):
+    visual_comparison._take_screenshot(delay=0, remove=[], fill_background=False, cut_box=None)
+
+    visual_comparison.driver_wrapper.execute_async_script.assert_not_called()
+
+
+def test_mask_waits_hidden_elements(visual_comparison):
+    execute_async_script = visual_comparison.driver_wrapper.execute_async_script
+    execute_async_script.side_effect = [[1], [], True]
+    remove = [MagicMock(), MagicMock()]
+
+    visual_comparison._take_screenshot(delay=0, remove=remove, fill_background=False, cut_box=None)
+
+    remove[0].wait_visibility.assert_not_called()
+    remove[1].wait_visibility.assert_called_once_with(silent=True)
+    assert execute_async_script.call_args_list[1].args == (add_visual_mask_js, [remove[1]], None, None)
+
+
+def test_mask_hidden_element_timeout(visual_comparison):
+    visual_comparison.driver_wrapper.execute_async_script.return_value = [0]
+    element = MagicMock()
+    element.name = 'banner'
+    element.wait_visibility.side_effect = TimeoutException('Timed out')
+
+    with pytest.raises(TimeoutException, match='Cannot find banner while removing background'):
+        visual_comparison._take_screenshot(delay=0, remove=[element], fill_background=False, cut_box=None)